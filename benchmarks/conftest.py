@@ -0,0 +1,32 @@
+from typing import Callable
+
+import pytest
+
+from mcpq import Minecraft
+from mcpq.testing import FakeServer
+
+
+@pytest.fixture
+def fake():
+    with FakeServer(workers=128) as server:
+        yield server
+
+
+@pytest.fixture
+def mc(fake):
+    mc = Minecraft("localhost", fake.port)
+    yield mc
+    mc._cleanup()
+
+
+@pytest.fixture
+def record_rate(benchmark) -> Callable[[str, float], None]:
+    """Records `count` divided by the mean duration of a round as `name` in the extra info of the benchmark,
+    e.g., ``record_rate("blocks_per_sec", 1000)``. Does nothing with ``--benchmark-disable``, as there are no timings then.
+    """
+
+    def record(name: str, count: float) -> None:
+        if benchmark.stats is not None:
+            benchmark.extra_info[name] = count / benchmark.stats.stats.mean
+
+    return record
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from mcpq._util import ThreadSafeSingeltonCache
+
+KEYS = 256  # number of distinct keys in the cache
+LOOKUPS = 2000  # number of lookups per thread and round
+
+
+@pytest.mark.parametrize("threads", [1, 8, 16, 32])
+def test_cache_contention(benchmark, threads, record_rate):
+    cache = ThreadSafeSingeltonCache(lambda key: object())
+    for key in range(KEYS):
+        cache.get_or_create(key)
+
+    def lookup():
+        for i in range(LOOKUPS):
+            cache.get_or_create(i % KEYS)
+
+    def run():
+        workers = [threading.Thread(target=lookup) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+    record_rate("lookups_per_sec", threads * LOOKUPS)
+
+
+def test_cache_create(benchmark):
+    keys = iter(range(10**9))
+    cache = ThreadSafeSingeltonCache(lambda key: object())
+    benchmark(lambda: cache.get_or_create(next(keys)))
+
+
+@pytest.mark.parametrize("threads", [8, 32])
+def test_cache_contention_with_creation(benchmark, threads, record_rate):
+    # every thread mostly hits existing keys, but also creates new ones, as when new entities appear in events
+    keys = iter(range(KEYS, 10**9))
+    cache = ThreadSafeSingeltonCache(lambda key: object())
+    for key in range(KEYS):
+        cache.get_or_create(key)
+
+    def lookup():
+        for i in range(LOOKUPS):
+            cache.get_or_create(next(keys) if i % 64 == 0 else i % KEYS)
+
+    def run():
+        workers = [threading.Thread(target=lookup) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+    record_rate("lookups_per_sec", threads * LOOKUPS)
@@ -0,0 +1,46 @@
+import pytest
+
+from mcpq import Minecraft, Vec3
+from mcpq.testing import FakeServer
+
+THREADS = 32  # number of threads calling at the same time
+CALLS = 50  # number of calls per thread and round
+CUBE = 8  # edge length of the cubes written by the bulk writers
+
+
+@pytest.fixture(params=[0.0, 0.002], ids=["no-latency", "2ms-latency"])
+def server(request):
+    with FakeServer(latency=request.param, workers=128) as server:
+        yield server
+
+
+@pytest.mark.parametrize("selection", ["round_robin", "least_loaded"])
+@pytest.mark.parametrize("channels", [1, 2, 4, 8])
+def test_parallel_reads(benchmark, server, channels, selection, record_rate, run_threads):
+    if channels == 1 and selection == "least_loaded":
+        pytest.skip("a single channel has no pool")
+    mc = Minecraft("localhost", server.port, channels=channels, channel_selection=selection)
+
+    def reader(i: int) -> None:
+        for j in range(CALLS):
+            mc.getBlock(Vec3(i, 0, j))
+
+    run_threads(THREADS, reader)  # connect all channels
+    benchmark.pedantic(run_threads, args=(THREADS, reader), rounds=3)
+    record_rate("calls_per_sec", THREADS * CALLS)
+    mc._cleanup()
+
+
+@pytest.mark.parametrize("channels", [1, 2, 4, 8])
+def test_parallel_bulk_writes(benchmark, server, channels, record_rate, run_threads):
+    mc = Minecraft("localhost", server.port, channels=channels)
+
+    def writer(i: int) -> None:
+        for j in range(CALLS // 10):
+            start = Vec3(i * CUBE, 0, j * CUBE)
+            mc.setBlockCube("stone", start, start + CUBE - 1)
+
+    run_threads(THREADS, writer)
+    benchmark.pedantic(run_threads, args=(THREADS, writer), rounds=3)
+    record_rate("calls_per_sec", THREADS * (CALLS // 10))
+    mc._cleanup()
@@ -0,0 +1,40 @@
+import pytest
+
+from mcpq import Minecraft
+from mcpq.testing import FakeServer
+
+COMMANDS = [f"say {i}" for i in range(500)]
+
+
+@pytest.fixture
+def mc():
+    with FakeServer(latency=0.001, workers=128) as server:
+        mc = Minecraft("localhost", server.port)
+        yield mc
+        mc._cleanup()
+
+
+def test_commands_loop(benchmark, mc):
+    def run():
+        for command in COMMANDS:
+            mc.runCommand(command)
+
+    benchmark.pedantic(run, rounds=3)
+
+
+@pytest.mark.parametrize("blocking", [False, True])
+def test_commands_pipelined(benchmark, mc, blocking):
+    benchmark.pedantic(mc.runCommands, args=(COMMANDS, blocking, False), rounds=3)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_commands_sink(benchmark, mc, ordered):
+    sink = mc.commandSink(ordered=ordered)
+
+    def run():
+        for command in COMMANDS:
+            sink.run(command)
+        sink.flush()
+
+    benchmark.pedantic(run, rounds=3)
+    sink.close()
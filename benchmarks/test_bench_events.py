@@ -0,0 +1,158 @@
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from mcpq import Minecraft
+from mcpq._proto import minecraft_pb2 as pb
+from mcpq.testing import EventRecorder, EventReplayer
+
+EVENTS = 2000  # number of events per round in throughput benchmark
+CONNECTIONS = 8  # number of connections in memory benchmark
+EVENT_TYPES = [
+    pb.EVENT_PLAYER_JOIN,
+    pb.EVENT_PLAYER_LEAVE,
+    pb.EVENT_PLAYER_DEATH,
+    pb.EVENT_CHAT_MESSAGE,
+    pb.EVENT_BLOCK_HIT,
+    pb.EVENT_PROJECTILE_HIT,
+]
+
+
+def chat(message: str) -> pb.Event:
+    return pb.Event(
+        type=pb.EVENT_CHAT_MESSAGE,
+        playerMsg=pb.Event.PlayerAndMessage(trigger=pb.Player(name="bench"), message=message),
+    )
+
+
+def wait_for(condition, timeout: float = 10.0) -> None:
+    end = time.time() + timeout
+    while not condition():
+        assert time.time() < end, "Condition not met in time"
+        time.sleep(0.0005)
+
+
+def subscribe_all(mc: Minecraft) -> None:
+    for handler in (
+        mc.events.player_join,
+        mc.events.player_leave,
+        mc.events.player_death,
+        mc.events.chat,
+        mc.events.block_hit,
+        mc.events.projectile_hit,
+    ):
+        handler.poll()
+
+
+@pytest.mark.parametrize("multiplex", [False, True], ids=["per-type", "multiplexed"])
+def test_event_throughput(benchmark, fake, multiplex, record_rate):
+    mc = Minecraft("localhost", fake.port, multiplex_events=multiplex)
+    subscribe_all(mc)  # other subscribed event types compete for the receiving thread(s)
+    counter = [0]
+    mc.events.chat.register(lambda e: counter.__setitem__(0, counter[0] + 1))
+    for event_type in EVENT_TYPES:
+        wait_for(lambda: fake.subscribers(event_type) == 1)
+    events = [chat(str(i)) for i in range(EVENTS)]
+
+    def run():
+        counter[0] = 0
+        for event in events:
+            fake.publish(event)
+        wait_for(lambda: counter[0] == EVENTS)
+
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+    record_rate("events_per_sec", EVENTS)
+    mc._cleanup()
+
+
+@pytest.mark.parametrize("multiplex", [False, True], ids=["per-type", "multiplexed"])
+def test_memory_per_connection(benchmark, fake, multiplex):
+    connections: list[Minecraft] = []
+
+    def connect():
+        mc = Minecraft("localhost", fake.port, multiplex_events=multiplex)
+        subscribe_all(mc)
+        connections.append(mc)
+
+    threads_before = threading.active_count()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    benchmark.pedantic(connect, rounds=CONNECTIONS)
+    # only a single round runs with --benchmark-disable
+    wait_for(lambda: fake.subscribers(pb.EVENT_CHAT_MESSAGE) == len(connections))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    memory = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    benchmark.extra_info["bytes_per_connection"] = memory / len(connections)
+    benchmark.extra_info["threads_per_connection"] = (
+        threading.active_count() - threads_before
+    ) / len(connections)
+    for mc in connections:
+        mc._cleanup()
+
+
+@pytest.mark.parametrize("multiplex", [False, True], ids=["per-type", "multiplexed"])
+def test_event_latency(benchmark, fake, multiplex, record_rate):
+    mc = Minecraft("localhost", fake.port, multiplex_events=multiplex)
+    mc.events.chat.poll()
+    wait_for(lambda: fake.subscribers(pb.EVENT_CHAT_MESSAGE) == 1)
+    event = chat("ping")
+
+    def roundtrip():  # time from sending an event on the server until a blocked get returns it
+        fake.publish(event)
+        assert mc.events.chat.get(timeout=5) is not None
+
+    benchmark.pedantic(roundtrip, rounds=200, warmup_rounds=10)
+    record_rate("roundtrips_per_sec", 1)
+    mc._cleanup()
+
+
+def test_get_many_throughput(benchmark, fake, record_rate):
+    mc = Minecraft("localhost", fake.port)
+    mc.events.chat.poll()
+    wait_for(lambda: fake.subscribers(pb.EVENT_CHAT_MESSAGE) == 1)
+    events = [chat(str(i)) for i in range(EVENTS)]
+
+    def run():
+        for event in events:
+            fake.publish(event)
+        received = 0
+        while received < EVENTS:
+            received += len(mc.events.chat.get_many(50, timeout=5))
+
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+    record_rate("events_per_sec", EVENTS)
+    mc._cleanup()
+
+
+@pytest.mark.parametrize("mode", ["inline", "thread"])
+def test_replay_callbacks(benchmark, tmp_path, mode, record_rate):
+    path = tmp_path / "bench.events"
+    recorder = EventRecorder(path)
+    for i in range(EVENTS):
+        recorder._write(chat(str(i)))
+    recorder.stop()
+    with EventReplayer(path) as replayer:
+        mc = Minecraft("localhost", replayer.port)
+        counter = [0]
+        lock = threading.Lock()
+
+        def callback(event):
+            with lock:
+                counter[0] += 1
+
+        mc.events.chat.dispatch(mode)
+        mc.events.chat.register(callback)
+        assert replayer.wait_for_subscribers(1)
+
+        def run():
+            counter[0] = 0
+            replayer.play(speed=None)
+            wait_for(lambda: counter[0] == EVENTS)
+
+        benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+        record_rate("events_per_sec", EVENTS)
+        benchmark.extra_info["callback_latency_avg"] = mc.events.chat.stats()["latency_avg"]
+        mc._cleanup()
@@ -0,0 +1,28 @@
+import pytest
+
+QUERIES = {
+    "solid-blocks": lambda blocks: blocks.block().solid(),
+    "wool-or-concrete": lambda blocks: blocks.block().contains("wool").or_.contains("concrete"),
+    "combined": lambda blocks: (blocks.endswith("wool") | blocks.endswith("carpet"))
+    & ~blocks.contains("red"),
+}
+
+
+@pytest.mark.parametrize("query", QUERIES.values(), ids=QUERIES.keys())
+def test_material_filter(benchmark, mc, query):
+    mc.blocks.get()  # materials are fetched once, only the filtering is measured
+    result = benchmark(lambda: query(mc.blocks).get())
+    assert result
+
+
+def test_material_filter_lookup(benchmark, mc):
+    solid = mc.blocks.block().solid()
+    solid.get()  # filtered materials are cached on the filter
+    assert benchmark(lambda: "stone" in solid)
+
+
+def test_material_filter_choice_loop(benchmark, mc):
+    # random block pickers rebuild the same filter and pick from it in tight loops
+    mc.blocks.get()
+    result = benchmark(lambda: [mc.blocks.solid().flammable(False).choice() for _ in range(100)])
+    assert len(result) == 100
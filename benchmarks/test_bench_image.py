@@ -0,0 +1,79 @@
+import pytest
+
+from mcpq import Vec3
+from mcpq.tools import BlockPalette, VideoWall, place_image
+
+np = pytest.importorskip("numpy")
+
+QUANTIZE_SIZE = 512  # edge length of the image in quantize benchmark
+WALL_SIZE = 128  # edge length of the image placed in place_image benchmark
+VIDEO_SIZE = (64, 36)  # (width, height) of the frames in video benchmarks
+VIDEO_FRAMES = 30  # number of frames played per round
+
+
+def gradient(size: int):
+    # smooth gradients with some noise, closer to photos than uniform noise
+    ys, xs = np.mgrid[0:size, 0:size] * (255 / size)
+    noise = np.random.default_rng(0).normal(0, 12, (size, size, 3))
+    image = np.stack((xs, ys, 255 - (xs + ys) / 2), axis=-1) + noise
+    return np.clip(image, 0, 255).astype(np.uint8)
+
+
+def test_palette_lut(benchmark):
+    benchmark.pedantic(lambda: BlockPalette("all").lut, rounds=3)
+    benchmark.extra_info["blocks"] = len(BlockPalette("all"))
+
+
+@pytest.mark.parametrize("dither", [False, True], ids=["lut", "dither"])
+def test_quantize(benchmark, dither, record_rate):
+    palette = BlockPalette("all")
+    palette.lut  # built once per palette
+    image = gradient(QUANTIZE_SIZE)
+
+    benchmark.pedantic(lambda: palette.quantize(image, dither), rounds=3)
+    record_rate("pixels_per_sec", QUANTIZE_SIZE**2)
+
+
+@pytest.mark.parametrize("dither", [False, True], ids=["lut", "dither"])
+def test_place_image(benchmark, fake, mc, dither, record_rate):
+    palette = BlockPalette("concrete")
+    image = gradient(WALL_SIZE)
+
+    benchmark.pedantic(lambda: place_image(mc, image, Vec3(), palette, dither=dither), rounds=3)
+    record_rate("blocks_per_sec", WALL_SIZE**2)
+    benchmark.extra_info["requests"] = fake.calls["setBlocks"] // 3
+    assert fake.block_count() == WALL_SIZE**2
+
+
+def animation(frames: int):
+    # a ball moving over a static background, like a typical animated display
+    width, height = VIDEO_SIZE
+    background = gradient(max(VIDEO_SIZE))[:height, :width]
+    ys, xs = np.mgrid[0:height, 0:width]
+    for i in range(frames):
+        frame = background.copy()
+        ball = (xs - i * width / frames) ** 2 + (ys - height / 2) ** 2 < 36
+        frame[ball] = (255, 0, 0)
+        yield frame
+
+
+@pytest.mark.parametrize("mode", ["full-frames", "diffed"])
+def test_video(benchmark, fake, mc, mode, record_rate):
+    palette = BlockPalette("concrete")
+    frames = list(animation(VIDEO_FRAMES))
+    if mode == "full-frames":
+        # re-sending every frame completely, as without VideoWall
+        run = lambda: [place_image(mc, frame, Vec3(), palette) for frame in frames]  # noqa: E731
+    else:
+        wall = VideoWall(mc, Vec3(), palette=palette)
+        wall.show(frames[-1])  # the wall already shows content
+        run = lambda: wall.play(frames, fps=1000)  # noqa: E731
+
+    result = benchmark.pedantic(run, rounds=3)
+    if mode == "diffed":
+        benchmark.extra_info["fps"] = result.fps
+        benchmark.extra_info["blocks_per_frame"] = result.blocks_per_frame
+        benchmark.extra_info["dropped"] = result.dropped
+    else:
+        record_rate("fps", VIDEO_FRAMES)
+        benchmark.extra_info["blocks_per_frame"] = VIDEO_SIZE[0] * VIDEO_SIZE[1]
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+import time
+
+
+def test_import_time(benchmark):
+    # every round imports in a fresh interpreter, the interpreter startup itself is reported separately
+    def run(code: str) -> None:
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    benchmark.pedantic(run, args=("import mcpq",), rounds=5, warmup_rounds=1)
+    startup = min(_timed(run, "pass") for _ in range(5))
+    benchmark.extra_info["interpreter_startup"] = startup
+    if benchmark.stats is not None:  # None with --benchmark-disable
+        benchmark.extra_info["import_only"] = benchmark.stats.stats.min - startup
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
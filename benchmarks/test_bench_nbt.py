@@ -0,0 +1,65 @@
+import pytest
+
+from mcpq import Vec3
+from mcpq.nbt import NBT
+
+# representative entity nbt as returned by the server
+ENTITY_SNBT = (
+    '{Air:300s,Attributes:[{Base:0.25d,Name:"minecraft:movement_speed"},'
+    '{Base:10.0d,Name:"minecraft:max_health"}],Brain:{memories:{}},DeathTime:0s,'
+    "FallDistance:0.0f,Fire:-1s,Health:10.0f,HurtTime:0s,Invulnerable:0b,"
+    "Motion:[0.0d,-0.0784000015258789d,0.0d],OnGround:1b,PortalCooldown:0,"
+    "Pos:[12.5d,64.0d,-3.5d],Rotation:[90.0f,0.0f],"
+    "UUID:[I;-1195839413,-1218886357,-1544578812,1196431174],"
+    'CustomName:\'{"text":"Bessie","color":"gold"}\','
+    'ArmorItems:[{},{},{},{count:1,id:"minecraft:diamond_helmet",'
+    'components:{"minecraft:damage":3}}],'
+    "Inventory:["
+    + ",".join(f'{{Slot:{i}b,count:64,id:"minecraft:stone"}}' for i in range(27))
+    + "]}"
+)
+
+
+def test_nbt_parse(benchmark, record_rate):
+    nbt = benchmark(NBT.parse, ENTITY_SNBT)
+    record_rate("chars_per_sec", len(ENTITY_SNBT))
+    assert nbt["Health"] == 10.0
+
+
+def test_nbt_serialize(benchmark):
+    nbt = NBT.parse(ENTITY_SNBT)
+    snbt = benchmark(str, nbt)
+    assert NBT.parse(snbt) == nbt
+
+
+CHESTS = 100  # number of chests scanned per round
+CHEST_ITEMS = (
+    "[" + ",".join(f'{{Slot:{i}b,count:64,id:"minecraft:stone"}}' for i in range(27)) + "]"
+)
+
+
+def chest_output(command: str) -> str:
+    # "data get block x y z [path]" of a full chest, the path is only supported for Items[0]
+    prefix = "0, 0, 0 has the following block data: "
+    if command.endswith("Items[0].count"):
+        return prefix + "64"
+    return prefix + f'{{Items:{CHEST_ITEMS},id:"minecraft:chest",Lock:""}}'
+
+
+@pytest.fixture
+def chests(fake, mc):
+    fake.latency = 0.001
+    fake.command_output = chest_output
+    return [Vec3(x, 0, 0) for x in range(CHESTS)]
+
+
+def test_nbt_chest_scan_loop(benchmark, mc, chests):
+    def scan():
+        return [mc.getNbt(pos) for pos in chests]
+
+    assert len(benchmark.pedantic(scan, rounds=3)) == CHESTS
+
+
+@pytest.mark.parametrize("path", [None, "Items[0].count"])
+def test_nbt_chest_scan_many(benchmark, mc, chests, path):
+    assert len(benchmark.pedantic(mc.getNbtMany, args=(chests, path), rounds=3)) == CHESTS
@@ -0,0 +1,85 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from mcpq import Vec3
+from mcpq._proto import minecraft_pb2 as pb
+
+# Meant to be compared between a regular and a free-threaded build (e.g. python3.13t),
+# only without the GIL can the work of the threads actually run on multiple cores at once.
+# The fake server runs in the same process, so part of the work measured is its own.
+WORK = 64  # units of work per thread and round
+BLOCKS = 256  # blocks per setBlockList call
+THREADS = [1, 2, 4, 8]
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def record(benchmark, record_rate, threads: int) -> None:
+    benchmark.extra_info["gil_enabled"] = gil_enabled()
+    record_rate("work_per_sec", threads * WORK)
+
+
+@pytest.mark.parametrize("threads", THREADS)
+def test_scaling_set_block_list(benchmark, fake, mc, threads, record_rate, run_threads):
+    blocktypes = iter(["stone", "dirt"] * 1000)
+
+    def build(i):
+        positions = [Vec3(x, y, i) for x in range(16) for y in range(BLOCKS // 16)]
+        blocktype = next(blocktypes)
+        for _ in range(WORK):
+            mc.setBlockList(blocktype, positions)
+
+    benchmark.pedantic(run_threads, args=(threads, build), rounds=3)
+    record(benchmark, record_rate, threads)
+
+
+@pytest.mark.parametrize("threads", THREADS)
+def test_scaling_get_entities(benchmark, fake, mc, threads, record_rate, run_threads):
+    for x in range(50):
+        fake.add_entity("sheep", Vec3(x, 0, 0))
+
+    def scan(i):
+        for _ in range(WORK):
+            assert len(mc.getEntities()) == 50
+
+    benchmark.pedantic(run_threads, args=(threads, scan), rounds=3)
+    record(benchmark, record_rate, threads)
+
+
+@pytest.mark.parametrize("threads", THREADS)
+def test_scaling_event_handling(benchmark, fake, mc, threads, record_rate):
+    # callbacks run on `threads` worker threads, each event builds its player and does some work
+    handled = [0]
+    lock = threading.Lock()
+
+    def on_chat(event):
+        sum(Vec3(i, i, i).length() for i in range(200))
+        with lock:
+            handled[0] += 1
+
+    mc.events.chat.dispatch("thread", workers=threads)
+    mc.events.chat.register(on_chat)
+    fake.wait_for_subscribers(event_type=pb.EVENT_CHAT_MESSAGE)
+    events = [
+        pb.Event(
+            type=pb.EVENT_CHAT_MESSAGE,
+            playerMsg=pb.Event.PlayerAndMessage(trigger=pb.Player(name=f"p{i % 8}"), message="m"),
+        )
+        for i in range(threads * WORK)
+    ]
+
+    def run():
+        handled[0] = 0
+        for event in events:
+            fake.publish(event)
+        while handled[0] < len(events):
+            time.sleep(0.0005)
+
+    benchmark.pedantic(run, rounds=3)
+    record(benchmark, record_rate, threads)
@@ -0,0 +1,28 @@
+import pytest
+
+from mcpq import Minecraft
+
+
+@pytest.mark.parametrize("cache", ["none", "cold", "warm"])
+def test_startup(benchmark, fake, tmp_path, cache):
+    # a short-lived worker: connect, then pick a block and look up a world
+    fake.latency = 0.005
+    if cache == "warm":
+        Minecraft("localhost", fake.port, metadata_cache=tmp_path)._cleanup()
+
+    def start(round_dir) -> None:
+        mc = Minecraft("localhost", fake.port, metadata_cache=round_dir)
+        mc.blocks.contains("wool").choice()
+        mc.spawnables.first()
+        mc.getWorldByKey("overworld")
+        mc._cleanup()
+
+    dirs = iter(tmp_path / str(i) for i in range(100))
+
+    def setup() -> tuple:
+        if cache == "cold":
+            return (next(dirs),), {}  # a fresh directory every round
+        return (tmp_path if cache == "warm" else False,), {}
+
+    benchmark.pedantic(start, setup=setup, rounds=5)
+    benchmark.extra_info["server_calls"] = sum(fake.calls.values())
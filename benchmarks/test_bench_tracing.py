@@ -0,0 +1,26 @@
+import pytest
+
+from mcpq import NBT, tracing
+
+SNBT = "{" + ",".join(f"key{i}:{i}" for i in range(20)) + "}"
+
+
+@pytest.fixture(params=["disabled", "recording"])
+def tracer(request):
+    tracing.set_tracer(
+        tracing.RecordingTracer(max_spans=1000) if request.param != "disabled" else None
+    )
+    yield request.param
+    tracing.set_tracer(None)
+
+
+def test_traced_call_overhead(benchmark, tracer):
+    @tracing.traced()
+    def noop():
+        pass
+
+    benchmark(noop)
+
+
+def test_traced_nbt_parse(benchmark, tracer):
+    benchmark(NBT.parse, SNBT)
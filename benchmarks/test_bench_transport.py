@@ -0,0 +1,48 @@
+import pytest
+
+from mcpq import Minecraft, Vec3
+from mcpq.testing import FakeServer
+
+SIDE = 64  # edge length of the square of blocks written by setBlockList
+READS = 200  # number of getBlock calls per round
+
+
+@pytest.fixture
+def server(tmp_path):
+    with FakeServer(workers=128, unix_socket=str(tmp_path / "mcpq.sock")) as server:
+        yield server
+
+
+def connect(server: FakeServer, transport: str, **kwargs) -> Minecraft:
+    if transport == "uds":
+        return Minecraft(server.unix_target, **kwargs)
+    return Minecraft("localhost", server.port, **kwargs)
+
+
+@pytest.mark.parametrize("transport", ["tcp", "uds"])
+def test_transport_small_calls(benchmark, server, transport, record_rate):
+    mc = connect(server, transport)
+    mc.getBlock(Vec3())  # connect
+
+    def read():
+        for i in range(READS):
+            mc.getBlock(Vec3(i, 0, 0))
+
+    benchmark(read)
+    record_rate("calls_per_sec", READS)
+    mc._cleanup()
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+@pytest.mark.parametrize("transport", ["tcp", "uds"])
+def test_transport_bulk_writes(benchmark, server, transport, compression, record_rate):
+    mc = connect(server, transport, compression=compression, instrument=True)
+    positions = [Vec3(x, 0, z) for x in range(SIDE) for z in range(SIDE)]
+    mc.getBlock(Vec3())  # connect
+
+    benchmark(mc.setBlockList, "stone", positions)
+    stats = mc.stats()["setBlocks"]
+    record_rate("blocks_per_sec", len(positions))
+    # uncompressed size of the requests, compression only shrinks them on the wire
+    benchmark.extra_info["request_bytes"] = stats["request_bytes"] // stats["calls"]
+    mc._cleanup()
@@ -0,0 +1,25 @@
+import pytest
+
+from mcpq import Vec3
+from mcpq.tools import Turtle
+
+STEPS = 40  # length of each line of the star
+LINES = 18  # number of lines of the star
+
+
+@pytest.mark.parametrize("mode", ["live", "compile", "animated"])
+def test_turtle_star(benchmark, fake, mc, mode, record_rate):
+    def run():
+        t = Turtle(mc, Vec3(0, 0, 0)).speed(0).pensize(3)
+        if mode == "compile":
+            t.start_compile_mode()
+        elif mode == "animated":
+            t.start_animated_mode()
+        for _ in range(LINES):
+            t.fd(STEPS).rt(160)
+        t.stop_compile_mode().stop_animated_mode()
+
+    fake.calls.clear()
+    benchmark.pedantic(run, rounds=3)
+    benchmark.extra_info["requests"] = sum(fake.calls.values()) // 3
+    record_rate("steps_per_sec", STEPS * LINES)
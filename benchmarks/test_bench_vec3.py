@@ -0,0 +1,84 @@
+from mcpq import BlockPos, Vec3
+
+VECTORS = 1000  # number of vectors per round
+
+
+def test_vec3_arithmetic(benchmark, record_rate):
+    vectors = [Vec3(i, i * 0.5, -i) for i in range(VECTORS)]
+    offset = Vec3(1, 2, 3)
+
+    def run():
+        total = Vec3()
+        for v in vectors:
+            total = total + (v - offset) * 2
+        return total
+
+    result = benchmark(run)
+    record_rate("ops_per_sec", 3 * VECTORS)
+    assert isinstance(result, Vec3)
+
+
+def test_vec3_floor_and_neighbors(benchmark, record_rate):
+    vectors = [Vec3(i, i * 0.5, -i) for i in range(VECTORS)]
+
+    def run():
+        return [v.floor().up().east() for v in vectors]
+
+    benchmark(run)
+    record_rate("ops_per_sec", 3 * VECTORS)
+
+
+def test_vec3_distance_and_hash(benchmark):
+    vectors = [Vec3(i, 0, i) for i in range(VECTORS)]
+    origin = Vec3()
+
+    def run():
+        return len({v for v in vectors if v.distance(origin) < 2 * VECTORS})
+
+    assert benchmark(run) == VECTORS
+
+
+def test_vec3_integral_floor_and_hash(benchmark, record_rate):
+    # block positions that are Vec3 with integer coordinates already, as passed to the block functions
+    vectors = [Vec3(i, i % 64, -i) for i in range(VECTORS)]
+
+    def run():
+        return len({v.floor() for v in vectors})
+
+    assert benchmark(run) == VECTORS
+    record_rate("ops_per_sec", 2 * VECTORS)
+
+
+def test_blockpos_arithmetic(benchmark, record_rate):
+    positions = [BlockPos(i, i % 64, -i) for i in range(VECTORS)]
+    offset = BlockPos(1, 2, 3)
+
+    def run():
+        total = BlockPos()
+        for pos in positions:
+            total = total + (pos - offset) * 2
+        return total
+
+    result = benchmark(run)
+    record_rate("ops_per_sec", 3 * VECTORS)
+    assert isinstance(result, BlockPos)
+
+
+def test_blockpos_floor_and_neighbors(benchmark, record_rate):
+    positions = [BlockPos(i, i % 64, -i) for i in range(VECTORS)]
+
+    def run():
+        return [pos.floor().up().east() for pos in positions]
+
+    benchmark(run)
+    record_rate("ops_per_sec", 3 * VECTORS)
+
+
+def test_blockpos_unpack_and_hash(benchmark, record_rate):
+    positions = [BlockPos(i, 0, i) for i in range(VECTORS)]
+
+    def run():
+        return len({pos for pos in positions if sum(pos) >= 0})
+
+    assert benchmark(run) == VECTORS
+    record_rate("ops_per_sec", 2 * VECTORS)
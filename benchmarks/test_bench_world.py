@@ -0,0 +1,106 @@
+import pytest
+
+from mcpq import Vec3
+
+BLOCKS = 4096  # number of positions per setBlockList call
+CUBE = 16  # edge length of the cube in setBlockCube benchmark
+COPY_CUBE = 6  # edge length of the cube copied and pasted in round trip benchmark
+HEIGHTMAP = 32  # edge length of the area in heightmap benchmark
+
+
+def test_set_block_list(benchmark, fake, mc, record_rate):
+    positions = [Vec3(x, y, 0) for x in range(64) for y in range(BLOCKS // 64)]
+    blocktypes = iter(["stone", "dirt"] * 1000)  # alternate so every call changes blocks
+
+    benchmark.pedantic(lambda: mc.setBlockList(next(blocktypes), positions), rounds=10)
+    record_rate("blocks_per_sec", BLOCKS)
+    assert fake.block_count() == BLOCKS
+
+
+def test_set_block_cube(benchmark, fake, mc, record_rate):
+    blocktypes = iter(["stone", "dirt"] * 1000)
+    pos1, pos2 = Vec3(0, 0, 0), Vec3(CUBE - 1, CUBE - 1, CUBE - 1)
+
+    benchmark.pedantic(lambda: mc.setBlockCube(next(blocktypes), pos1, pos2), rounds=10)
+    record_rate("blocks_per_sec", CUBE**3)
+    assert fake.block_count() == CUBE**3
+
+
+@pytest.mark.parametrize("withData", [False, True], ids=["types", "with-data"])
+def test_copy_paste_round_trip(benchmark, fake, mc, withData, record_rate):
+    end = Vec3(COPY_CUBE - 1, COPY_CUBE - 1, COPY_CUBE - 1)
+    mc.setBlockCube("stone", Vec3(), end)
+    mc.setBlockCube("air", Vec3(1, 1, 1), end - 1)
+    target = Vec3(100, 0, 0)
+
+    def run():
+        blocks = mc.copyBlockCube(Vec3(), end, withData)
+        mc.pasteBlockCube(blocks, target)
+
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+    record_rate("blocks_per_sec", COPY_CUBE**3)
+    assert fake.get_block(target) == "stone"
+
+
+@pytest.mark.parametrize("entities", [10, 100, 1000])
+def test_get_entities_around(benchmark, fake, mc, entities, record_rate):
+    for i in range(entities):
+        fake.add_entity("cow", Vec3(i % 32, 0, i // 32))
+    origin = Vec3(0, 0, 0)
+
+    result = benchmark(mc.getEntitiesAround, origin, 16)
+    record_rate("entities_per_sec", entities)
+    assert 0 < len(result) <= entities
+
+
+@pytest.mark.parametrize("latency", [0.0, 0.02], ids=["idle", "loaded"])
+def test_set_block_list_adaptive(benchmark, fake, mc, latency, record_rate):
+    # large lists are split into chunks sized by the adaptive batcher
+    positions = [Vec3(x, y, z) for x in range(64) for y in range(16) for z in range(64)]
+    fake.method_latency["setBlocks"] = latency
+    blocktypes = iter(["stone", "dirt"] * 1000)
+
+    benchmark.pedantic(lambda: mc.setBlockList(next(blocktypes), positions), rounds=5)
+    record_rate("blocks_per_sec", len(positions))
+    benchmark.extra_info.update(mc._server.block_batcher().stats())
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+def test_flood_fill_scan(benchmark, fake, mc, cached):
+    # visits a 6x6x6 pocket of air enclosed in stone, reading every block and its neighbors
+    fake.latency = 0.0005
+    mc.setBlockCube("stone", Vec3(0, 0, 0), Vec3(COPY_CUBE + 1, COPY_CUBE + 1, COPY_CUBE + 1))
+    mc.setBlockCube("air", Vec3(1, 1, 1), Vec3(COPY_CUBE, COPY_CUBE, COPY_CUBE))
+    if cached:
+        mc.enableChunkCache()
+        mc.getBlock(Vec3(1, 1, 1))  # warm
+
+    def fill() -> int:
+        start = Vec3(1, 1, 1)
+        stack, seen = [start], {start}
+        while stack:
+            pos = stack.pop()
+            for n in (pos.east(), pos.west(), pos.up(), pos.down(), pos.north(), pos.south()):
+                if n not in seen and mc.getBlock(n) == "air":
+                    seen.add(n)
+                    stack.append(n)
+        return len(seen)
+
+    assert benchmark.pedantic(fill, rounds=3) == COPY_CUBE**3
+
+
+@pytest.mark.parametrize("method", ["loop", "heightmap"])
+def test_heightmap(benchmark, fake, mc, method, record_rate):
+    fake.latency = 0.0005
+    for x in range(HEIGHTMAP):
+        fake.set_block("stone", Vec3(x, x % 7, 0))
+
+    def loop() -> list[list[int]]:
+        return [[mc.getHeight(x, z) for z in range(HEIGHTMAP)] for x in range(HEIGHTMAP)]
+
+    def heightmap() -> list[list[int]]:
+        return mc.getHeightmap(0, 0, HEIGHTMAP - 1, HEIGHTMAP - 1).tolist()
+
+    heights = benchmark.pedantic(loop if method == "loop" else heightmap, rounds=3)
+    assert heights[6][0] == 6
+    record_rate("columns_per_sec", HEIGHTMAP**2)
@@ -0,0 +1,27 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import pytest
+
+# fixtures shared by the tests and the benchmarks
+
+
+@pytest.fixture
+def run_threads() -> Callable[[int, Callable[[int], Any]], None]:
+    """Runs ``target(i)`` for every ``i`` in ``range(threads)`` on `threads` threads that start at the same time,
+    for the most contention, and raises the first error of a thread, if any.
+    """
+
+    def run(threads: int, target: Callable[[int], Any]) -> None:
+        barrier = threading.Barrier(threads)
+
+        def start(i: int) -> Any:
+            barrier.wait()
+            return target(i)
+
+        with ThreadPoolExecutor(threads) as executor:
+            for future in [executor.submit(start, i) for i in range(threads)]:
+                future.result()
+
+    return run
@@ -21,7 +21,8 @@ except _metalib.PackageNotFoundError:
     __version__ = "0.0.0"
 
 
-from . import colors, text
+from . import colors, text, tracing
+from ._callpolicy import RetryPolicy
 from .constants import DOWN, EAST, NORD, NORTH, OBEN, OST, SOUTH, SÜD, UNTEN, UP, WEST
 from .entity import Entity
 from .events import (
@@ -49,19 +50,23 @@ from .exception import (
 from .minecraft import Minecraft
 from .nbt import NBT, Block, EntityType
 from .player import Player
-from .vec3 import Vec3
+from .vec3 import BlockPos, Vec3
 from .world import World
 
 __all__ = [
     # main types
     "Minecraft",
     "Vec3",
+    "BlockPos",
     "NBT",
     "Block",
     "EntityType",
+    "RetryPolicy",
     # colors and text effects
     "colors",
     "text",
+    # profiling
+    "tracing",
     # annotation types (for function signatures)
     "World",
     "Player",
@@ -9,6 +9,8 @@ from ._proto import minecraft_pb2 as pb
 from .exception import raise_on_error
 
 if TYPE_CHECKING:
+    from ._batching import _AdaptiveBatcher
+    from ._filterindex import _FilterIndex
     from ._proto import MinecraftStub
     from ._util import ThreadSafeSingeltonCache
     from .entity import Entity
@@ -26,6 +28,15 @@ class _ServerInterface(ABC):
     def stub(self) -> MinecraftStub:
         raise NotImplementedError
 
+    @property
+    def event_stub(self) -> MinecraftStub:
+        # event streams are long lived and always stay on the same channel
+        return self.stub
+
+    @abstractmethod
+    def block_batcher(self) -> _AdaptiveBatcher:
+        raise NotImplementedError
+
     @abstractmethod
     def entity_cache(self) -> ThreadSafeSingeltonCache[str, Entity]:
         raise NotImplementedError
@@ -48,6 +59,14 @@ class _ServerInterface(ABC):
     def entity_type_cache(self, force_update: bool = False) -> dict[str, _EntityTypeInternal]:
         raise NotImplementedError
 
+    @abstractmethod
+    def material_index(self) -> _FilterIndex:
+        raise NotImplementedError
+
+    @abstractmethod
+    def entity_type_index(self) -> _FilterIndex:
+        raise NotImplementedError
+
     @abstractmethod
     def server_info_cache(self, force_update: bool = False) -> dict[str, Any]:
         raise NotImplementedError
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from typing import Iterable
+
 from ._abc import _ServerInterface
+from ._commands import COMMAND_WINDOW, CommandSink, _run_pipelined
+from .tracing import traced
 
 
 class _HasServer:
@@ -57,3 +61,67 @@ class _SharedBase(_HasServer):
         :rtype: str
         """
         return self._server.run_command(command, True, True)
+
+    def _prefix_command(self, command: str) -> str:
+        # subclasses run commands in their world or as their entity
+        return command
+
+    @traced("runCommands")
+    def runCommands(
+        self, commands: Iterable[str], blocking: bool = False, ordered: bool = True
+    ) -> None:
+        """Run all `commands` as if they were typed in chat as ``/``-commands, see :func:`runCommand`.
+        If the order does not matter, pass ``ordered=False`` to pipeline the commands:
+        up to ``COMMAND_WINDOW`` (64) commands are then sent without waiting for the server to respond to the previous ones,
+        so that thousands of commands do not take thousands of round trips.
+
+        .. code-block:: python
+
+           mc.runCommands((f"summon armor_stand {x} 100 0" for x in range(1000)), ordered=False)
+
+        :param commands: the commands without the slash ``/``
+        :type commands: Iterable[str]
+        :param blocking: if True, return only after all commands finished executing, otherwise after the server received them, defaults to False
+        :type blocking: bool, optional
+        :param ordered: if True, each command is only sent after the server acknowledged the previous one, so that they run in order.
+                        Otherwise, the commands are pipelined and the server may run them in any order, defaults to True
+        :type ordered: bool, optional
+        :raises MCPQError: the error of the first failed command, commands following it might have been run anyway
+        """
+        _run_pipelined(self._server, map(self._prefix_command, commands), blocking, False, ordered)
+
+    @traced("runCommandsBlocking")
+    def runCommandsBlocking(self, commands: Iterable[str]) -> list[str]:
+        """Run all `commands` like :func:`runCommandBlocking` and return their console outputs in the same order.
+        The commands are pipelined like in :func:`runCommands` with ``ordered=False``, thus they may run in any order.
+
+        .. code-block:: python
+
+           outputs = mc.runCommandsBlocking(["locate biome mushroom_fields", "locate structure village_plains"])
+
+        :param commands: the commands without the slash ``/``
+        :type commands: Iterable[str]
+        :return: the console output of each command
+        :rtype: list[str]
+        :raises MCPQError: the error of the first failed command, commands following it might have been run anyway
+        """
+        return _run_pipelined(self._server, map(self._prefix_command, commands), True, True, False)
+
+    def commandSink(self, window: int = COMMAND_WINDOW, ordered: bool = True) -> CommandSink:
+        """Create a :class:`~mcpq._commands.CommandSink`, which runs commands in the background without waiting for them,
+        until :func:`~mcpq._commands.CommandSink.flush` is called.
+
+        .. code-block:: python
+
+           with mc.commandSink() as sink:
+               for x in range(1000):
+                   sink.run(f"summon armor_stand {x} 100 0")  # returns immediately
+
+        :param window: the maximum number of commands waiting for the server to respond if not `ordered`, defaults to 64
+        :type window: int, optional
+        :param ordered: if True, the commands run in the order they were queued, but only one is sent at a time, defaults to True
+        :type ordered: bool, optional
+        :return: the new command sink, should be closed after use
+        :rtype: CommandSink
+        """
+        return CommandSink(self, window, ordered)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+
+from . import logger
+
+MAX_BLOCKS: int = 50000  # upper limit of blocks sent in a single request
+MIN_BLOCKS: int = 64  # lower limit of blocks per request the chunk size shrinks to
+INCREASE_BLOCKS: int = 2048  # blocks added to the chunk size after a chunk finished in time
+TARGET_LATENCY: float = 0.2  # seconds a single chunk may take before the chunk size is halved
+MAX_MESSAGE_SIZE: int = 4 * 1024 * 1024  # default maximum message size of gRPC servers in bytes
+
+
+class _AdaptiveBatcher:
+    """Decides how many blocks are sent per request by bulk writes such as :func:`~mcpq.world.World.setBlockList`.
+
+    The chunk size grows additively while chunks finish within `target_latency`
+    and is halved whenever a chunk took longer (AIMD), so that a busy server is not stalled by huge requests
+    while an idle server is written to with as few requests as possible.
+    Independently, requests are kept below `max_message_size` bytes
+    and the chunk size is halved if the server rejected a request as too large anyway.
+    """
+
+    def __init__(
+        self,
+        max_blocks: int = MAX_BLOCKS,
+        max_message_size: int = MAX_MESSAGE_SIZE,
+        target_latency: float = TARGET_LATENCY,
+    ) -> None:
+        if max_blocks < 1 or max_message_size < 1 or target_latency <= 0:
+            raise ValueError("Limits of block batcher must be positive")
+        self._lock = threading.Lock()
+        self._max_blocks = max_blocks
+        self._max_message_size = max_message_size
+        self._target_latency = target_latency
+        self._chunk_size = max_blocks
+        self._chunks = 0
+        self._blocks = 0
+        self._decreases = 0
+        self._rejections = 0
+
+    @property
+    def max_message_size(self) -> int:
+        return self._max_message_size
+
+    def chunk_size(self) -> int:
+        "The number of blocks that should be sent in the next request"
+        return self._chunk_size
+
+    def fit(self, count: int, size: int) -> int:
+        "The number of blocks of a request of `count` blocks and `size` bytes that fit into one message"
+        if size <= self._max_message_size or count <= 1:
+            return count
+        # keep a small margin, as the size per block varies with the coordinates
+        return max(1, int(count * self._max_message_size / size * 0.95))
+
+    def record(self, count: int, latency: float) -> None:
+        "Record that a request with `count` blocks finished after `latency` seconds"
+        with self._lock:
+            self._chunks += 1
+            self._blocks += count
+            if latency > self._target_latency:
+                self._chunk_size = max(MIN_BLOCKS, min(self._chunk_size, count) // 2)
+                self._decreases += 1
+            elif count >= self._chunk_size:  # only grow if the chunk size was actually used
+                self._chunk_size = min(self._max_blocks, self._chunk_size + INCREASE_BLOCKS)
+
+    def rejected(self, count: int) -> int:
+        """Record that a request with `count` blocks was rejected as too large.
+
+        :return: the number of blocks that should be sent instead
+        :rtype: int
+        """
+        with self._lock:
+            self._rejections += 1
+            smaller = max(1, count // 2)
+            self._chunk_size = min(self._chunk_size, smaller)
+        logger.debug(f"Batcher: request with {count} blocks was too large, retry with {smaller}")
+        return smaller
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "chunk_size": self._chunk_size,
+                "chunks": self._chunks,
+                "blocks": self._blocks,
+                "decreases": self._decreases,
+                "rejections": self._rejections,
+            }
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from queue import Empty, SimpleQueue
+from threading import Event, Lock, Timer
+from typing import Any, Callable, Iterator
+
+import grpc
+
+from . import logger
+from ._proto import MinecraftStub
+
+IDEMPOTENT_METHODS: frozenset[str] = frozenset(
+    {
+        "getServerInfo",
+        "getMaterials",
+        "getEntityTypes",
+        "accessWorlds",
+        "getHeight",
+        "getBlock",
+        "getPlayers",
+        "getEntities",
+    }
+)  # reads that can safely be sent more than once, only these are retried and hedged
+UNARY_METHODS: tuple[str, ...] = (
+    "getServerInfo",
+    "getMaterials",
+    "getEntityTypes",
+    "runCommand",
+    "runCommandWithOptions",
+    "postToChat",
+    "accessWorlds",
+    "getHeight",
+    "getBlock",
+    "setBlock",
+    "setBlocks",
+    "setBlockCube",
+    "getPlayers",
+    "setPlayer",
+    "spawnEntity",
+    "setEntity",
+    "getEntities",
+)  # all methods with a single response, the event stream is long lived and never gets a deadline
+
+_deadline: ContextVar[float | None] = ContextVar("mcpq_deadline", default=None)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Policy for retrying idempotent reads, such as :func:`~mcpq.world.World.getBlock` or :func:`~mcpq.Minecraft.getPlayerList`,
+    if they fail with one of the `retryable_codes`. Writes are never retried, as they might have been applied already.
+    Pipelined reads, such as :func:`~mcpq.world.World.getBlockList`, are retried as well, but never hedged.
+
+    .. code-block:: python
+
+       from mcpq import Minecraft, RetryPolicy
+
+       # retry reads up to 4 times, starting 50ms after the first failure and doubling the wait every time
+       mc = Minecraft(timeout=5.0, retry=RetryPolicy(max_attempts=4, initial_backoff=0.05))
+       # additionally send a second request if a read did not finish within 100ms, the first response wins
+       mc = Minecraft(timeout=5.0, retry=RetryPolicy(hedge_delay=0.1))
+
+    :param max_attempts: the maximum number of attempts including the first one, defaults to 3
+    :type max_attempts: int, optional
+    :param initial_backoff: the time in seconds to wait before the first retry, defaults to 0.05
+    :type initial_backoff: float, optional
+    :param max_backoff: the maximum time in seconds to wait between retries, defaults to 1.0
+    :type max_backoff: float, optional
+    :param backoff_multiplier: the factor by which the backoff grows after every retry, defaults to 2.0
+    :type backoff_multiplier: float, optional
+    :param jitter: the fraction by which every backoff is randomly varied in both directions, defaults to 0.2
+    :type jitter: float, optional
+    :param retryable_codes: the status codes of failed calls that are retried, defaults to ``UNAVAILABLE`` and ``RESOURCE_EXHAUSTED``
+    :type retryable_codes: tuple[grpc.StatusCode, ...], optional
+    :param hedge_delay: if not None, send another request of an attempt if it did not finish within this many seconds and use the first response, defaults to None
+    :type hedge_delay: float | None, optional
+    :param max_hedges: the maximum number of additional requests per attempt if hedging, defaults to 1
+    :type max_hedges: int, optional
+    """
+
+    max_attempts: int = 3
+    initial_backoff: float = 0.05
+    max_backoff: float = 1.0
+    backoff_multiplier: float = 2.0
+    jitter: float = 0.2
+    retryable_codes: tuple[grpc.StatusCode, ...] = (
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+    )
+    hedge_delay: float | None = None
+    max_hedges: int = 1
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("RetryPolicy max_attempts must be at least 1")
+        if self.initial_backoff < 0 or self.max_backoff < 0 or self.backoff_multiplier < 1:
+            raise ValueError("RetryPolicy backoff must be positive and must not shrink")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("RetryPolicy jitter must be between 0 and 1")
+        if self.hedge_delay is not None and (self.hedge_delay < 0 or self.max_hedges < 1):
+            raise ValueError("RetryPolicy hedge_delay must be positive and max_hedges at least 1")
+
+    def backoff(self, attempt: int) -> float:
+        "The time in seconds to wait after the failed `attempt` (starting at 1)"
+        backoff = min(
+            self.max_backoff, self.initial_backoff * self.backoff_multiplier ** (attempt - 1)
+        )
+        return backoff * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    # nested deadlines can only shorten the outer one
+    new_deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(new_deadline if outer is None else min(outer, new_deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class _PolicyCallable:
+    """Wraps a unary multi-callable of the stub, so that every call gets a deadline and idempotent reads are retried and hedged."""
+
+    def __init__(
+        self, callable: grpc.UnaryUnaryMultiCallable, method: str, stub: _PolicyStub
+    ) -> None:
+        self._callable = callable
+        self._method = method
+        self._stub = stub
+        self._retry = stub.retry if method in IDEMPOTENT_METHODS else None
+
+    def _timeout(self, timeout: float | None) -> float | None:
+        # the shortest of the explicit timeout, the enclosing deadline() and the client-wide timeout
+        candidates = [t for t in (timeout, self._stub.timeout) if t is not None]
+        scope = _deadline.get()
+        if scope is not None:
+            candidates.append(max(0.0, scope - time.monotonic()))
+        return min(candidates) if candidates else None
+
+    def __call__(self, request, timeout: float | None = None, **kwargs) -> Any:
+        timeout = self._timeout(timeout)
+        if self._retry is None:
+            return self._callable(request, timeout=timeout, **kwargs)
+        end = None if timeout is None else time.monotonic() + timeout
+        attempt = 1
+        while True:
+            remaining = None if end is None else max(0.0, end - time.monotonic())
+            try:
+                if self._retry.hedge_delay is None:
+                    return self._callable(request, timeout=remaining, **kwargs)
+                return self._hedged(request, remaining, kwargs)
+            except grpc.RpcError as e:
+                code = e.code() if hasattr(e, "code") else None
+                if code not in self._retry.retryable_codes or attempt >= self._retry.max_attempts:
+                    raise
+                backoff = self._retry.backoff(attempt)
+                if end is not None and time.monotonic() + backoff >= end:
+                    raise
+                logger.debug(
+                    f"{self._method}: attempt {attempt} failed with {code}, retry in {backoff:.3f}s"
+                )
+                time.sleep(backoff)
+                attempt += 1
+
+    def _hedged(self, request, timeout: float | None, kwargs: dict[str, Any]) -> Any:
+        assert self._retry is not None and self._retry.hedge_delay is not None
+        done: SimpleQueue[grpc.Future] = SimpleQueue()
+        futures: list[grpc.Future] = []
+        end = None if timeout is None else time.monotonic() + timeout
+
+        def launch() -> None:
+            remaining = None if end is None else max(0.0, end - time.monotonic())
+            future = self._callable.future(request, timeout=remaining, **kwargs)
+            future.add_done_callback(done.put)
+            futures.append(future)
+
+        launch()
+        failed = 0
+        try:
+            while True:
+                can_hedge = len(futures) <= self._retry.max_hedges
+                try:
+                    # futures finish by themselves at the latest at their deadline
+                    future = done.get(timeout=self._retry.hedge_delay if can_hedge else None)
+                except Empty:
+                    launch()
+                    continue
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                code = error.code() if hasattr(error, "code") else None
+                if code not in self._retry.retryable_codes:
+                    return future.result()  # raises, other requests would fail the same way
+                failed += 1
+                if failed == len(futures):
+                    if not can_hedge:
+                        return future.result()  # raises the error of the last request
+                    launch()  # all requests failed, try the next one right away
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def future(self, request, timeout: float | None = None, **kwargs) -> grpc.Future:
+        timeout = self._timeout(timeout)
+        if self._retry is None:
+            return self._callable.future(request, timeout=timeout, **kwargs)
+        return _RetryingFuture(self, request, timeout, kwargs)
+
+    def with_call(self, request, timeout: float | None = None, **kwargs) -> tuple[Any, grpc.Call]:
+        return self._callable.with_call(request, timeout=self._timeout(timeout), **kwargs)
+
+
+class _RetryingFuture(grpc.Future):
+    """Future of an idempotent read that is retried like a blocking call, but never hedged,
+    so that pipelined reads, such as :func:`~mcpq.world.World.getBlockList`, survive transient errors as well.
+    """
+
+    def __init__(
+        self, call: _PolicyCallable, request, timeout: float | None, kwargs: dict[str, Any]
+    ) -> None:
+        assert call._retry is not None
+        self._call = call
+        self._retry = call._retry
+        self._request = request
+        self._kwargs = kwargs
+        self._end = None if timeout is None else time.monotonic() + timeout
+        self._attempt = 1
+        self._lock = Lock()
+        self._done = Event()
+        self._callbacks: list[Callable[[grpc.Future], None]] = []
+        self._cancelled = False
+        self._timer: Timer | None = None
+        self._future: grpc.Future | None = None  # the current attempt
+        self._outcome: grpc.Future | None = None  # the last attempt once done, None if cancelled
+        self._launch()
+
+    def _launch(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            remaining = None if self._end is None else max(0.0, self._end - time.monotonic())
+            future = self._call._callable.future(self._request, timeout=remaining, **self._kwargs)
+            self._future = future
+        future.add_done_callback(self._attempt_done)
+
+    def _attempt_done(self, future: grpc.Future) -> None:
+        error = None if future.cancelled() else future.exception()
+        code = (
+            error.code() if isinstance(error, grpc.RpcError) and hasattr(error, "code") else None
+        )
+        if code in self._retry.retryable_codes and self._attempt < self._retry.max_attempts:
+            backoff = self._retry.backoff(self._attempt)
+            if self._end is None or time.monotonic() + backoff < self._end:
+                logger.debug(
+                    f"{self._call._method}: attempt {self._attempt} failed with {code}, retry in {backoff:.3f}s"
+                )
+                with self._lock:
+                    if not self._cancelled:
+                        self._attempt += 1
+                        self._timer = Timer(backoff, self._launch)
+                        self._timer.daemon = True
+                        self._timer.start()
+                        return
+        self._finish(future)
+
+    def _finish(self, outcome: grpc.Future | None) -> None:
+        with self._lock:
+            if self._done.is_set():
+                return
+            self._outcome = outcome
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def _wait(self, timeout: float | None) -> grpc.Future:
+        if not self._done.wait(timeout):
+            raise grpc.FutureTimeoutError()
+        if self._outcome is None:
+            raise grpc.FutureCancelledError()
+        return self._outcome
+
+    def cancel(self) -> bool:
+        with self._lock:
+            if self._done.is_set():
+                return False
+            self._cancelled = True
+            future, timer = self._future, self._timer
+        if timer is not None:
+            timer.cancel()
+        if future is not None:
+            future.cancel()
+        self._finish(None)
+        return True
+
+    def cancelled(self) -> bool:
+        return self._done.is_set() and (self._outcome is None or self._outcome.cancelled())
+
+    def running(self) -> bool:
+        return not self._done.is_set()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self, timeout: float | None = None) -> Any:
+        return self._wait(timeout).result()
+
+    def exception(self, timeout: float | None = None) -> Exception | None:
+        return self._wait(timeout).exception()
+
+    def traceback(self, timeout: float | None = None) -> Any:
+        return self._wait(timeout).traceback()
+
+    def add_done_callback(self, fn: Callable[[grpc.Future], None]) -> None:
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+
+class _PolicyStub(MinecraftStub):
+    """Stub applying a client-wide `timeout` to every unary call and the `retry` policy to the idempotent reads."""
+
+    def __init__(
+        self, channel: grpc.Channel, timeout: float | None, retry: RetryPolicy | None
+    ) -> None:
+        super().__init__(channel)
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be positive or None")
+        self.timeout = timeout
+        self.retry = retry
+        for method in UNARY_METHODS:
+            setattr(self, method, _PolicyCallable(getattr(self, method), method, self))
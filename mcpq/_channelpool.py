@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import itertools
+import threading
+from typing import Literal, TypeAlias
+
+import grpc
+
+from ._proto import MinecraftStub
+
+ChannelSelection: TypeAlias = Literal["round_robin", "least_loaded"]
+
+
+class _InFlightInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Counts the unary calls of one channel that are still waiting for their response."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+    def _done(self, _) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        with self._lock:
+            self.in_flight += 1
+        call = continuation(client_call_details, request)
+        call.add_done_callback(self._done)
+        return call
+
+
+class _StubPool:
+    """A fixed number of stubs, each on its own channel (HTTP/2 connection), that calls are spread over.
+
+    With ``round_robin`` the stubs are used in turn, with ``least_loaded`` the stub of the channel
+    with the fewest calls waiting for a response is used (ties are broken round robin).
+    """
+
+    def __init__(
+        self, stubs: list[MinecraftStub], counters: list[_InFlightInterceptor] | None = None
+    ) -> None:
+        if not stubs:
+            raise ValueError("Stub pool needs at least one stub")
+        self._stubs = stubs
+        self._counters = counters
+        # next() is atomic with the GIL, without it a race at worst hands out the same stub twice
+        self._next = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._stubs)
+
+    @property
+    def stubs(self) -> list[MinecraftStub]:
+        return self._stubs
+
+    def next(self) -> MinecraftStub:
+        start = next(self._next) % len(self._stubs)
+        if self._counters is None:
+            return self._stubs[start]
+        best, best_load = start, self._counters[start].in_flight
+        for offset in range(1, len(self._stubs)):
+            if best_load == 0:
+                break
+            index = (start + offset) % len(self._stubs)
+            load = self._counters[index].in_flight
+            if load < best_load:
+                best, best_load = index, load
+        return self._stubs[best]
+
+    def in_flight(self) -> list[int]:
+        "The number of calls waiting for a response per channel, only tracked with ``least_loaded``"
+        if self._counters is None:
+            return []
+        return [counter.in_flight for counter in self._counters]
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import threading
+from array import array
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from . import logger
+from ._proto import minecraft_pb2 as pb
+from .exception import raise_on_error
+from .nbt import Block
+from .vec3 import Vec3
+
+if TYPE_CHECKING:
+    from ._abc import _ServerInterface
+    from .world import _DefaultWorld
+
+READ_WINDOW: int = (
+    256  # maximum number of block or height reads sent without waiting for their response
+)
+MAX_SECTIONS: int = 1024  # default number of 16x16x16 sections a ChunkCache keeps (about 4 MiB)
+SECTION_SIZE: int = 16  # edge length of a section, the same as that of chunks
+
+__all__ = ["ChunkCache"]
+
+_SectionKey = tuple[int, int, int]
+_ColumnKey = tuple[int, int]
+
+
+def _iter_responses(method: Any, requests: Iterable[Any]) -> Iterator[Any]:
+    # the protocol has no bulk reads, so single reads are pipelined with a bounded window
+    pending: deque = deque()
+    for request in requests:
+        if len(pending) >= READ_WINDOW:
+            yield pending.popleft().result()
+        pending.append(method.future(request))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _fetch_blocks(
+    server: _ServerInterface, pb_world: pb.World | None, positions: Iterable[Vec3], with_data: bool
+) -> list[str]:
+    requests = (
+        pb.BlockRequest(world=pb_world, pos=pb.Vec3(x=pos.x, y=pos.y, z=pos.z), withData=with_data)
+        for pos in positions
+    )
+    blocks: list[str] = []
+    for response in _iter_responses(server.stub.getBlock, requests):
+        raise_on_error(response.status)
+        blocks.append(response.info.blockType + response.info.blockData)
+    return blocks
+
+
+def _fetch_heights(
+    server: _ServerInterface, pb_world: pb.World | None, columns: Iterable[tuple[int, int]]
+) -> list[int]:
+    requests = (pb.HeightRequest(world=pb_world, x=x, z=z) for x, z in columns)
+    heights: list[int] = []
+    for response in _iter_responses(server.stub.getHeight, requests):
+        raise_on_error(response.status)
+        heights.append(response.block.pos.y)
+    return heights
+
+
+def _as_grid(values: list[int], rows: int, cols: int) -> Any:
+    # a NumPy array if NumPy is installed, otherwise a list of compact int arrays
+    try:
+        import numpy as np
+    except ImportError:
+        return [array("i", values[i * cols : (i + 1) * cols]) for i in range(rows)]
+    return np.array(values, dtype=np.int32).reshape(rows, cols)
+
+
+def _section_key(x: int, y: int, z: int) -> _SectionKey:
+    return x >> 4, y >> 4, z >> 4
+
+
+def _column_positions(key: _ColumnKey) -> list[tuple[int, int]]:
+    # in the same order as the heightmap of a chunk
+    x0, z0 = (k * SECTION_SIZE for k in key)
+    return [(x0 + x, z0 + z) for z in range(SECTION_SIZE) for x in range(SECTION_SIZE)]
+
+
+def _section_positions(key: _SectionKey) -> list[Vec3]:
+    # in the same order as _Section indices
+    x0, y0, z0 = (k * SECTION_SIZE for k in key)
+    return [
+        Vec3(x0 + x, y0 + y, z0 + z)
+        for y in range(SECTION_SIZE)
+        for z in range(SECTION_SIZE)
+        for x in range(SECTION_SIZE)
+    ]
+
+
+class _Section:
+    """The block types of a 16x16x16 section stored as a palette and one index per block,
+    a single byte per block for up to 256 different types and none at all if the section is uniform (e.g. only air).
+    """
+
+    __slots__ = ("palette", "indices")
+
+    def __init__(self, blocks: list[str]) -> None:
+        palette_index: dict[str, int] = {}
+        indices = [palette_index.setdefault(block, len(palette_index)) for block in blocks]
+        self.palette = [Block(block) for block in palette_index]
+        self.indices: array | None = None
+        if len(self.palette) > 1:
+            self.indices = array("B" if len(self.palette) <= 256 else "H", indices)
+
+    def get(self, x: int, y: int, z: int) -> Block:
+        if self.indices is None:
+            return self.palette[0]
+        return self.palette[self.indices[((y & 15) << 8) | ((z & 15) << 4) | (x & 15)]]
+
+    def nbytes(self) -> int:
+        return 0 if self.indices is None else self.indices.itemsize * len(self.indices)
+
+
+class ChunkCache:
+    """Cache of the block types of a world, enabled with :func:`~mcpq.world.World.enableChunkCache`.
+    Once enabled, :func:`~mcpq.world.World.getBlock`, :func:`~mcpq.world.World.getBlockList`, :func:`~mcpq.world.World.copyBlockCube` (without data)
+    as well as :func:`~mcpq.world.World.getHeight`, :func:`~mcpq.world.World.getHighestPos` and :func:`~mcpq.world.World.getHeightmap` of that world are answered by the cache.
+
+    The first read of a block loads its whole 16x16x16 section (4096 blocks) from the server with pipelined reads,
+    all following reads in that section are then answered locally.
+    Likewise, the first height query in a chunk loads the heights of all 256 columns of that chunk.
+    This makes algorithms that read many nearby blocks, such as flood fills, searches or path finding, much faster,
+    while reading few scattered blocks becomes slower, as a section is loaded for each of them.
+    At most `max_sections` sections are kept, the least recently used sections are dropped first.
+
+    Blocks set through the same world object invalidate the affected sections automatically.
+    Changes made by players, commands (e.g. :func:`~mcpq.world.World.runCommand`), physics or through another world object are *not* noticed,
+    use :func:`invalidate` to drop sections that might have changed.
+
+    .. code-block:: python
+
+       cache = mc.enableChunkCache()
+       # flood fill reading every block once over the network would take thousands of round trips
+       stack, seen = [start], {start}
+       while stack:
+           pos = stack.pop()
+           for neighbor in (pos.east(), pos.west(), pos.up(), pos.down(), pos.north(), pos.south()):
+               if neighbor not in seen and mc.getBlock(neighbor) == "water":  # served by the cache
+                   seen.add(neighbor)
+                   stack.append(neighbor)
+       cache.invalidate()  # forget everything, e.g., after running commands that changed the world
+
+    :param world: the world whose blocks are cached
+    :type world: World
+    :param max_sections: the maximum number of sections kept, defaults to 1024
+    :type max_sections: int, optional
+    """
+
+    def __init__(self, world: _DefaultWorld, max_sections: int = MAX_SECTIONS) -> None:
+        if max_sections < 1:
+            raise ValueError("ChunkCache must keep at least one section")
+        self._world = world
+        self._max_sections = max_sections
+        self._lock = threading.Lock()
+        self._sections: OrderedDict[_SectionKey, _Section] = OrderedDict()
+        self._heights: OrderedDict[_ColumnKey, array] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generation = 0  # incremented by every invalidation
+
+    def __len__(self) -> int:
+        "The number of sections currently cached"
+        return len(self._sections)
+
+    def _get_sections(self, keys: Iterable[_SectionKey]) -> dict[_SectionKey, _Section]:
+        found: dict[_SectionKey, _Section] = {}
+        missing: list[_SectionKey] = []
+        with self._lock:
+            generation = self._generation
+            for key in keys:
+                section = self._sections.get(key)
+                if section is None:
+                    missing.append(key)
+                else:
+                    self._sections.move_to_end(key)
+                    found[key] = section
+            self._hits += len(found)
+            self._misses += len(missing)
+        if missing:
+            # all missing sections are loaded in one pipelined batch, outside of the lock
+            positions = [pos for key in missing for pos in _section_positions(key)]
+            blocks = _fetch_blocks(self._world._server, self._world._pb_world, positions, False)
+            size = SECTION_SIZE**3
+            loaded = {
+                key: _Section(blocks[i * size : (i + 1) * size]) for i, key in enumerate(missing)
+            }
+            found.update(loaded)
+            with self._lock:
+                # sections loaded while something was invalidated might be outdated already
+                if generation == self._generation:
+                    self._sections.update(loaded)
+                while len(self._sections) > self._max_sections:
+                    self._sections.popitem(last=False)
+                    self._evictions += 1
+            logger.debug(f"ChunkCache: loaded {len(missing)} sections")
+        return found
+
+    def getBlock(self, pos: Vec3) -> Block:
+        """The block type at `pos`, loading its section if necessary.
+
+        :param pos: the position of the block
+        :type pos: Vec3
+        :return: the block type/id at `pos`
+        :rtype: Block
+        """
+        x, y, z = pos.floor().to_tuple()
+        key = _section_key(x, y, z)
+        return self._get_sections((key,))[key].get(x, y, z)
+
+    def getBlockList(self, positions: Iterable[Vec3]) -> list[Block]:
+        """The block types at `positions` in the same order, loading all missing sections at once.
+
+        :param positions: the positions of the blocks
+        :type positions: Iterable[Vec3]
+        :return: the block types/ids at `positions`
+        :rtype: list[Block]
+        """
+        floored = [pos.floor().to_tuple() for pos in positions]
+        sections = self._get_sections({_section_key(*pos) for pos in floored})
+        return [sections[_section_key(x, y, z)].get(x, y, z) for x, y, z in floored]
+
+    def _get_heightmaps(self, keys: Iterable[_ColumnKey]) -> dict[_ColumnKey, array]:
+        found: dict[_ColumnKey, array] = {}
+        missing: list[_ColumnKey] = []
+        with self._lock:
+            generation = self._generation
+            for key in keys:
+                heights = self._heights.get(key)
+                if heights is None:
+                    missing.append(key)
+                else:
+                    self._heights.move_to_end(key)
+                    found[key] = heights
+            self._hits += len(found)
+            self._misses += len(missing)
+        if missing:
+            columns = [column for key in missing for column in _column_positions(key)]
+            heights = _fetch_heights(self._world._server, self._world._pb_world, columns)
+            size = SECTION_SIZE**2
+            loaded = {
+                key: array("i", heights[i * size : (i + 1) * size])
+                for i, key in enumerate(missing)
+            }
+            found.update(loaded)
+            with self._lock:
+                if generation == self._generation:
+                    self._heights.update(loaded)
+                while len(self._heights) > self._max_sections:
+                    self._heights.popitem(last=False)
+                    self._evictions += 1
+            logger.debug(f"ChunkCache: loaded heightmaps of {len(missing)} chunks")
+        return found
+
+    def getHeight(self, x: int | float, z: int | float) -> int:
+        """The y coordinate of the highest non-air block at `x` and `z`, loading the heightmap of its chunk if necessary.
+
+        :return: the y coordinate of the highest non-air block
+        :rtype: int
+        """
+        x, z = int(x), int(z)
+        key = (x >> 4, z >> 4)
+        return self._get_heightmaps((key,))[key][((z & 15) << 4) | (x & 15)]
+
+    def getHeights(self, columns: Iterable[tuple[int, int]]) -> list[int]:
+        """The y coordinates of the highest non-air blocks of the `x`, `z` `columns` in the same order,
+        loading the heightmaps of all missing chunks at once.
+
+        :param columns: the `x` and `z` coordinates of the columns
+        :type columns: Iterable[tuple[int, int]]
+        :return: the y coordinates of the highest non-air blocks in the columns
+        :rtype: list[int]
+        """
+        columns = [(int(x), int(z)) for x, z in columns]
+        heightmaps = self._get_heightmaps({(x >> 4, z >> 4) for x, z in columns})
+        return [heightmaps[x >> 4, z >> 4][((z & 15) << 4) | (x & 15)] for x, z in columns]
+
+    def invalidate(self, pos1: Vec3 | None = None, pos2: Vec3 | None = None) -> None:
+        """Drop the cached sections of the cube between the corners `pos1` and `pos2` (inclusive),
+        of the single position `pos1` or everything if no position is given.
+
+        :param pos1: a position or one corner of the cube, defaults to None
+        :type pos1: Vec3 | None, optional
+        :param pos2: the opposite corner of the cube, defaults to None
+        :type pos2: Vec3 | None, optional
+        """
+        if pos1 is None:
+            with self._lock:
+                self._generation += 1
+                self._sections.clear()
+                self._heights.clear()
+            return
+        if pos2 is None:
+            pos2 = pos1
+        low = _section_key(*pos1.map_pairwise(min, pos2).floor())
+        high = _section_key(*pos1.map_pairwise(max, pos2).floor())
+        with self._lock:
+            self._generation += 1
+            # iterate over whichever is smaller, the cached sections or the sections of the cube
+            count = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+            if count > len(self._sections):
+                keys = [
+                    k
+                    for k in self._sections
+                    if all(map(int.__le__, low, k)) and all(map(int.__le__, k, high))
+                ]
+            else:
+                keys = [
+                    (x, y, z)
+                    for x in range(low[0], high[0] + 1)
+                    for y in range(low[1], high[1] + 1)
+                    for z in range(low[2], high[2] + 1)
+                ]
+            for key in keys:
+                self._sections.pop(key, None)
+            for column in list(self._heights):
+                if low[0] <= column[0] <= high[0] and low[2] <= column[1] <= high[2]:
+                    del self._heights[column]
+
+    def _invalidate_positions(self, positions: Iterable[Vec3]) -> None:
+        keys = {_section_key(*pos.floor().to_tuple()) for pos in positions}
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._sections.pop(key, None)
+                self._heights.pop((key[0], key[2]), None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the number of cached sections and chunk heightmaps, the memory used by their blocks in bytes
+        and the number of hits, misses and evictions since the cache was enabled.
+
+        :return: the statistics of the cache
+        :rtype: dict[str, Any]
+        """
+        with self._lock:
+            return {
+                "sections": len(self._sections),
+                "heightmaps": len(self._heights),
+                "bytes": sum(section.nbytes() for section in self._sections.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from collections import deque
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+import grpc
+
+from . import logger
+from ._proto import minecraft_pb2 as pb
+from .exception import raise_on_error
+
+if TYPE_CHECKING:
+    from ._abc import _ServerInterface
+    from ._base import _SharedBase
+
+COMMAND_WINDOW: int = 64  # maximum number of commands sent without waiting for their response
+MAX_QUEUED_COMMANDS: int = 10000  # commands a CommandSink queues before run() blocks
+
+__all__ = ["CommandSink"]
+
+
+def _result(future: grpc.Future) -> str:
+    response = future.result()
+    raise_on_error(response.status)
+    return response.output
+
+
+def _iter_pipelined(
+    server: _ServerInterface,
+    commands: Iterable[str],
+    blocking: bool,
+    output: bool,
+    ordered: bool,
+    window: int = COMMAND_WINDOW,
+) -> Iterator[str]:
+    # outputs are yielded in order as soon as they arrive, while later commands are still in flight
+    # concurrent calls may be handled in any order by the server, even over the same connection,
+    # so ordered commands are only sent once the previous one was acknowledged
+    if ordered:
+        window = 1
+    pending: deque[grpc.Future] = deque()
+    for command in commands:
+        if len(pending) >= window:
+            yield _result(pending.popleft())
+        request = pb.CommandRequest(command=command, blocking=blocking, output=output)
+        pending.append(server.stub.runCommandWithOptions.future(request))
+    while pending:
+        yield _result(pending.popleft())
+
+
+def _run_pipelined(
+    server: _ServerInterface,
+    commands: Iterable[str],
+    blocking: bool,
+    output: bool,
+    ordered: bool,
+    window: int = COMMAND_WINDOW,
+) -> list[str]:
+    return list(_iter_pipelined(server, commands, blocking, output, ordered, window))
+
+
+class CommandSink:
+    """Queue of commands that are sent to the server in the background, without waiting for the server to respond.
+    Use it for scripts that run many commands whose output is not needed and are fine with noticing errors later,
+    create it with :func:`~mcpq.Minecraft.commandSink` (or of a world or entity to run the commands there).
+
+    .. code-block:: python
+
+       with mc.commandSink() as sink:
+           for x in range(1000):
+               sink.run(f"summon armor_stand {x} 100 0")  # returns immediately
+           sink.flush()  # wait until all commands were run, raises the first error if any
+           sink.run("kill @e[type=armor_stand]")
+       # leaving the with block flushes and closes the sink
+
+    If `ordered`, each command is only sent once the server acknowledged the previous one, so they run in the order they were queued.
+    Otherwise, up to `window` commands wait for their response at the same time and the server may run them in any order.
+    If more than ``MAX_QUEUED_COMMANDS`` commands are queued, :func:`run` blocks until there is space again.
+    Errors of commands do not stop the sink, they are collected and the first one is raised by the next :func:`flush`.
+    """
+
+    def __init__(
+        self, runner: _SharedBase, window: int = COMMAND_WINDOW, ordered: bool = True
+    ) -> None:
+        if window < 1:
+            raise ValueError("Command window must be at least 1")
+        self._runner = runner
+        self._window = 1 if ordered else window
+        self._queue: Queue[str | None] = Queue(MAX_QUEUED_COMMANDS)
+        self._lock = Lock()
+        self._errors: list[Exception] = []
+        self._closed = False
+        self._sent = 0
+        self._thread = Thread(target=self._send, name="CommandSinkThread", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> CommandSink:
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        self.close(raise_errors=exc_type is None)
+
+    @property
+    def sent(self) -> int:
+        "The number of commands sent to the server so far"
+        return self._sent
+
+    def run(self, command: str) -> None:
+        """Queue `command` to be run, returns immediately unless the queue is full.
+
+        :param command: the command without the slash ``/``
+        :type command: str
+        :raises RuntimeError: if the sink was closed
+        """
+        if self._closed:
+            raise RuntimeError("Cannot run commands on a closed CommandSink")
+        self._queue.put(self._runner._prefix_command(command))
+
+    def flush(self) -> None:
+        """Block until all commands queued so far were run by the server.
+
+        :raises MCPQError: the first error of the commands run since the last flush, if any
+        """
+        self._queue.join()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            if len(errors) > 1:
+                logger.warning(f"CommandSink: {len(errors)} commands failed, raising the first")
+            raise errors[0]
+
+    def close(self, raise_errors: bool = True) -> None:
+        """Flush the sink and stop its thread, no more commands can be run afterwards.
+
+        :param raise_errors: whether to raise the first error of the last commands, defaults to True
+        :type raise_errors: bool, optional
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        if raise_errors:
+            self.flush()
+
+    def _finish(self, future: grpc.Future) -> None:
+        try:
+            _result(future)
+        except Exception as e:
+            with self._lock:
+                self._errors.append(e)
+        finally:
+            self._queue.task_done()
+
+    def _send(self) -> None:
+        stub = self._runner._server.stub
+        pending: deque[grpc.Future] = deque()
+        while True:
+            try:
+                # only wait for new commands if nothing is in flight
+                command = self._queue.get(block=not pending)
+            except Empty:
+                self._finish(pending.popleft())
+                continue
+            if command is None:
+                while pending:
+                    self._finish(pending.popleft())
+                self._queue.task_done()
+                return
+            if len(pending) >= self._window:
+                self._finish(pending.popleft())
+            request = pb.CommandRequest(command=command, blocking=False, output=False)
+            try:
+                pending.append(stub.runCommandWithOptions.future(request))
+                self._sent += 1
+            except Exception as e:
+                with self._lock:
+                    self._errors.append(e)
+                self._queue.task_done()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import fields
+from typing import Any, Callable, Hashable, Mapping, Union
+
+from .nbt import Block
+
+MAX_MEMOIZED: int = 4096  # maximum number of filter expressions whose results an index keeps
+
+# A filter expression is a (nested) tuple, e.g., ("prop", "is_solid", True), ("contains", ("wool",), False),
+# ("or", expr, expr), ("all", (expr, ...)), ("any", (expr, ...)) or ("not", expr).
+# Callables taking a material/entity-type are allowed as well, but have to be evaluated for every key.
+_Expr = Union[tuple, Callable[[Any], bool]]
+
+
+class _FilterIndex:
+    """Bitset index over the cached materials or entity-types of the server, used by the filter classes.
+    Bit ``i`` of a mask stands for the ``i``-th key in the (sorted) cache, such that filters are evaluated with bitwise operations on ints.
+    The mask and the selected keys of every filter expression are memoized, such that repeated filters are practically free.
+    """
+
+    def __init__(self, source: Mapping[str, Any]) -> None:
+        self.source = source  # the cache dict this index was built from
+        items = list(source.values())
+        self.keys: tuple[Block, ...] = tuple(item.key for item in items)
+        self.all = (1 << len(items)) - 1
+        self._properties: dict[tuple[str, bool], int] = {}
+        if items:
+            for f in fields(items[0]):
+                if f.name != "key":
+                    mask = self._scan(items, lambda item: getattr(item, f.name))
+                    self._properties[(f.name, True)] = mask
+                    self._properties[(f.name, False)] = self.all & ~mask
+        self._items = items
+        self._bits: dict[str, int] = {}  # id, type and key string -> bit
+        self._namespaces: dict[str, int] = {}
+        for i, key in enumerate(self.keys):
+            for alias in (key, key.id, key.type):
+                self._bits.setdefault(alias, 1 << i)
+            self._namespaces[key.namespace] = self._namespaces.get(key.namespace, 0) | 1 << i
+        # prefix index: the names sorted, such that all names with a prefix are one slice
+        self._names = sorted((key.name, i) for i, key in enumerate(self.keys))
+        self._masks: dict[Hashable, int] = {}
+        self._selections: dict[int, tuple[Block, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @staticmethod
+    def _scan(items: list[Any], predicate: Callable[[Any], bool]) -> int:
+        mask = 0
+        for i, item in enumerate(items):
+            if predicate(item):
+                mask |= 1 << i
+        return mask
+
+    def _prefix(self, prefix: str) -> int:
+        mask = 0
+        start = bisect_left(self._names, (prefix,))
+        for name, i in self._names[start:]:
+            if not name.startswith(prefix):
+                break
+            mask |= 1 << i
+        return mask
+
+    def _evaluate(self, expr: _Expr) -> int:
+        if callable(expr):
+            return self._scan(self._items, expr)
+        op = expr[0]
+        if op == "all":
+            mask = self.all
+            for sub in expr[1]:
+                mask &= self.mask(sub)
+                if not mask:
+                    break
+            return mask
+        if op in ("or", "any"):
+            subs = expr[1:] if op == "or" else expr[1]
+            mask = 0
+            for sub in subs:
+                mask |= self.mask(sub)
+            return mask
+        if op == "not":
+            return self.all & ~self.mask(expr[1])
+        if op == "prop":
+            return self._properties.get((expr[1], expr[2]), 0)
+        strings, negate = expr[1], expr[2]
+        if op == "namespace":
+            mask = 0
+            for namespace in strings:
+                mask |= self._namespaces.get(namespace, 0)
+        elif op == "equals":
+            mask = 0
+            for string in strings:
+                mask |= self._bits.get(string, 0)
+        elif op == "startswith":
+            mask = 0
+            for prefix in strings:
+                mask |= self._prefix(prefix)
+        elif op == "contains":
+            mask = self._scan(self._items, lambda m: any(sub in m.key.name for sub in strings))
+        elif op == "endswith":
+            mask = self._scan(self._items, lambda m: m.key.name.endswith(strings))
+        else:
+            raise ValueError(f"Unknown filter expression: {expr!r}")
+        return self.all & ~mask if negate else mask
+
+    def mask(self, expr: _Expr) -> int:
+        "The memoized bitset of all keys matching `expr`"
+        mask = self._masks.get(expr)
+        if mask is None:
+            mask = self._evaluate(expr)
+            if len(self._masks) >= MAX_MEMOIZED:
+                self._masks.clear()
+            self._masks[expr] = mask
+        return mask
+
+    def select(self, expr: _Expr) -> tuple[Block, ...]:
+        "The memoized keys matching `expr` in sorted order"
+        mask = self.mask(expr)
+        selection = self._selections.get(mask)
+        if selection is None:
+            if mask == self.all:
+                selection = self.keys
+            else:
+                # the reversed binary string has a "1" at the index of every selected key
+                keys = self.keys
+                selection = tuple(
+                    keys[i] for i, bit in enumerate(reversed(bin(mask)[2:])) if bit == "1"
+                )
+            if len(self._selections) >= MAX_MEMOIZED:
+                self._selections.clear()
+            self._selections[mask] = selection
+        return selection
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Any, Callable, NamedTuple
+
+import grpc
+
+from . import logger, tracing
+from ._proto import minecraft_pb2 as pb
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)  # upper bounds of the latency histogram in seconds, the last implicit bucket is infinity
+
+
+class RpcRecord(NamedTuple):
+    """A single finished call, as passed to the exporters added with :func:`~mcpq.Minecraft.addStatsExporter`."""
+
+    method: str
+    "the name of the called method, e.g., ``getBlock``"
+    code: grpc.StatusCode
+    "the gRPC status code the call finished with, ``grpc.StatusCode.OK`` if the server responded"
+    status: str
+    "the name of the status code returned by the plugin, e.g., ``OK`` or ``BLOCK_TYPE_NOT_FOUND``, empty if the server did not respond"
+    latency: float
+    "the time in seconds from starting the call until it finished"
+    request_bytes: int
+    "the size of the serialized request"
+    response_bytes: int
+    "the size of the serialized response, 0 if the call failed or the response is streamed"
+
+
+def _status_name(response) -> str:
+    if isinstance(response, pb.Status):
+        return pb.StatusCode.Name(response.code)
+    if "status" in response.DESCRIPTOR.fields_by_name:
+        return pb.StatusCode.Name(response.status.code)
+    return ""
+
+
+class _MethodStats:
+    __slots__ = (
+        "calls",
+        "errors",
+        "in_flight",
+        "latency_total",
+        "latency_max",
+        "buckets",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors: dict[str, int] = {}
+        self.in_flight = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def asdict(self) -> dict[str, Any]:
+        finished = sum(self.buckets)
+        cumulative, histogram = 0, {}
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), self.buckets):
+            cumulative += count
+            histogram[bound] = cumulative
+        return {
+            "calls": self.calls,
+            "errors": dict(self.errors),
+            "in_flight": self.in_flight,
+            "latency_avg": self.latency_total / finished if finished else 0.0,
+            "latency_max": self.latency_max,
+            "latency_histogram": histogram,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+        }
+
+
+class _StatsInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """Client interceptor keeping per method counters, latency histograms, byte totals and in-flight gauges.
+
+    Unary calls are measured until their response arrived, both for blocking calls and futures.
+    Streams (the events) are counted while they are open, their latency is the time the stream was open for
+    and the size of their streamed responses is not recorded.
+    If tracing is enabled, every call is also a span ``rpc.<method>`` nested in the span active when the call started.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._methods: dict[str, _MethodStats] = {}
+        self._exporters: list[Callable[[RpcRecord], None]] = []  # copy-on-write
+
+    def add_exporter(self, exporter: Callable[[RpcRecord], None]) -> None:
+        with self._lock:
+            self._exporters = self._exporters + [exporter]
+
+    def remove_exporter(self, exporter: Callable[[RpcRecord], None]) -> None:
+        with self._lock:
+            self._exporters = [e for e in self._exporters if e != exporter]
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {method: stats.asdict() for method, stats in sorted(self._methods.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            # keep the gauges of calls still in flight, they are decremented once they finish
+            methods = {}
+            for method, stats in self._methods.items():
+                if stats.in_flight:
+                    methods[method] = _MethodStats()
+                    methods[method].in_flight = stats.in_flight
+            self._methods = methods
+
+    def _start(self, method: str, request_bytes: int) -> float:
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = _MethodStats()
+            stats.calls += 1
+            stats.in_flight += 1
+            stats.request_bytes += request_bytes
+        return time.perf_counter()
+
+    def _finish(self, record: RpcRecord) -> None:
+        with self._lock:
+            stats = self._methods.get(record.method)
+            if stats is None:
+                stats = self._methods[record.method] = _MethodStats()
+            stats.in_flight = max(0, stats.in_flight - 1)
+            if record.code != grpc.StatusCode.OK:
+                stats.errors[record.code.name] = stats.errors.get(record.code.name, 0) + 1
+            elif record.status not in ("OK", ""):
+                stats.errors[record.status] = stats.errors.get(record.status, 0) + 1
+            stats.latency_total += record.latency
+            stats.latency_max = max(stats.latency_max, record.latency)
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, record.latency)] += 1
+            stats.response_bytes += record.response_bytes
+            exporters = self._exporters
+        for exporter in exporters:
+            try:
+                exporter(record)
+            except Exception as e:
+                logger.warning(f"Stats exporter {exporter} raised an exception: {e}")
+
+    def _intercept(
+        self, continuation, client_call_details: grpc.ClientCallDetails, request, streamed: bool
+    ):
+        method = str(client_call_details.method).rsplit("/", 1)[-1]
+        request_bytes = request.ByteSize()
+        traced = tracing._start_detached(f"rpc.{method}", request_bytes=request_bytes)
+        start = self._start(method, request_bytes)
+        call = continuation(client_call_details, request)
+
+        def done(future) -> None:
+            latency = time.perf_counter() - start
+            code = future.code()
+            if code is None:  # cancelled before the call started
+                code = grpc.StatusCode.CANCELLED
+            response_bytes, status = 0, ""
+            if code == grpc.StatusCode.OK and not streamed:
+                response = future.result()
+                response_bytes = response.ByteSize()
+                status = _status_name(response)
+            self._finish(RpcRecord(method, code, status, latency, request_bytes, response_bytes))
+            if traced is not None:
+                tracer, rpc_span = traced
+                rpc_span.set_attribute("code", code.name)
+                rpc_span.set_attribute("status", status)
+                rpc_span.set_attribute("response_bytes", response_bytes)
+                tracer.end_span(rpc_span)
+
+        call.add_done_callback(done)
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request, False)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request, True)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import logger
+from ._proto import minecraft_pb2 as pb
+from ._util import warning
+from .exception import raise_on_error
+
+if TYPE_CHECKING:
+    from ._server import _Server
+
+FORMAT_VERSION: int = 2  # incremented whenever the layout of the cache files changes
+
+_MAGIC = b"MCPQ"
+_HEADER = struct.Struct("<4sB")
+_LENGTH = struct.Struct("<I")
+
+
+def _default_directory() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mcpq"
+
+
+def _cache_file(directory: Path, target: str, info: pb.ServerInfoResponse) -> Path:
+    # the tables depend on the versions of server and plugin
+    key = "\0".join((target, info.mcVersion, info.mcpqVersion, info.serverVersion))
+    return directory / f"metadata-{hashlib.sha256(key.encode()).hexdigest()[:16]}.bin"
+
+
+def _read(path: Path) -> list[bytes] | None:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size or _HEADER.unpack_from(data) != (_MAGIC, FORMAT_VERSION):
+        return None
+    messages, offset = [], _HEADER.size
+    while offset < len(data):
+        if offset + _LENGTH.size > len(data):
+            return None
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        messages.append(data[offset : offset + length])
+        offset += length
+    return messages if offset == len(data) else None
+
+
+def _write(path: Path, messages: list[bytes]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file first, such that concurrent readers never see partial files
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".metadata-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, FORMAT_VERSION))
+            for message in messages:
+                file.write(_LENGTH.pack(len(message)))
+                file.write(message)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _warm_server(server: _Server, directory: Path, target: str) -> bool:
+    """Fill the material, entity-type and server info caches of `server` from the file in `directory`
+    that matches the versions reported by the server, or fetch them concurrently and store them if there is none.
+    The worlds can change without a version change, e.g. when a world is loaded by a plugin, so they are always fetched,
+    concurrently with the server info. Returns True if the caches were filled from disk.
+    """
+    stub = server.stub
+    worlds = stub.accessWorlds.future(pb.WorldRequest())
+    info = stub.getServerInfo(pb.ServerInfoRequest())
+    raise_on_error(info.status)
+    server._load_server_info(info)
+    info_bytes = info.SerializeToString(deterministic=True)
+    path = _cache_file(directory, target, info)
+    messages = _read(path)
+    if messages is not None and len(messages) == 3 and messages[0] == info_bytes:
+        try:
+            server._load_materials(pb.MaterialResponse.FromString(messages[1]))
+            server._load_entity_types(pb.EntityTypeResponse.FromString(messages[2]))
+        except Exception as e:
+            logger.debug(f"metadata cache: ignoring unreadable {path}: {e!r}")
+        else:
+            logger.debug(f"metadata cache: loaded {path}")
+            server._load_worlds(worlds.result())
+            return True
+    # cold cache: the tables are requested at the same time
+    materials = stub.getMaterials.future(pb.MaterialRequest())
+    entity_types = stub.getEntityTypes.future(pb.EntityTypeRequest())
+    responses = (materials.result(), entity_types.result())
+    server._load_materials(responses[0])
+    server._load_entity_types(responses[1])
+    server._load_worlds(worlds.result())
+    try:
+        _write(path, [info_bytes] + [r.SerializeToString(deterministic=True) for r in responses])
+    except OSError as e:
+        warning(f"Could not write metadata cache {path}: {e}")
+    else:
+        logger.debug(f"metadata cache: stored {path}")
+    return False
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import re
+import traceback
+from typing import TYPE_CHECKING, Literal
+
+from ._commands import _iter_pipelined
+from ._util import warning
+from .nbt import NBT, NbtType, parse_snbt
+
+if TYPE_CHECKING:
+    from ._abc import _ServerInterface
+
+_DATA_MARKER = re.compile(r"has the following (?:block |entity )?data: ")
+
+
+def _data_command(target: str, path: str | None) -> str:
+    # with a path the server only sends the selected part of the data
+    return f"data get {target}" if not path else f"data get {target} {path}"
+
+
+def _snbt_of(out: str, path: str | None) -> str | None:
+    if not path:
+        if "{" in out and "}" in out:
+            return out[out.index("{") : out.rindex("}") + 1]
+        return None
+    # the selected value can be of any type, e.g., a list, number or string
+    match = _DATA_MARKER.search(out)
+    return out[match.end() :].strip() if match else None
+
+
+def _parse_nbt_output(out: str, path: str | None, what: str) -> NbtType | Literal[False] | None:
+    snbt = _snbt_of(out, path) if out else None
+    if snbt is not None:
+        try:
+            return parse_snbt(snbt) if path else NBT.parse(snbt)
+        except Exception:
+            traceback.print_exc()
+            warning(f"NBT data of {what} could not be parsed: {snbt}")
+    elif not out:
+        warning(
+            "No response received. Your plugin version may not support command output capturing (built against Spigot API)."
+        )
+    elif "not a block entity" in out.lower():
+        return False
+    return None
+
+
+def _query_nbt_many(
+    server: _ServerInterface, commands: list[str], path: str | None, whats: list[str]
+) -> list[NbtType | Literal[False] | None]:
+    # every output is parsed as soon as it arrived, while the other commands are still in flight,
+    # parsing is pure Python and holds the GIL, so worker threads would not parse any faster
+    outputs = _iter_pipelined(server, commands, True, True, False)
+    return [_parse_nbt_output(out, path, what) for out, what in zip(outputs, whats)]
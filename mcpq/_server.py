@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import threading
 from functools import partial
 from typing import Any
 
 from ._abc import _ServerInterface
+from ._batching import MAX_MESSAGE_SIZE, _AdaptiveBatcher
+from ._channelpool import _StubPool
+from ._filterindex import _FilterIndex
 from ._proto import MinecraftStub
 from ._proto import minecraft_pb2 as pb
 from ._util import ThreadSafeSingeltonCache
@@ -18,21 +22,46 @@ from .world import World
 class _Server(_ServerInterface):
     """Impl. of internal interface for interacting with server and caching selected results"""
 
-    def __init__(self, stub: MinecraftStub) -> None:
+    def __init__(
+        self,
+        stub: MinecraftStub,
+        max_message_size: int = MAX_MESSAGE_SIZE,
+        pool: _StubPool | None = None,
+    ) -> None:
         if not isinstance(stub, MinecraftStub):
             raise TypeError(f"Argument 'stub' must be of type MinecraftStub was '{type(stub)}'")
         self._stub = stub
+        self._pool = pool  # if set, all calls except event streams are spread over the pool
+        self._block_batcher = _AdaptiveBatcher(max_message_size=max_message_size)
         self._world_by_name_cache = ThreadSafeSingeltonCache(None)
         self._entity_cache = ThreadSafeSingeltonCache(partial(Entity, self), use_weakref=True)
         self._player_cache = ThreadSafeSingeltonCache(partial(Player, self))
         self._material_cache: dict[str, _MaterialInternal] = {}
         self._entity_type_cache: dict[str, _EntityTypeInternal] = {}
+        self._material_index: _FilterIndex | None = None
+        self._entity_type_index: _FilterIndex | None = None
         self._server_info_cache: dict[str, Any] = {}
+        # the caches above are replaced as a whole (the server info only gains derived entries),
+        # so readers need no lock, it only ensures that threads finding them empty at the same time fetch them once
+        self._metadata_lock = threading.Lock()
 
     @property
     def stub(self) -> MinecraftStub:
+        if self._pool is not None:
+            return self._pool.next()
         return self._stub
 
+    @property
+    def event_stub(self) -> MinecraftStub:
+        return self._stub
+
+    @property
+    def pool(self) -> _StubPool | None:
+        return self._pool
+
+    def block_batcher(self) -> _AdaptiveBatcher:
+        return self._block_batcher
+
     def entity_cache(self) -> ThreadSafeSingeltonCache[str, Entity]:
         return self._entity_cache
 
@@ -43,43 +72,77 @@ class _Server(_ServerInterface):
         self, force_update: bool = False
     ) -> ThreadSafeSingeltonCache[str, World]:
         if not self._world_by_name_cache or force_update:
-            response = self.stub.accessWorlds(pb.WorldRequest())
-            raise_on_error(response.status)
-            for world in response.worlds:
-                self._world_by_name_cache.get_or_create(
-                    world.name, factory=partial(World, self, world.info.key)
-                )
+            self._load_worlds(self.stub.accessWorlds(pb.WorldRequest()))
         return self._world_by_name_cache
 
+    def _load_worlds(self, response: pb.WorldResponse) -> None:
+        raise_on_error(response.status)
+        for world in response.worlds:
+            self._world_by_name_cache.get_or_create(
+                world.name, factory=partial(World, self, world.info.key)
+            )
+
     def material_cache(self, force_update: bool = False) -> dict[str, _MaterialInternal]:
         if not self._material_cache or force_update:
-            response = self.stub.getMaterials(pb.MaterialRequest())
-            raise_on_error(response.status)
-            self._material_cache = {
-                m.key: _MaterialInternal._build(m)
-                for m in sorted(response.materials, key=lambda m: m.key)
-            }
+            with self._metadata_lock:
+                if not self._material_cache or force_update:
+                    self._load_materials(self.stub.getMaterials(pb.MaterialRequest()))
         return self._material_cache
 
+    def _load_materials(self, response: pb.MaterialResponse) -> None:
+        raise_on_error(response.status)
+        self._material_cache = {
+            m.key: _MaterialInternal._build(m)
+            for m in sorted(response.materials, key=lambda m: m.key)
+        }
+
     def entity_type_cache(self, force_update: bool = False) -> dict[str, _EntityTypeInternal]:
         if not self._entity_type_cache or force_update:
-            response = self.stub.getEntityTypes(pb.EntityTypeRequest())
-            raise_on_error(response.status)
-            self._entity_type_cache = {
-                m.key: _EntityTypeInternal._build(m)
-                for m in sorted(response.types, key=lambda m: m.key)
-            }
+            with self._metadata_lock:
+                if not self._entity_type_cache or force_update:
+                    self._load_entity_types(self.stub.getEntityTypes(pb.EntityTypeRequest()))
         return self._entity_type_cache
 
+    def _load_entity_types(self, response: pb.EntityTypeResponse) -> None:
+        raise_on_error(response.status)
+        self._entity_type_cache = {
+            m.key: _EntityTypeInternal._build(m)
+            for m in sorted(response.types, key=lambda m: m.key)
+        }
+
+    def material_index(self) -> _FilterIndex:
+        cache = self.material_cache()
+        index = self._material_index
+        if index is None or index.source is not cache:  # rebuilt after the cache was updated
+            with self._metadata_lock:
+                index = self._material_index
+                if index is None or index.source is not cache:
+                    index = self._material_index = _FilterIndex(cache)
+        return index
+
+    def entity_type_index(self) -> _FilterIndex:
+        cache = self.entity_type_cache()
+        index = self._entity_type_index
+        if index is None or index.source is not cache:
+            with self._metadata_lock:
+                index = self._entity_type_index
+                if index is None or index.source is not cache:
+                    index = self._entity_type_index = _FilterIndex(cache)
+        return index
+
     def server_info_cache(self, force_update: bool = False) -> dict[str, Any]:
         if not self._server_info_cache or force_update:
-            response = self.stub.getServerInfo(pb.ServerInfoRequest())
-            raise_on_error(response.status)
-            self._server_info_cache = {
-                # TODO: automatically parse all properties to dict
-                "mcversion": str(response.mcVersion),
-                "mcpqversion": str(response.mcpqVersion),
-                "serverversion": str(response.serverVersion),
-                # _local properties may be added by _server functions
-            }
+            with self._metadata_lock:
+                if not self._server_info_cache or force_update:
+                    self._load_server_info(self.stub.getServerInfo(pb.ServerInfoRequest()))
         return self._server_info_cache
+
+    def _load_server_info(self, response: pb.ServerInfoResponse) -> None:
+        raise_on_error(response.status)
+        self._server_info_cache = {
+            # TODO: automatically parse all properties to dict
+            "mcversion": str(response.mcVersion),
+            "mcpqversion": str(response.mcpqVersion),
+            "serverversion": str(response.serverVersion),
+            # _local properties may be added by _server functions
+        }
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal, Sequence, TypeAlias
+
+import grpc
+
+Compression: TypeAlias = Literal["gzip", "deflate"]
+
+TARGET_SCHEMES: tuple[str, ...] = (
+    "unix:",
+    "unix-abstract:",
+    "dns:",
+    "ipv4:",
+    "ipv6:",
+)  # hosts starting with one of these are complete gRPC targets and the port is ignored
+KEEPALIVE_TIMEOUT: float = 20.0  # seconds to wait for a keepalive ping to be acknowledged
+
+_COMPRESSION: dict[str | None, grpc.Compression] = {
+    None: grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+def _target(host: str, port: int) -> str:
+    if host.startswith(TARGET_SCHEMES):
+        return host
+    return f"{host}:{port}"
+
+
+@dataclass(frozen=True)
+class _ChannelConfig:
+    """Target, options and compression shared by all channels of one :class:`~mcpq.Minecraft` instance."""
+
+    target: str
+    options: tuple[tuple[str, Any], ...] = ()
+    compression: grpc.Compression = grpc.Compression.NoCompression
+
+    @classmethod
+    def build(
+        cls,
+        host: str,
+        port: int,
+        *,
+        compression: Compression | None = None,
+        keepalive: float | None = None,
+        max_message_size: int | None = None,
+        http2_window: int | None = None,
+        options: Sequence[tuple[str, Any]] = (),
+    ) -> _ChannelConfig:
+        if compression not in _COMPRESSION:
+            raise ValueError(f"Unknown compression '{compression}', use 'gzip' or 'deflate'")
+        built: list[tuple[str, Any]] = []
+        if keepalive is not None:
+            if keepalive <= 0:
+                raise ValueError("Keepalive must be positive or None")
+            built += [
+                ("grpc.keepalive_time_ms", int(keepalive * 1000)),
+                ("grpc.keepalive_timeout_ms", int(KEEPALIVE_TIMEOUT * 1000)),
+                ("grpc.keepalive_permit_without_calls", 1),  # event streams may be idle
+                ("grpc.http2.max_pings_without_data", 0),
+            ]
+        if max_message_size is not None:
+            if max_message_size < 1:
+                raise ValueError("Max message size must be positive or None")
+            built += [
+                ("grpc.max_send_message_length", max_message_size),
+                ("grpc.max_receive_message_length", max_message_size),
+            ]
+        if http2_window is not None:
+            if http2_window < 1:
+                raise ValueError("HTTP/2 window must be positive or None")
+            # a fixed window, the dynamic window sizing (BDP probing) would change it again
+            built += [("grpc.http2.lookahead_bytes", http2_window), ("grpc.http2.bdp_probe", 0)]
+        return cls(_target(host, port), tuple(built) + tuple(options), _COMPRESSION[compression])
+
+    def channel(self, dedicated: bool = False) -> grpc.Channel:
+        # gRPC shares connections of channels with the same target, unless a local pool is used
+        options = list(self.options)
+        if dedicated:
+            options.append(("grpc.use_local_subchannel_pool", 1))
+        return grpc.insecure_channel(self.target, options, self.compression)
+
+    def aio_channel(self) -> grpc.aio.Channel:
+        return grpc.aio.insecure_channel(self.target, list(self.options), self.compression)
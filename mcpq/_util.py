@@ -165,6 +165,8 @@ class ReentrantRWLock:
 KT = TypeVar("KT", bound=Hashable)
 VT = TypeVar("VT")
 
+_MISSING = object()  # do not use None, as None could be a legit value in cache
+
 
 class ThreadSafeSingeltonCache(Generic[KT, VT]):
     """This is a thread safe dictionary intended to be used as a cache.
@@ -174,6 +176,7 @@ class ThreadSafeSingeltonCache(Generic[KT, VT]):
     When ``use_weakref = True``, then the values can be deleted by the Python garbage collector (GC) only if
     no other references, aside from this cache, exist to the object.
     Otherwise, ``use_weakref = False``, the keys are cached for the entire runtime of the program.
+    Looking up existing values does not take a lock, only creating, setting or deleting values and taking snapshots (e.g. :func:`keys`) do.
 
     .. note::
 
@@ -197,16 +200,16 @@ class ThreadSafeSingeltonCache(Generic[KT, VT]):
         return isinstance(self._cache, weakref.WeakValueDictionary)
 
     def __bool__(self) -> bool:
-        with self._lock.for_read():
-            return bool(self._cache)
+        return bool(self._cache)  # atomic, no lock needed
 
     def __len__(self) -> int:
-        with self._lock.for_read():
-            return len(self._cache)
+        return len(self._cache)
 
     def __getitem__(self, key: KT) -> VT:
-        with self._lock.for_read():
-            return self._cache[key]
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value  # type: ignore
 
     def __setitem__(self, key: KT, item: VT) -> None:
         """Prefer using the :func:`get_or_create` function for creating items."""
@@ -228,10 +231,8 @@ class ThreadSafeSingeltonCache(Generic[KT, VT]):
         :return: the value assosiated with `key` or `default` if it does not exist
         :rtype: Value | None
         """
-        try:
-            return self[key]
-        except KeyError:
-            return default
+        # reads do not take the lock: a single lookup is atomic and values are only inserted once fully created
+        return self._cache.get(key, default)
 
     def get_or_create(self, key: KT, factory: Callable[[KT], VT] | None = None) -> VT:
         """Return singleton value for `key` or create value with `factory` (or otherwise `default_factory`) otherwise.
@@ -240,13 +241,13 @@ class ThreadSafeSingeltonCache(Generic[KT, VT]):
         :return: the value assosiated with `key`, newly created if it did not exist
         :rtype: Value
         """
-        _sentinel = object()  # do not use None, as None could be a legit value in cache
-        strong_ref = self.get(key, _sentinel)
-        if strong_ref is _sentinel:
+        # fast path: existing values are returned without taking any lock
+        strong_ref = self._cache.get(key, _MISSING)
+        if strong_ref is _MISSING:
             with self._lock.for_write():
                 # must check again as entry could have been created while waiting for write lock (race condition)
-                strong_ref = self.get(key, _sentinel)
-                if strong_ref is _sentinel:
+                strong_ref = self._cache.get(key, _MISSING)
+                if strong_ref is _MISSING:
                     # now we can be sure nobody will create entry with key because we have write lock
                     if factory is not None:
                         strong_ref = factory(key)
@@ -257,7 +258,7 @@ class ThreadSafeSingeltonCache(Generic[KT, VT]):
                     else:
                         strong_ref = self._default_factory(key)
                     self._cache[key] = strong_ref
-        return strong_ref
+        return strong_ref  # type: ignore
 
     def keys(self) -> tuple[KT, ...]:
         """Returns a tuple of all keys which currently exist.
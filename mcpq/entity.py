@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import threading
 import time
 
 from ._abc import _ServerInterface
 from ._base import _HasServer, _SharedBase
+from ._nbtquery import _data_command, _parse_nbt_output
 from ._proto import minecraft_pb2 as pb
 from ._types import COLOR
-from ._util import warning
 from .colors import color_codes
 from .exception import raise_on_error
-from .nbt import NBT, Block, EntityType
+from .nbt import NBT, Block, EntityType, NbtType
+from .tracing import traced
 from .vec3 import Vec3
 from .world import World
 
@@ -79,6 +81,8 @@ class Entity(_SharedBase, _HasServer):
         super().__init__(server)
         self._id = entity_id
         self._type: EntityType | None = None  # inject type from outside
+        # guards that the location fields below are always changed together
+        self._state_lock = threading.Lock()
         self._update_ts: float = 0.0
         self._world: World = None
         self._pos: Vec3 = Vec3()
@@ -130,7 +134,9 @@ class Entity(_SharedBase, _HasServer):
         When assigned to is equivalent to ``self.teleport(facing=facing)``
         """
         self._update_on_check()
-        return Vec3.from_yaw_pitch(self._yaw, self._pitch)
+        with self._state_lock:
+            yaw, pitch = self._yaw, self._pitch
+        return Vec3.from_yaw_pitch(yaw, pitch)
 
     @facing.setter
     def facing(self, facing: Vec3) -> None:
@@ -178,14 +184,15 @@ class Entity(_SharedBase, _HasServer):
         assert pb_entity.id == self.id
         if pb_entity.type:
             self._type = EntityType(pb_entity.type)
-        self._world = self._server.get_world_by_name(pb_entity.location.world.name)
-        self._pos = Vec3(
-            pb_entity.location.pos.x, pb_entity.location.pos.y, pb_entity.location.pos.z
-        )
-        self._pitch = pb_entity.location.orientation.pitch
-        self._yaw = pb_entity.location.orientation.yaw
-        self._update_ts = time.time()
-        self._loaded = True
+        world = self._server.get_world_by_name(pb_entity.location.world.name)
+        pos = Vec3(pb_entity.location.pos.x, pb_entity.location.pos.y, pb_entity.location.pos.z)
+        with self._state_lock:
+            self._world = world
+            self._pos = pos
+            self._pitch = pb_entity.location.orientation.pitch
+            self._yaw = pb_entity.location.orientation.yaw
+            self._update_ts = time.time()
+            self._loaded = True
         return True
 
     def _set_entity_loc(self, entity_loc: pb.EntityLocation) -> None:
@@ -198,6 +205,7 @@ class Entity(_SharedBase, _HasServer):
         if not ALLOW_UNLOADED_ENTITY_OPS or response.code != pb.ENTITY_NOT_FOUND:
             raise_on_error(response)
 
+    @traced("Entity._update")
     def _update(self, allow_dead: bool = ALLOW_UNLOADED_ENTITY_OPS) -> bool:
         response = self._server.stub.getEntities(
             pb.EntityRequest(
@@ -221,6 +229,7 @@ class Entity(_SharedBase, _HasServer):
         if self._should_update():
             self._update(allow_dead=allow_dead)
 
+    @traced("Entity.getEntitiesAround")
     def getEntitiesAround(
         self,
         distance: float,
@@ -241,29 +250,32 @@ class Entity(_SharedBase, _HasServer):
         entities = self.world.getEntitiesAround(self.pos, distance, type, only_spawnable)
         return [e for e in entities if e is not self]
 
-    def getNbt(self) -> NBT | None:
+    @traced("Entity.getNbt")
+    def getNbt(self, path: str | None = None) -> NBT | NbtType | None:
         """Get the entity's NBT data as :class:`NBT` or None if the entity is not loaded. The data is not cached NBT data is always queried on call.
 
+        If only a part of the data is needed, select it with an `NBT path <https://minecraft.wiki/w/NBT_path_format>`_,
+        which is applied by the server, so that less data is transferred and parsed.
+        The selected value may be of any NBT type and `None` is returned if nothing matches `path`.
+
+        .. code-block:: python
+
+           health = entity.getNbt(path="Health")
+           helmet = entity.getNbt(path="equipment.head.id")
+
         .. caution::
 
            This function requires command output captuing.
            The plugin that is built against the ``spigot-Bukkit API`` does *not* fully support the return of command output.
+
+        :param path: if given, only return the data selected by this NBT path, defaults to None
+        :type path: str | None, optional
         """
-        out = super().runCommandBlocking(f"data get entity {self.id}")  # do not run as entity
-        if out and "{" in out and "}" in out:
-            nbtstr = out[out.index("{") : out.rindex("}") + 1]
-            try:
-                return NBT.parse(nbtstr)
-            except Exception:
-                import traceback
-
-                traceback.print_exc()
-                warning(f"NBT data of {self} could not be parsed: {nbtstr}")
-        elif not out:
-            warning(
-                "No response received. Your plugin version may not support command output capturing (built against Spigot API)."
-            )
+        # do not run as entity
+        out = super().runCommandBlocking(_data_command(f"entity {self.id}", path))
+        return _parse_nbt_output(out, path, str(self))  # type: ignore
 
+    @traced("Entity.giveEffect")
     def giveEffect(
         self, effect: str, seconds: int = 0, amplifier: int = 0, particles: bool = True
     ) -> None:
@@ -292,6 +304,7 @@ class Entity(_SharedBase, _HasServer):
         self.runCommand("tp ~ -50000 ~")
         self.kill()
 
+    @traced("Entity.replaceHelmet")
     def replaceHelmet(
         self,
         armortype: Block | str = "leather_helmet",
@@ -362,6 +375,7 @@ class Entity(_SharedBase, _HasServer):
                 component.int["dyed_color"] = color
             self.replaceItem("armor.head", armortype.withData(component))
 
+    @traced("Entity.replaceItem")
     def replaceItem(
         self, where: str, item: Block | str, amount: int = 1, *, nbt: NBT | None = None
     ) -> None:
@@ -383,6 +397,9 @@ class Entity(_SharedBase, _HasServer):
         else:
             self.runCommand(f"item replace entity @s {where} with {item}{nbt} {amount}")
 
+    def _prefix_command(self, command: str) -> str:
+        return f"execute as {self.id} at @s run " + command
+
     def runCommand(self, command: str) -> None:
         """Run the `command` as if it was typed in chat as ``/``-command by and at the location of the given entity.
         Returns immediately without waiting for the command to finish executing.
@@ -395,8 +412,7 @@ class Entity(_SharedBase, _HasServer):
         :param command: the command without the slash ``/``
         :type command: str
         """
-        command = f"execute as {self.id} at @s run " + command
-        return super().runCommand(command)
+        return super().runCommand(self._prefix_command(command))
 
     def runCommandBlocking(self, command: str) -> str:
         """Run the `command` as if it was typed in chat as ``/``-command by and at the location of the given entity.
@@ -417,9 +433,9 @@ class Entity(_SharedBase, _HasServer):
         :return: the console output of the command
         :rtype: str
         """
-        command = f"execute as {self.id} at @s run " + command
-        return super().runCommandBlocking(command)
+        return super().runCommandBlocking(self._prefix_command(command))
 
+    @traced("Entity.teleport")
     def teleport(
         self,
         pos: Vec3 | None = None,
@@ -481,9 +497,10 @@ class Entity(_SharedBase, _HasServer):
                 world=world_pb,
             )
         )
-        if pos is not None:
-            self._pos = pos
-        if facing is not None:
-            self._yaw, self._pitch = orientation
-        if world is not None:
-            self._world = world
+        with self._state_lock:
+            if pos is not None:
+                self._pos = pos
+            if facing is not None:
+                self._yaw, self._pitch = orientation
+            if world is not None:
+                self._world = world
@@ -3,9 +3,10 @@ from __future__ import annotations
 import random
 from collections.abc import Sequence
 from dataclasses import asdict, dataclass, field
-from typing import Any, Callable, Iterator
+from typing import Any, Iterator
 
 from ._base import _HasServer
+from ._filterindex import _Expr
 from ._proto import minecraft_pb2 as pb
 from .exception import raise_on_error
 from .nbt import EntityType
@@ -42,23 +43,26 @@ class EntityTypeFilter(_HasServer, Sequence):
     def __init__(
         self,
         server,
-        filters: list[Callable[[_EntityTypeInternal], bool]],
+        filters: list[_Expr],
         next_or: bool = False,
     ):
         super().__init__(server)
         self._filters = filters
-        self._filtered_entity_types: list[EntityType] | None = None
+        self._filtered_entity_types: tuple[EntityType, ...] | None = None
         self._next_or: bool = next_or
 
     # logic operations
 
-    def _add_filter(self, func: Callable[[_EntityTypeInternal], bool]) -> EntityTypeFilter:
+    def _add_filter(self, expr: _Expr) -> EntityTypeFilter:
         if self._next_or and self._filters:
             filters = self._filters[:]
-            last_filter = filters[-1]
-            filters[-1] = lambda m: last_filter(m) or func(m)
+            filters[-1] = ("or", filters[-1], expr)
             return self.__class__(self._server, filters)
-        return self.__class__(self._server, self._filters + [func])
+        return self.__class__(self._server, self._filters + [expr])
+
+    @property
+    def _expr(self) -> _Expr:
+        return ("all", tuple(self._filters))
 
     @property
     def or_(self) -> EntityTypeFilter:
@@ -66,60 +70,31 @@ class EntityTypeFilter(_HasServer, Sequence):
 
     def __add__(self, other) -> EntityTypeFilter:
         if isinstance(other, EntityTypeFilter):
-            return self.__class__(
-                self._server,
-                [
-                    lambda m: all(ffunc(m) for ffunc in self._filters)
-                    or all(ffunc(m) for ffunc in other._filters)
-                ],
-            )
+            return self.__class__(self._server, [("any", (self._expr, other._expr))])
         return NotImplemented
 
     def __and__(self, other) -> EntityTypeFilter:
         if isinstance(other, EntityTypeFilter):
-            return self.__class__(
-                self._server,
-                [
-                    lambda m: all(ffunc(m) for ffunc in self._filters)
-                    and all(ffunc(m) for ffunc in other._filters)
-                ],
-            )
+            return self.__class__(self._server, self._filters + other._filters)
         return NotImplemented
 
     def __or__(self, other) -> EntityTypeFilter:
         if isinstance(other, EntityTypeFilter):
-            return self.__class__(
-                self._server,
-                [
-                    lambda m: all(ffunc(m) for ffunc in self._filters)
-                    or all(ffunc(m) for ffunc in other._filters)
-                ],
-            )
+            return self.__class__(self._server, [("any", (self._expr, other._expr))])
         return NotImplemented
 
     def __invert__(self) -> EntityTypeFilter:
-        return self.__class__(
-            self._server,
-            [lambda m: not all(ffunc(m) for ffunc in self._filters)],
-        )
+        return self.__class__(self._server, [("not", self._expr)])
 
     # apply filters
 
-    def _filtered(self) -> list[EntityType]:
+    def _filtered(self) -> tuple[EntityType, ...]:
         if self._filtered_entity_types is None:
-            if self._filters:
-                self._filtered_entity_types = [
-                    m.key
-                    for m in self._server.get_entity_types(
-                        lambda m: all(ffunc(m) for ffunc in self._filters)
-                    )
-                ]
-            else:
-                self._filtered_entity_types = [m.key for m in self._server.get_entity_types()]
+            self._filtered_entity_types = self._server.entity_type_index().select(self._expr)
         return self._filtered_entity_types
 
     def get(self) -> list[EntityType]:
-        return self._filtered()[:]  # copy of cached list
+        return list(self._filtered())  # copy of cached selection
 
     def getById(self, id: str) -> EntityType:
         element = self.equals(id).first()
@@ -133,7 +108,7 @@ class EntityTypeFilter(_HasServer, Sequence):
         return None
 
     def choice(self) -> EntityType:
-        return random.choice(self)
+        return random.choice(self._filtered())
 
     def len(self) -> int:
         return len(self)
@@ -144,6 +119,8 @@ class EntityTypeFilter(_HasServer, Sequence):
         return len(self._filtered())
 
     def __getitem__(self, index) -> EntityType:
+        if isinstance(index, slice):
+            return list(self._filtered()[index])  # type: ignore
         return self._filtered()[index]
 
     def __iter__(self) -> Iterator[EntityType]:
@@ -155,32 +132,26 @@ class EntityTypeFilter(_HasServer, Sequence):
     # entity type properties
 
     def spawnable(self, value: bool = True, /) -> EntityTypeFilter:
-        return self._add_filter(lambda m: m.is_spawnable is value)
+        return self._add_filter(("prop", "is_spawnable", bool(value)))
 
     # additional infered properties
 
     def vanilla(self, value: bool = True, /) -> EntityTypeFilter:
-        return self._add_filter(lambda m: (m.key.namespace == "minecraft") is value)
+        return self._add_filter(("namespace", ("minecraft",), not value))
 
     def namespace(self, *namespaces: str, negate: bool = False) -> EntityTypeFilter:
-        return self._add_filter(lambda m: (m.key.namespace in namespaces) is not negate)
+        return self._add_filter(("namespace", namespaces, bool(negate)))
 
     # additional key filters
 
     def equals(self, *strings: str, negate: bool = False) -> EntityTypeFilter:
-        return self._add_filter(lambda m: (m.key in strings) is not negate)
+        return self._add_filter(("equals", strings, bool(negate)))
 
     def contains(self, *substrings: str, negate: bool = False) -> EntityTypeFilter:
-        return self._add_filter(
-            lambda m: any(sub in m.key.name for sub in substrings) is not negate
-        )
+        return self._add_filter(("contains", substrings, bool(negate)))
 
     def startswith(self, *substrings: str, negate: bool = False) -> EntityTypeFilter:
-        return self._add_filter(
-            lambda m: any(m.key.name.startswith(sub) for sub in substrings) is not negate
-        )
+        return self._add_filter(("startswith", substrings, bool(negate)))
 
     def endswith(self, *substrings: str, negate: bool = False) -> EntityTypeFilter:
-        return self._add_filter(
-            lambda m: any(m.key.name.endswith(sub) for sub in substrings) is not negate
-        )
+        return self._add_filter(("endswith", substrings, bool(negate)))
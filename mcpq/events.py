@@ -1,24 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from functools import partial
-from itertools import repeat
 from queue import Empty, Full, Queue
-from threading import Thread
-from typing import Callable, Generic, TypeVar
+from threading import Condition, Lock, Thread, current_thread
+from typing import Any, Callable, Generic, Hashable, Literal, TypeAlias, TypeVar
 
 import grpc
 
 from . import logger
 from ._abc import _ServerInterface
 from ._base import _HasServer
+from ._proto import MinecraftStub
 from ._proto import minecraft_pb2 as pb
+from ._transport import _ChannelConfig
 from ._types import DIRECTION
 from ._util import ReentrantRWLock, ThreadSafeSingeltonCache
 from .entity import Entity
 from .nbt import Block, EntityType
 from .player import Player
+from .tracing import span
 from .vec3 import Vec3
 
 __all__ = [
@@ -39,9 +43,16 @@ WARN_DROPPED_INTERVAL: int = (
     30  # the interval in seconds after which a warning should be printed on dropped events
 )
 
-TIMEOUT_CHECK_INTERVAL: int = 3  # the interval in which :func:`get` should check the connection to the server to potentially wake up
+DISPATCH_WORKERS: int = 4  # default number of callback threads in "thread" or "ordered" mode
+
+BACKPRESSURE_TIMEOUT: float = 1.0  # default seconds to wait for space with "block" policy
 
 EventType = TypeVar("EventType")
+T = TypeVar("T")
+
+DispatchMode: TypeAlias = Literal["inline", "thread", "ordered"]
+
+BackpressurePolicy: TypeAlias = Literal["drop_newest", "drop_oldest", "coalesce", "block"]
 
 
 @dataclass(
@@ -198,6 +209,436 @@ class ProjectileHitEvent(Event):
         )
 
 
+def _player_key(event: Event) -> Hashable:
+    return getattr(event, "player", None)
+
+
+class _InlineDispatcher:
+    """Runs the callbacks of a :class:`SingleEventHandler` directly on the thread receiving the events
+    and keeps track of how long the callbacks took."""
+
+    mode: DispatchMode = "inline"
+
+    def __init__(self, handler: SingleEventHandler) -> None:
+        self._handler = handler
+        self._stats_lock = Lock()
+        self._handled = 0
+        self._errors = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def submit(self, event: Event) -> None:
+        self._run(event)
+
+    def _run(self, event: Event) -> None:
+        logp = self._handler._logp
+        errors = 0
+        start = time.perf_counter()
+        with span("EventHandler.dispatch", event=type(event).__name__):
+            # the list is never modified, only replaced, so iterating needs no lock
+            for callback in self._handler._callbacks:
+                logger.debug(logp + f"_run: callback with event: {event}")
+                name = callback.__name__ if hasattr(callback, "__name__") else str(callback)
+                try:
+                    with span("EventHandler.callback", callback=name):
+                        callback(event)
+                except Exception as e:
+                    errors += 1
+                    logger.error(
+                        logp + f"callback {name}({event}) raised error: {type(e).__name__}{e.args}"
+                    )
+                    # TODO: potentially propagate error to main thread? (for now, continue)
+        latency = time.perf_counter() - start
+        with self._stats_lock:
+            self._handled += 1
+            self._errors += errors
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+
+    def pending(self) -> int:
+        return 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "mode": self.mode,
+                "workers": 0,
+                "queue_depth": self.pending(),
+                "handled": self._handled,
+                "errors": self._errors,
+                "latency_avg": self._latency_total / self._handled if self._handled else 0.0,
+                "latency_max": self._latency_max,
+            }
+
+    def shutdown(self) -> None:
+        pass
+
+
+class _WorkerDispatcher(_InlineDispatcher):
+    """Runs the callbacks on worker threads, so that the thread receiving the events is not blocked.
+
+    Without a `key` all workers share one queue and events are handled concurrently in no particular order.
+    With a `key` every worker has its own queue and events with the same key are always handled
+    by the same worker, thus in the order they were received.
+    The queues are bounded by `max_pending`, once full the receiving thread waits for the workers to catch up.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        handler: SingleEventHandler,
+        workers: int,
+        max_pending: int,
+        key: Callable[[Event], Hashable] | None,
+    ) -> None:
+        super().__init__(handler)
+        if workers < 1:
+            raise ValueError(f"Number of workers must be at least 1, was {workers}")
+        if max_pending < 1:
+            raise ValueError(
+                f"Maximum number of pending events must be at least 1, was {max_pending}"
+            )
+        self.mode = "thread" if key is None else "ordered"
+        self._key = key
+        self._workers = workers
+        self._max_pending = max_pending
+        self._threads_lock = Lock()
+        self._threads: list[Thread] = []
+        self._queues: list[Queue] = []
+        self._full_time = 0.0
+
+    def _start(self) -> list[Queue]:
+        with self._threads_lock:
+            if not self._threads:
+                if self._key is None:
+                    queue: Queue = Queue(self._max_pending)
+                    self._queues = [queue] * self._workers
+                else:
+                    self._queues = [Queue(self._max_pending) for _ in range(self._workers)]
+                self._threads = [
+                    Thread(
+                        target=self._work,
+                        args=(queue,),
+                        name=f"EventCallbackThread-{self._handler._key}-{i}",
+                        daemon=True,
+                    )
+                    for i, queue in enumerate(self._queues)
+                ]
+                for thread in self._threads:
+                    thread.start()
+            return self._queues
+
+    def _work(self, queue: Queue) -> None:
+        while True:
+            event = queue.get()
+            if event is self._STOP:
+                return
+            self._run(event)
+
+    def submit(self, event: Event) -> None:
+        queues = self._queues or self._start()
+        if self._key is None:
+            queue = queues[0]
+        else:
+            queue = queues[hash(self._key(event)) % len(queues)]
+        try:
+            queue.put_nowait(event)
+        except Full:
+            if self._full_time + WARN_DROPPED_INTERVAL < time.time():
+                logger.warning(
+                    self._handler._logp + "submit: callbacks are too slow, waiting for workers"
+                )
+                self._full_time = time.time()
+            while queues is self._queues:  # otherwise dispatcher was shut down, drop event
+                try:
+                    queue.put(event, timeout=0.1)
+                    return
+                except Full:
+                    pass
+
+    def pending(self) -> int:
+        return sum(queue.qsize() for queue in set(self._queues))
+
+    def stats(self) -> dict[str, Any]:
+        stats = super().stats()
+        stats["workers"] = self._workers
+        return stats
+
+    def shutdown(self) -> None:
+        with self._threads_lock:
+            threads, queues = self._threads, self._queues
+            self._threads, self._queues = [], []
+        for queue in set(queues):
+            try:
+                while True:  # drop pending events
+                    queue.get_nowait()
+            except Empty:
+                pass
+        for queue in queues:  # one stop signal per worker
+            queue.put(self._STOP)
+        for thread in threads:
+            if thread is not current_thread():  # stop might be called from within a callback
+                thread.join()
+
+
+class _EventQueue(Generic[EventType]):
+    """Bounded queue of received events, whose waiting getters wake up on new events
+    and as soon as the stream of events is closed.
+    What happens to new events while the queue is full depends on the :data:`BackpressurePolicy`.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._events: deque[EventType] = deque()
+        self._lock = Lock()
+        self._cond = Condition(self._lock)  # notified when events are added
+        self._not_full = Condition(self._lock)  # notified when events are removed
+        self._closed = False
+        # incremented on close, so that getters notice closes that were reopened
+        self._generation = 0
+        self.configure("drop_newest", capacity, None, BACKPRESSURE_TIMEOUT)
+
+    def configure(
+        self,
+        policy: BackpressurePolicy,
+        capacity: int,
+        key: Callable[[EventType], Hashable] | None,
+        timeout: float | None,
+    ) -> None:
+        with self._lock:
+            self._policy = policy
+            self._capacity = capacity
+            self._key = key
+            self._timeout = timeout
+            self._keys: set[Hashable] = set()
+            if key is not None:
+                self._keys.update(key(event) for event in self._events)
+            while len(self._events) > capacity:
+                self._pop()
+            self._dropped = 0
+            self._coalesced = 0
+            self._high_water = len(self._events)
+            self._not_full.notify_all()
+
+    def _pop(self) -> EventType:
+        event = self._events.popleft()
+        if self._key is not None:
+            self._keys.discard(self._key(event))
+        return event
+
+    def put(self, event: EventType) -> bool:
+        """Return False if this or another event had to be dropped."""
+        with self._lock:
+            if self._key is not None:
+                key = self._key(event)
+                if key in self._keys:
+                    for i in range(len(self._events) - 1, -1, -1):
+                        if self._key(self._events[i]) == key:
+                            self._events[i] = event  # replace with latest, keep position
+                            self._coalesced += 1
+                            return True
+                self._keys.add(key)
+            full = len(self._events) >= self._capacity
+            if full and self._policy == "block":
+                generation = self._generation
+                self._not_full.wait_for(
+                    lambda: len(self._events) < self._capacity or self._generation != generation,
+                    self._timeout,
+                )
+                full = len(self._events) >= self._capacity
+            if full:
+                self._dropped += 1
+                if self._policy != "drop_oldest":
+                    if self._key is not None:
+                        self._keys.discard(key)
+                    return False
+                self._pop()
+            self._events.append(event)
+            self._high_water = max(self._high_water, len(self._events))
+            self._cond.notify()
+            return not full
+
+    def get(self, timeout: float | None = None) -> EventType | None:
+        with self._lock:
+            if not self._events and timeout != 0:
+                generation = self._generation
+                self._cond.wait_for(
+                    lambda: self._events or self._closed or self._generation != generation,
+                    timeout,
+                )
+            if not self._events:
+                return None
+            self._not_full.notify()
+            return self._pop()
+
+    def get_many(self, n: int, timeout: float | None = None) -> list[EventType]:
+        with self._lock:
+            if len(self._events) < n and timeout != 0:
+                generation = self._generation
+                self._cond.wait_for(
+                    lambda: len(self._events) >= n
+                    or self._closed
+                    or self._generation != generation,
+                    timeout,
+                )
+            self._not_full.notify_all()
+            return [self._pop() for _ in range(min(n, len(self._events)))]
+
+    def drain(self, maximum: int | None = None) -> list[EventType]:
+        with self._lock:
+            n = len(self._events) if maximum is None else min(maximum, len(self._events))
+            self._not_full.notify_all()
+            return [self._pop() for _ in range(n)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._keys.clear()
+            self._not_full.notify_all()
+
+    def open(self) -> None:
+        with self._lock:
+            self._closed = False
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._generation += 1
+            self._cond.notify_all()
+            self._not_full.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "policy": self._policy,
+                "capacity": self._capacity,
+                "queued": len(self._events),
+                "dropped": self._dropped,
+                "coalesced": self._coalesced,
+                "high_water": self._high_water,
+            }
+
+
+class _Subscription:
+    """The stream of one event type received by an :class:`_EventMultiplexer`."""
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+        # * set before the task is cancelled, a cancelled stream no longer touches its handler
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        # never wait for the loop, it might be blocked by the handler that is cancelling, e.g. on a full queue
+        self.cancelled = True
+        task = self._task
+        if task is None:
+            return
+        try:
+            task.get_loop().call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            pass  # loop was closed already, thus the task is done
+
+
+class _EventMultiplexer:
+    """Receives all event types on a single thread running an asyncio event loop with its own channel,
+    instead of one thread and blocking stream per event type.
+
+    The protocol only allows one event type per stream, so every event type still has its own stream,
+    but all of them are multiplexed over the one dedicated connection and thread.
+    """
+
+    def __init__(self, target: str | _ChannelConfig) -> None:
+        self._config = target if isinstance(target, _ChannelConfig) else _ChannelConfig(target)
+        self._lock = Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: Thread | None = None
+        self._channel: grpc.aio.Channel | None = None
+        self._stub: MinecraftStub | None = None
+
+    @property
+    def thread(self) -> Thread | None:
+        return self._thread
+
+    def _have_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = Thread(
+                    target=self._loop.run_forever, name="EventMultiplexThread", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def _call_in_loop(self, func: Callable[..., T], *args) -> T:
+        if current_thread() is self._thread:  # e.g. from within a callback
+            return func(*args)
+
+        async def call() -> T:
+            return func(*args)
+
+        return asyncio.run_coroutine_threadsafe(call(), self._have_loop()).result()
+
+    def subscribe(self, handler: SingleEventHandler) -> _Subscription:
+        subscription = _Subscription()
+        self._call_in_loop(self._subscribe, handler, subscription)
+        return subscription
+
+    def _subscribe(self, handler: SingleEventHandler, subscription: _Subscription) -> None:
+        if self._stub is None:
+            self._channel = self._config.aio_channel()
+            self._stub = MinecraftStub(self._channel)
+        stream = self._stub.getEventStream(pb.EventStreamRequest(eventType=handler._key))
+        subscription._task = asyncio.get_running_loop().create_task(
+            self._receive(handler, stream, subscription)
+        )
+
+    async def _receive(
+        self, handler: SingleEventHandler, stream, subscription: _Subscription
+    ) -> None:
+        logger.debug(handler._logp + "_receive: starting stream")
+        try:
+            async for rpc_event in stream:
+                if subscription.cancelled:
+                    logger.debug(handler._logp + "_receive: stream was cancelled via variable")
+                    return
+                handler._handle(rpc_event)
+        except asyncio.CancelledError:
+            logger.debug(handler._logp + "_receive: stream was cancelled")
+        except grpc.RpcError as e:
+            logger.error(handler._logp + f"_receive: stream was closed by RpcError: {e}")
+        finally:
+            stream.cancel()
+            if (
+                not subscription.cancelled
+            ):  # otherwise the handler might be receiving again already
+                handler._thread_cancelled = True
+                handler._event_queue.close()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+
+        async def shutdown() -> None:
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._channel is not None:
+                await self._channel.close()
+            self._channel = self._stub = None
+
+        if thread is current_thread():  # close was called from within a callback
+            loop.create_task(shutdown()).add_done_callback(lambda _: loop.stop())
+            return
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
 class SingleEventHandler(_HasServer, Generic[EventType]):
     """The specific event handler responsible for receiving a certain type of event in different ways."""
 
@@ -206,21 +647,32 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
         server: _ServerInterface,
         cls: type[Event],
         key: int,
+        multiplexer: _EventMultiplexer | None = None,
     ) -> None:
         super().__init__(server)
         self._cls = cls
         self._key = key
-        self._event_queue: Queue[EventType] = Queue(MAX_QUEUE_SIZE)
+        self._multiplexer = multiplexer
+        self._event_queue: _EventQueue[EventType] = _EventQueue(MAX_QUEUE_SIZE)
         self._event_drop_time = 0.0
+        # * copy-on-write: replaced on every change, so that receiving threads can iterate without a lock
         self._callbacks: list[Callable[[EventType], None]] = []
+        self._callbacks_lock = Lock()
+        # * functions receiving the raw events before they are built, e.g. to record them
+        self._taps: list[Callable[[pb.Event], None]] = []
         self._logp = self.__repr__() + ": "
+        self._dispatcher: _InlineDispatcher = _InlineDispatcher(self)
+        if multiplexer is not None:
+            # a single worker keeps the order, without stalling the thread shared by all event types
+            self._dispatcher = _WorkerDispatcher(self, 1, MAX_QUEUE_SIZE, None)
         self._thread_lock = ReentrantRWLock()
         # * the variables _thread and _stream must only be set together (something or None)
         # * must hold _thread_lock to write, must be not None while polling thread exists
+        # * when using a multiplexer, this is the thread of the multiplexer
         self._thread: Thread | None = None
         # * only thread may initialize thus with lock
         # * must hold _thread_lock to write, must be not None while polling thread exists
-        self._stream: grpc.Future | None = None
+        self._stream: grpc.Future | _Subscription | None = None
         # * must only be set to False or None if polling thread does *not* exist
         self._thread_cancelled: bool | None = None
 
@@ -231,13 +683,18 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
         logger.debug(self._logp + "_cleanup: cancelling stream...")
         with self._thread_lock.for_write():
             self._thread_cancelled = True
+            # release the receiver before cancelling, e.g. if a worker callback called stop:
+            # wake up all waiting getters and a receiver blocked on the full queue or worker queues
+            self._event_queue.close()
+            self._dispatcher.shutdown()
             if self._stream:
                 self._stream.cancel()
-            if self._thread:
+            if self._thread and self._multiplexer is None:
                 logger.debug(self._logp + "_cleanup: joining thread...")
                 self._thread.join()
                 logger.debug(self._logp + "_cleanup: joined thread")
             self._thread_cancelled, self._thread, self._stream = None, None, None
+        self._dispatcher.shutdown()  # workers restarted by an event handled while joining
 
     def _have_thread(self) -> None:
         with self._thread_lock.for_read():
@@ -252,6 +709,12 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
                         assert (
                             self._thread_cancelled is None
                         ), f"{self._logp}Thread cancelled was {self._thread_cancelled} in _have_thread!"
+                        self._event_queue.open()
+                        if self._multiplexer is not None:
+                            self._thread_cancelled = False
+                            self._stream = self._multiplexer.subscribe(self)
+                            self._thread = self._multiplexer.thread
+                            return
                         self._thread_cancelled, self._thread, self._stream = (
                             False,
                             Thread(
@@ -259,7 +722,7 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
                                 name=f"EventPollingThread-{self._key}-{self._cls.__name__}",
                                 daemon=True,
                             ),
-                            self._server.stub.getEventStream(
+                            self._server.event_stub.getEventStream(
                                 pb.EventStreamRequest(eventType=self._key)
                             ),
                         )
@@ -275,33 +738,7 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
                 if self._thread_cancelled:  # is only set to True once! (no lock required)
                     logger.debug(self._logp + "_poll: stream was cancelled via variable")
                     return
-                event = self._cls._build(self._server, rpc_event)
-                if self._callbacks:
-                    for callback in self._callbacks:
-                        logger.debug(self._logp + f"_poll: callback with event: {rpc_event}")
-                        try:
-                            callback(event)
-                        except Exception as e:
-                            name = (
-                                callback.__name__
-                                if hasattr(callback, "__name__")
-                                else str(callback)
-                            )
-                            logger.error(
-                                self._logp
-                                + f"callback {name}({event}) raised error: {type(e).__name__}{e.args}"
-                            )
-                            # TODO: potentially propagate error to main thread? (for now, continue)
-                else:
-                    logger.debug(self._logp + f"_poll: putting event in queue: {rpc_event}")
-                    try:
-                        self._event_queue.put(event, block=False, timeout=None)
-                    except Full:
-                        if self._event_drop_time + WARN_DROPPED_INTERVAL < time.time():
-                            logger.warning(
-                                self._logp + "_poll: dropping events due to backlog in queue"
-                            )
-                            self._event_drop_time = time.time()
+                self._handle(rpc_event)
         except grpc.RpcError as e:
             if hasattr(e, "code") and callable(e.code) and e.code() == grpc.StatusCode.CANCELLED:
                 if self._thread_cancelled:  # is only set to True once! (no lock required)
@@ -314,8 +751,22 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
                 raise e
         finally:
             self._thread_cancelled = True
+            self._event_queue.close()
 
-    def get(self, timeout: int | None = None) -> EventType | None:
+    def _handle(self, rpc_event: pb.Event) -> None:
+        for tap in self._taps:
+            tap(rpc_event)
+        event = self._cls._build(self._server, rpc_event)
+        if self._callbacks:
+            self._dispatcher.submit(event)
+        else:
+            logger.debug(self._logp + f"_handle: putting event in queue: {rpc_event}")
+            if not self._event_queue.put(event):
+                if self._event_drop_time + WARN_DROPPED_INTERVAL < time.time():
+                    logger.warning(self._logp + "_handle: dropping events due to backlog in queue")
+                    self._event_drop_time = time.time()
+
+    def get(self, timeout: float | None = None) -> EventType | None:
         """Get and potentially wait for at most `timeout` seconds for the next event that was not yet received
         with either :func:`poll` or :func:`get`.
         If `timeout` is None, wait potentially indefinitely for the next event
@@ -323,34 +774,43 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
 
         .. note::
 
-           This function checks periodically (every few seconds) if :func:`stop` was called and
-           whether the connection was closed while waiting.
-           If either of these checks is true, then eventually this function will stop waiting and return None.
+           If :func:`stop` is called or the connection is closed while waiting,
+           this function stops waiting immediately and returns None.
 
         :param timeout: time in seconds to wait for at most for next event, if None may wait indefinitely, defaults to None
-        :type timeout: int | None, optional
+        :type timeout: float | None, optional
         :raises RuntimeError: if called while a callback is registered
         :return: the next event of that type since last poll, or None if not received within `timeout` seconds
         :rtype: EventType | None
         """
         if self._callbacks:
             raise RuntimeError(self._logp + "Trying to get event while callback is registered")
-        _timeout = TIMEOUT_CHECK_INTERVAL
         self._have_thread()
-        while True:
-            if timeout is not None:
-                _timeout = TIMEOUT_CHECK_INTERVAL if timeout > TIMEOUT_CHECK_INTERVAL else timeout
-                timeout = timeout - _timeout
-            try:
-                return self._event_queue.get(block=True, timeout=_timeout)
-            except Empty:
-                pass
-            if timeout is not None and timeout <= 0:
-                break
-            with self._thread_lock.for_read():
-                if self._thread_cancelled or self._thread is None:
-                    break
-        return None
+        return self._event_queue.get(timeout)
+
+    def get_many(self, n: int, timeout: float | None = None) -> list[EventType]:
+        """Get and potentially wait for at most `timeout` seconds until `n` events were received
+        that were not yet received with either :func:`poll` or :func:`get`.
+        Returns early with the events received so far if :func:`stop` is called or the connection closes.
+
+        .. code-block:: python
+
+           while True:
+               events = mc.events.block_hit.get_many(20, timeout=0.5)  # handle up to 20 hits at once
+               ...
+
+        :param n: the maximum number of events to return
+        :type n: int
+        :param timeout: time in seconds to wait for at most for `n` events, if None may wait indefinitely, defaults to None
+        :type timeout: float | None, optional
+        :raises RuntimeError: if called while a callback is registered
+        :return: a list of at most `n` events of that type since last poll, oldest first, may be empty
+        :rtype: list[EventType]
+        """
+        if self._callbacks:
+            raise RuntimeError(self._logp + "Trying to get events while callback is registered")
+        self._have_thread()
+        return self._event_queue.get_many(n, timeout)
 
     def get_nowait(self) -> EventType | None:
         """Identical to :func:`get` with `timeout` of 0.
@@ -363,10 +823,7 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
         if self._callbacks:
             raise RuntimeError(self._logp + "Trying to get event while callback is registered")
         self._have_thread()
-        try:
-            return self._event_queue.get_nowait()
-        except Empty:
-            return None
+        return self._event_queue.get(0)
 
     def poll(self, maximum: int | None = POLL_DEFAULT) -> list[EventType]:
         """Poll up to `maximum` many events received since the last time :func:`poll` or
@@ -382,15 +839,8 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
         """
         if self._callbacks:
             raise RuntimeError(self._logp + "Trying to poll events while callback is registered")
-        events = []
-        _range = repeat(None) if maximum is None else range(maximum)
         self._have_thread()
-        try:
-            for _ in _range:
-                events.append(self._event_queue.get_nowait())
-        except Empty:
-            pass
-        return events
+        return self._event_queue.drain(maximum)
 
     def register(self, callback: Callable[[EventType], None]) -> None:
         """Register a callback function to run whenever an event is received
@@ -406,14 +856,146 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
 
         .. note::
 
-           No other events can be received while a callback function is being run,
+           By default, no other events can be received while a callback function is being run,
            so make your callback functions non-blocking and fast if possible.
+           Use :func:`dispatch` to run slow callbacks on worker threads instead.
+           If events are multiplexed, the callbacks run on a single worker thread by default.
 
         :param callback: the function called with the event as argument for each event of that type
         :type callback: Callable[[EventType], None]
         """
+        with self._callbacks_lock:
+            # before receiving, so that no event is put in the queue
+            self._callbacks = self._callbacks + [callback]
         self._have_thread()
-        self._callbacks.append(callback)
+
+    def dispatch(
+        self,
+        mode: DispatchMode = "inline",
+        *,
+        workers: int = DISPATCH_WORKERS,
+        max_pending: int = MAX_QUEUE_SIZE,
+        key: Callable[[EventType], Hashable] | None = None,
+    ) -> None:
+        """Set how the registered callback functions are run for each received event:
+
+        - ``"inline"``: the callbacks run on the thread receiving the events (default).
+          No other events of that type are received while a callback is running.
+          If events are multiplexed, no events of *any* type are received while a callback is running,
+          thus multiplexed event types default to ``"thread"`` with a single worker instead.
+
+        - ``"thread"``: the callbacks run on a pool of `workers` threads.
+          Events are handled concurrently and may finish in any order.
+
+        - ``"ordered"``: the callbacks run on `workers` threads, where all events with the same `key`
+          are handled by the same thread in the order they were received.
+          By default, the key is the :class:`Player` of the event, so events of different players are handled concurrently,
+          while the events of each player are handled one after another.
+
+        .. code-block:: python
+
+           def on_chat(event):
+               ...  # slow command handling
+
+           mc.events.chat.dispatch("ordered", workers=8)  # one player's commands never overtake each other
+           mc.events.chat.register(on_chat)
+
+        At most `max_pending` events wait per queue, once the queue is full the receiving of new events pauses until the callbacks catch up.
+        Changing the mode drops events that are still waiting to be handled.
+
+        :param mode: how the callbacks should be run, defaults to "inline"
+        :type mode: DispatchMode, optional
+        :param workers: number of worker threads for "thread" and "ordered" mode, defaults to ``DISPATCH_WORKERS``
+        :type workers: int, optional
+        :param max_pending: maximum number of events waiting per queue for "thread" and "ordered" mode, defaults to ``MAX_QUEUE_SIZE``
+        :type max_pending: int, optional
+        :param key: function returning the key by which to order events in "ordered" mode, defaults to the player of the event
+        :type key: Callable[[EventType], Hashable] | None, optional
+        """
+        if mode == "inline":
+            dispatcher = _InlineDispatcher(self)
+        elif mode == "thread":
+            dispatcher = _WorkerDispatcher(self, workers, max_pending, None)
+        elif mode == "ordered":
+            dispatcher = _WorkerDispatcher(self, workers, max_pending, key or _player_key)
+        else:
+            raise ValueError(
+                f"Dispatch mode should be 'inline', 'thread' or 'ordered', was '{mode}'"
+            )
+        old_dispatcher, self._dispatcher = self._dispatcher, dispatcher
+        old_dispatcher.shutdown()
+
+    def backpressure(
+        self,
+        policy: BackpressurePolicy = "drop_newest",
+        *,
+        capacity: int = MAX_QUEUE_SIZE,
+        key: Callable[[EventType], Hashable] | None = None,
+        timeout: float | None = BACKPRESSURE_TIMEOUT,
+    ) -> None:
+        """Set what happens when events are received faster than they are consumed with :func:`poll` or :func:`get`
+        and the queue of at most `capacity` received events is full:
+
+        - ``"drop_newest"``: newly received events are dropped (default).
+
+        - ``"drop_oldest"``: the oldest queued event is dropped to make room for the new one,
+          so that the queue always holds the latest events.
+
+        - ``"coalesce"``: a newly received event replaces the queued event with the same `key`, if there is one.
+          By default, the key is the :class:`Player` of the event, e.g., only the latest block hit per player is kept.
+          New events with another key are dropped if the queue is full.
+
+        - ``"block"``: receiving pauses for at most `timeout` seconds until there is room in the queue, then the new event is dropped.
+          This also pauses receiving other event types if events are multiplexed.
+
+        .. code-block:: python
+
+           mc.events.block_hit.backpressure("coalesce", capacity=20)  # latest hit of at most 20 players
+
+        The number of dropped and coalesced events, as well as the highest number of queued events,
+        can be seen in :func:`stats` and are reset by calling this function.
+
+        :param policy: what to do with new events when the queue is full, defaults to "drop_newest"
+        :type policy: BackpressurePolicy, optional
+        :param capacity: maximum number of queued events, defaults to ``MAX_QUEUE_SIZE``
+        :type capacity: int, optional
+        :param key: function returning the key by which events are coalesced in "coalesce" policy, defaults to the player of the event
+        :type key: Callable[[EventType], Hashable] | None, optional
+        :param timeout: time in seconds to wait for room in "block" policy, if None wait indefinitely, defaults to ``BACKPRESSURE_TIMEOUT``
+        :type timeout: float | None, optional
+        """
+        if policy not in ("drop_newest", "drop_oldest", "coalesce", "block"):
+            raise ValueError(
+                "Backpressure policy should be 'drop_newest', 'drop_oldest', 'coalesce' or 'block',"
+                f" was '{policy}'"
+            )
+        if capacity < 1:
+            raise ValueError(f"Capacity must be at least 1, was {capacity}")
+        if policy == "coalesce":
+            key = key or _player_key
+        else:
+            key = None
+        self._event_queue.configure(policy, capacity, key, timeout)
+
+    def stats(self) -> dict[str, Any]:
+        """Statistics about the callbacks run for this event type since :func:`dispatch` was last called,
+        and about the queued events since :func:`backpressure` was last called, such as:
+
+        - ``"mode"``: the current dispatch mode, see :func:`dispatch`
+        - ``"queue_depth"``: the number of events currently waiting to be handled by the callbacks
+        - ``"handled"``: the number of events handled by the callbacks
+        - ``"errors"``: the number of exceptions raised by callbacks
+        - ``"latency_avg"`` and ``"latency_max"``: the average and maximum time in seconds it took to run all callbacks for an event
+        - ``"policy"`` and ``"capacity"``: the current backpressure policy and capacity, see :func:`backpressure`
+        - ``"queued"``: the number of events currently waiting for :func:`poll` or :func:`get`
+        - ``"dropped"``: the number of events dropped because the queue was full
+        - ``"coalesced"``: the number of queued events that were replaced by a newer event
+        - ``"high_water"``: the highest number of events that were queued at the same time
+
+        :return: a dictionary with the current statistics
+        :rtype: dict[str, Any]
+        """
+        return self._dispatcher.stats() | self._event_queue.stats()
 
     def stop(self) -> None:
         """Stop the receiving of this event type and clear all events and callbacks.
@@ -421,13 +1003,9 @@ class SingleEventHandler(_HasServer, Generic[EventType]):
         """
         with self._thread_lock.for_write():
             self._cleanup()
-            time.sleep(0.0001)  # give chance for other threads to return from get/poll etc.
-            try:
-                while True:  # clear the queue
-                    self._event_queue.get_nowait()
-            except Empty:
-                pass
-            self._callbacks = []
+            self._event_queue.clear()
+            with self._callbacks_lock:
+                self._callbacks = []
 
 
 class EventHandler(_HasServer):
@@ -473,6 +1051,9 @@ class EventHandler(_HasServer):
          else:
              mc.postToChat(f"Got event {event} within 5 seconds")
 
+      At most ``MAX_QUEUE_SIZE`` received events are kept until they are polled,
+      use :func:`backpressure` to change what happens with events once that limit is reached.
+
     - **Register Callback:**
 
       The :func:`register` function on the corresponding :class:`SingleEventHandler` can register another function as a callback.
@@ -486,6 +1067,9 @@ class EventHandler(_HasServer):
 
          mc.events.projectile_hit.register(myfunc)
 
+      By default, callbacks run one after another on the thread receiving the events.
+      Slow callbacks can instead be run on worker threads with :func:`dispatch`.
+
     These methods of receiving events are mutually exclusive *for the same event type* because registering a function will also consume the events.
     Calling the poll function for an event type where a function is registered as callback will raise a RuntimeException.
 
@@ -496,11 +1080,16 @@ class EventHandler(_HasServer):
 
     """
 
-    def __init__(self, server: _ServerInterface) -> None:
+    def __init__(
+        self, server: _ServerInterface, multiplex_target: str | _ChannelConfig | None = None
+    ) -> None:
         super().__init__(server)
         self._poller: ThreadSafeSingeltonCache[int, SingleEventHandler] = ThreadSafeSingeltonCache(
             None
         )
+        self._multiplexer: _EventMultiplexer | None = (
+            None if multiplex_target is None else _EventMultiplexer(multiplex_target)
+        )
 
     def _cleanup(self) -> None:
         logger.debug("EventHandler: _cleanup: called...")
@@ -509,10 +1098,15 @@ class EventHandler(_HasServer):
             logger.debug(f"EventHandler: _cleanup: calling cleanup in poller with key {key}")
             poller._cleanup()
         old_cache.clear()
+        if self._multiplexer is not None:
+            logger.debug("EventHandler: _cleanup: closing multiplexer")
+            self._multiplexer.close()
         logger.debug("EventHandler: _cleanup: done")
 
     def _get_or_create_poller(self, key: int, cls: EventType) -> SingleEventHandler:
-        return self._poller.get_or_create(key, partial(SingleEventHandler, self._server, cls))
+        return self._poller.get_or_create(
+            key, partial(SingleEventHandler, self._server, cls, multiplexer=self._multiplexer)
+        )
 
     @property
     def player_join(self) -> SingleEventHandler[PlayerJoinEvent]:
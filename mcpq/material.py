@@ -3,9 +3,10 @@ from __future__ import annotations
 import random
 from collections.abc import Sequence
 from dataclasses import asdict, dataclass, field
-from typing import Any, Callable, Iterator
+from typing import Any, Iterator
 
 from ._base import _HasServer
+from ._filterindex import _Expr
 from ._proto import minecraft_pb2 as pb
 from .exception import raise_on_error
 from .nbt import Block
@@ -118,28 +119,34 @@ class MaterialFilter(_HasServer, Sequence):
        # number of "cut_copper" blocks (does NOT include, e.g., "cut_copper_stairs")
        number_of_cut_copper = mc.materials.block().endswith("cut_copper").len()
        # and many more...
+
+    Filters are evaluated on bitsets that are built once from the materials of the server, and the result of every filter is remembered.
+    Building the same filter again, e.g., ``mc.blocks.contains("wool").choice()`` in a loop, is therefore cheap.
     """
 
     def __init__(
         self,
         server,
-        filters: list[Callable[[_MaterialInternal], bool]],
+        filters: list[_Expr],
         next_or: bool = False,
     ):
         super().__init__(server)
         self._filters = filters
-        self._filtered_materials: list[Block] | None = None
+        self._filtered_materials: tuple[Block, ...] | None = None
         self._next_or: bool = next_or
 
     # logic operations
 
-    def _add_filter(self, func: Callable[[_MaterialInternal], bool]) -> MaterialFilter:
+    def _add_filter(self, expr: _Expr) -> MaterialFilter:
         if self._next_or and self._filters:
             filters = self._filters[:]
-            last_filter = filters[-1]
-            filters[-1] = lambda m: last_filter(m) or func(m)
+            filters[-1] = ("or", filters[-1], expr)
             return self.__class__(self._server, filters)
-        return self.__class__(self._server, self._filters + [func])
+        return self.__class__(self._server, self._filters + [expr])
+
+    @property
+    def _expr(self) -> _Expr:
+        return ("all", tuple(self._filters))
 
     @property
     def or_(self) -> MaterialFilter:
@@ -150,61 +157,32 @@ class MaterialFilter(_HasServer, Sequence):
 
     def __add__(self, other) -> MaterialFilter:
         if isinstance(other, MaterialFilter):
-            return self.__class__(
-                self._server,
-                [
-                    lambda m: all(ffunc(m) for ffunc in self._filters)
-                    or all(ffunc(m) for ffunc in other._filters)
-                ],
-            )
+            return self.__class__(self._server, [("any", (self._expr, other._expr))])
         return NotImplemented
 
     def __and__(self, other) -> MaterialFilter:
         if isinstance(other, MaterialFilter):
-            return self.__class__(
-                self._server,
-                [
-                    lambda m: all(ffunc(m) for ffunc in self._filters)
-                    and all(ffunc(m) for ffunc in other._filters)
-                ],
-            )
+            return self.__class__(self._server, self._filters + other._filters)
         return NotImplemented
 
     def __or__(self, other) -> MaterialFilter:
         if isinstance(other, MaterialFilter):
-            return self.__class__(
-                self._server,
-                [
-                    lambda m: all(ffunc(m) for ffunc in self._filters)
-                    or all(ffunc(m) for ffunc in other._filters)
-                ],
-            )
+            return self.__class__(self._server, [("any", (self._expr, other._expr))])
         return NotImplemented
 
     def __invert__(self) -> MaterialFilter:
-        return self.__class__(
-            self._server,
-            [lambda m: not all(ffunc(m) for ffunc in self._filters)],
-        )
+        return self.__class__(self._server, [("not", self._expr)])
 
     # apply filters
 
-    def _filtered(self) -> list[Block]:
+    def _filtered(self) -> tuple[Block, ...]:
         if self._filtered_materials is None:
-            if self._filters:
-                self._filtered_materials = [
-                    m.key
-                    for m in self._server.get_materials(
-                        lambda m: all(ffunc(m) for ffunc in self._filters)
-                    )
-                ]
-            else:
-                self._filtered_materials = [m.key for m in self._server.get_materials()]
+            self._filtered_materials = self._server.material_index().select(self._expr)
         return self._filtered_materials
 
     def get(self) -> list[Block]:
         "Apply all filters and return a Python :class:`list` of filtered blocks"
-        return self._filtered()[:]  # copy of cached list
+        return list(self._filtered())  # copy of cached selection
 
     def getById(self, id: str) -> Block:
         """Apply all filters and return the block with `id`.
@@ -223,7 +201,7 @@ class MaterialFilter(_HasServer, Sequence):
 
     def choice(self) -> Block:
         "Apply all filters and return a random element"
-        return random.choice(self)
+        return random.choice(self._filtered())
 
     def len(self) -> int:
         "Apply all filters and return the number of elements in the selection"
@@ -235,6 +213,8 @@ class MaterialFilter(_HasServer, Sequence):
         return len(self._filtered())
 
     def __getitem__(self, index) -> Block:
+        if isinstance(index, slice):
+            return list(self._filtered()[index])  # type: ignore
         return self._filtered()[index]
 
     def __iter__(self) -> Iterator[Block]:
@@ -247,35 +227,35 @@ class MaterialFilter(_HasServer, Sequence):
 
     def air(self, value: bool = True, /) -> MaterialFilter:
         "Filter for air blocks, e.g., like ``air`` and ``void_air``"
-        return self._add_filter(lambda m: m.is_air is value)
+        return self._add_filter(("prop", "is_air", bool(value)))
 
     def block(self, value: bool = True, /) -> MaterialFilter:
         "Filter for blocks, i.e., anything that can be set using :func:`~mcpq.world.setBlock`"
-        return self._add_filter(lambda m: m.is_block is value)
+        return self._add_filter(("prop", "is_block", bool(value)))
 
     def burnable(self, value: bool = True, /) -> MaterialFilter:
         "Filter for blocks that can burn away"
-        return self._add_filter(lambda m: m.is_burnable is value)
+        return self._add_filter(("prop", "is_burnable", bool(value)))
 
     def edible(self, value: bool = True, /) -> MaterialFilter:
         "Filter for edible materials"
-        return self._add_filter(lambda m: m.is_edible is value)
+        return self._add_filter(("prop", "is_edible", bool(value)))
 
     def flammable(self, value: bool = True, /) -> MaterialFilter:
         "Filter for blocks that can catch fire"
-        return self._add_filter(lambda m: m.is_flammable is value)
+        return self._add_filter(("prop", "is_flammable", bool(value)))
 
     def fuel(self, value: bool = True, /) -> MaterialFilter:
         "Filter for materials that can be used as fuel in a furnace"
-        return self._add_filter(lambda m: m.is_fuel is value)
+        return self._add_filter(("prop", "is_fuel", bool(value)))
 
     def interactable(self, value: bool = True, /) -> MaterialFilter:
         "Filter for interactable materials. Interactable materials include those with functionality when they are interacted with by a player such as chests, furnaces, etc. It counts as interactable if there is at least one state in which additional interact handling is performed for the material."
-        return self._add_filter(lambda m: m.is_interactable is value)
+        return self._add_filter(("prop", "is_interactable", bool(value)))
 
     def item(self, value: bool = True, /) -> MaterialFilter:
         "Filter for obtainable items."
-        return self._add_filter(lambda m: m.is_item is value)
+        return self._add_filter(("prop", "is_item", bool(value)))
 
     def occluding(self, value: bool = True, /) -> MaterialFilter:
         """Filter for blocks that occlude light. Most full blocks will occlude light while non-full blocks are non-occluding.
@@ -283,46 +263,40 @@ class MaterialFilter(_HasServer, Sequence):
 
         .. _opacity: https://minecraft.wiki/w/Opacity
         """
-        return self._add_filter(lambda m: m.is_occluding is value)
+        return self._add_filter(("prop", "is_occluding", bool(value)))
 
     def solid(self, value: bool = True, /) -> MaterialFilter:
         "Filter for blocks that are solid, i.e., can be built upon."
-        return self._add_filter(lambda m: m.is_solid is value)
+        return self._add_filter(("prop", "is_solid", bool(value)))
 
     def gravity(self, value: bool = True, /) -> MaterialFilter:
         "Filter for materials that are affected by gravity."
-        return self._add_filter(lambda m: m.has_gravity is value)
+        return self._add_filter(("prop", "has_gravity", bool(value)))
 
     # additional infered properties
 
     def vanilla(self, value: bool = True, /) -> MaterialFilter:
         "Filter for vanilla block, i.e., block with namespace ``minecraft``"
-        return self._add_filter(lambda m: (m.key.namespace == "minecraft") is value)
+        return self._add_filter(("namespace", ("minecraft",), not value))
 
     def namespace(self, *namespaces: str, negate: bool = False) -> MaterialFilter:
         "Filter for any number of namespaces. Providing multiple namespace means any block having any of the given namespaces is considered a match"
-        return self._add_filter(lambda m: (m.key.namespace in namespaces) is not negate)
+        return self._add_filter(("namespace", namespaces, bool(negate)))
 
     # additional key filters
 
     def equals(self, *strings: str, negate: bool = False) -> MaterialFilter:
         "Filter for any number of exact block matches. Providing multiple means any block equaling any of the given strings is considered a match"
-        return self._add_filter(lambda m: (m.key in strings) is not negate)
+        return self._add_filter(("equals", strings, bool(negate)))
 
     def contains(self, *substrings: str, negate: bool = False) -> MaterialFilter:
         "Filter for blocks that contain a substring. Providing multiple means any block containing any of the given substrings is considered a match"
-        return self._add_filter(
-            lambda m: any(sub in m.key.name for sub in substrings) is not negate
-        )
+        return self._add_filter(("contains", substrings, bool(negate)))
 
     def startswith(self, *substrings: str, negate: bool = False) -> MaterialFilter:
         "Filter for blocks that start with a substring. Providing multiple means any block starting with any of the given substrings is considered a match"
-        return self._add_filter(
-            lambda m: any(m.key.name.startswith(sub) for sub in substrings) is not negate
-        )
+        return self._add_filter(("startswith", substrings, bool(negate)))
 
     def endswith(self, *substrings: str, negate: bool = False) -> MaterialFilter:
         "Filter for blocks that end with a substring. Providing multiple means any block ending with any of the given substrings is considered a match"
-        return self._add_filter(
-            lambda m: any(m.key.name.endswith(sub) for sub in substrings) is not negate
-        )
+        return self._add_filter(("endswith", substrings, bool(negate)))
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import os
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
 import grpc
 
 from . import logger
 from ._base import _HasServer, _SharedBase
-from ._proto import MinecraftStub
+from ._batching import MAX_MESSAGE_SIZE
+from ._callpolicy import RetryPolicy, _PolicyStub, deadline
+from ._channelpool import ChannelSelection, _InFlightInterceptor, _StubPool
+from ._instrumentation import RpcRecord, _StatsInterceptor
+from ._metadatacache import _default_directory, _warm_server
 from ._proto import minecraft_pb2 as pb
 from ._server import _Server
+from ._transport import Compression, _ChannelConfig
 from ._util import deprecated
 from .entity import Entity
 from .entitytype import EntityTypeFilter
@@ -39,6 +49,52 @@ class Minecraft(_DefaultWorld, _SharedBase, _HasServer):
        Generally, it is sufficient to construct one :class:`Minecraft` instance per server or active connection, as this connection is thread-safe and reusable.
        However, it is also possible to connect with multiple instances from the same or different hosts at the same time.
 
+    .. note::
+
+       By default, every event type that is received uses its own thread and blocking stream.
+       With ``multiplex_events=True`` all event types are instead received by a single thread over one additional connection,
+       which is cheaper when many event types are received at the same time.
+       Callbacks of multiplexed events then run on one worker thread per event type, so that a slow callback does not stall the receiving of all other event types,
+       see :func:`~mcpq.events.SingleEventHandler.dispatch`.
+
+    .. note::
+
+       With ``instrument=True`` every call to the server is measured, see :func:`stats` for the recorded statistics.
+
+    .. note::
+
+       By default calls wait for the server indefinitely.
+       With ``timeout`` every call fails with a :class:`grpc.RpcError` (``DEADLINE_EXCEEDED``) if it did not finish within that many seconds,
+       see also :func:`deadline` to limit the time of a block of calls.
+       With ``retry`` reads that can safely be repeated are retried on failure and optionally hedged, see :class:`~mcpq.RetryPolicy`.
+
+    .. note::
+
+       By default all threads share a single connection to the server.
+       With ``channels=n`` the calls are spread over ``n - 1`` additional connections, either in turn (``channel_selection="round_robin"``)
+       or to the connection with the fewest unfinished calls (``"least_loaded"``), while event streams remain on the first connection.
+       This helps programs that make many calls from multiple threads at the same time, e.g., to build large structures in parallel.
+
+    .. note::
+
+       Instead of a host name, ``host`` can also be a complete gRPC target, in which case ``port`` is ignored,
+       e.g., ``Minecraft("unix:/tmp/mcpq.sock")`` connects over a Unix domain socket, which is faster than TCP if the program runs on the same machine as the server.
+       The connection can further be tuned with:
+
+       * ``compression``: compress all requests with ``"gzip"`` or ``"deflate"``, which shrinks large bulk writes such as :func:`~mcpq.world.World.setBlockList` over slow networks, but costs CPU time on both sides
+       * ``keepalive``: send a ping every that many seconds to detect broken connections, e.g., of long lived event streams (the server may reject pings that are sent too frequently)
+       * ``max_message_size``: the maximum size in bytes of messages sent and received, bulk writes are split to stay below this size, should match the limit of the server
+       * ``http2_window``: a fixed HTTP/2 flow control window in bytes instead of the dynamically sized one
+       * ``channel_options``: any other `gRPC channel arguments <https://grpc.github.io/grpc/core/group__grpc__arg__keys.html>`_ as ``(key, value)`` pairs
+
+    .. note::
+
+       By default the lists of materials, entity-types and worlds as well as the server info are requested from the server the first time they are needed.
+       With ``metadata_cache=True`` (or the path of a directory) the materials and entity-types are instead stored on disk, by default in ``~/.cache/mcpq``, and loaded from there on the next start,
+       which makes short-lived programs start faster. The stored data is used only if the server still reports the same server and plugin versions,
+       which is checked with a single call when connecting, while the worlds, which may change at any time, are requested at the same time.
+       If nothing is stored yet, the lists are requested at the same time.
+
     .. caution::
 
        The connection used by the server is not encrypted or otherwise secured, meaning that any man-in-the-middle can read and modify any information sent between the program and the Minecraft server.
@@ -66,12 +122,62 @@ class Minecraft(_DefaultWorld, _SharedBase, _HasServer):
        # and many more ...
     """
 
-    def __init__(self, host: str = "localhost", port: int = 1789) -> None:
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 1789,
+        *,
+        multiplex_events: bool = False,
+        instrument: bool = False,
+        timeout: float | None = None,
+        retry: RetryPolicy | None = None,
+        channels: int = 1,
+        channel_selection: ChannelSelection = "round_robin",
+        compression: Compression | None = None,
+        keepalive: float | None = None,
+        max_message_size: int | None = None,
+        http2_window: int | None = None,
+        channel_options: Sequence[tuple[str, Any]] = (),
+        metadata_cache: bool | str | os.PathLike = False,
+    ) -> None:
+        if channels < 1:
+            raise ValueError("Minecraft needs at least one channel")
+        if channel_selection not in ("round_robin", "least_loaded"):
+            raise ValueError(f"Unknown channel selection '{channel_selection}'")
         self._addr = (host, port)
-        self._channel = grpc.insecure_channel(f"{host}:{port}")
-        server = _Server(MinecraftStub(self._channel))
+        self._config = _ChannelConfig.build(
+            host,
+            port,
+            compression=compression,
+            keepalive=keepalive,
+            max_message_size=max_message_size,
+            http2_window=http2_window,
+            options=channel_options,
+        )
+        self._stats_interceptor = _StatsInterceptor() if instrument else None
+        self._channel = self._config.channel()
+        stub = _PolicyStub(self._intercepted(self._channel), timeout, retry)
+        # the first channel is kept for event streams, calls are spread over the others
+        self._pool_channels = [self._config.channel(dedicated=True) for _ in range(channels - 1)]
+        pool = None
+        if self._pool_channels:
+            stubs, counters = [], []
+            for channel in self._pool_channels:
+                if channel_selection == "least_loaded":
+                    counters.append(_InFlightInterceptor())
+                    channel = grpc.intercept_channel(channel, counters[-1])
+                stubs.append(_PolicyStub(self._intercepted(channel), timeout, retry))
+            pool = _StubPool(stubs, counters or None)
+        server = _Server(stub, max_message_size or MAX_MESSAGE_SIZE, pool)
         super().__init__(server)
-        self._event_handler = EventHandler(server)
+        self._event_handler = EventHandler(server, self._config if multiplex_events else None)
+        if metadata_cache:
+            directory = _default_directory() if metadata_cache is True else Path(metadata_cache)
+            try:
+                _warm_server(server, directory, self._config.target)
+            except BaseException:
+                self._cleanup()  # do not leak the connections of a failed constructor
+                raise
 
         # deprecated functions
         self.stopEventPollingAndClearCallbacks = deprecated(
@@ -127,15 +233,110 @@ class Minecraft(_DefaultWorld, _SharedBase, _HasServer):
 
     def _cleanup(self) -> None:
         logger.debug("Minecraft: _cleanup: called, closing channel...")
-        old_handler, self._event_handler = self._event_handler, None
-        old_handler._cleanup()
-        self._channel.close()
+        # no handler if already cleaned up or the constructor failed
+        old_handler, self._event_handler = getattr(self, "_event_handler", None), None
+        if old_handler is not None:
+            old_handler._cleanup()
+            self._channel.close()
+            for channel in self._pool_channels:
+                channel.close()
         logger.debug("Minecraft: _cleanup: done")
 
     def __del__(self) -> None:
         logger.debug("Minecraft: __del__: called")
         self._cleanup()
 
+    def _intercepted(self, channel: grpc.Channel) -> grpc.Channel:
+        if self._stats_interceptor is None:
+            return channel
+        return grpc.intercept_channel(channel, self._stats_interceptor)
+
+    def deadline(self, seconds: float) -> AbstractContextManager[None]:
+        """Context manager limiting the time all calls to the server within the block may take together to `seconds`.
+        A call that is still running when the time is up fails with a :class:`grpc.RpcError` (``DEADLINE_EXCEEDED``).
+        Deadlines apply to the calls of the current thread only, nested deadlines can only shorten the outer one.
+
+        .. code-block:: python
+
+           with mc.deadline(0.5):
+               players = mc.getPlayerList()
+               blocks = [mc.getBlock(p.pos.down()) for p in players]
+
+        :param seconds: the time in seconds the calls may take at most
+        :type seconds: float
+        :return: the context manager
+        :rtype: AbstractContextManager[None]
+        """
+        return deadline(seconds)
+
+    def _interceptor(self) -> _StatsInterceptor:
+        if self._stats_interceptor is None:
+            raise RuntimeError(
+                "Statistics are not recorded, construct Minecraft with instrument=True"
+            )
+        return self._stats_interceptor
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of all calls made to the server since the connection was opened or :func:`resetStats` was called.
+        Only available if constructed with ``instrument=True``.
+
+        The statistics are keyed by the name of the called method (e.g. ``getBlock``) and contain:
+
+        * ``calls``: the number of started calls
+        * ``errors``: the number of failed calls by gRPC or plugin status code name, e.g. ``{"UNAVAILABLE": 2}``
+        * ``in_flight``: the number of calls currently waiting for a response (or open event streams)
+        * ``latency_avg`` and ``latency_max``: the latency of finished calls in seconds
+        * ``latency_histogram``: the cumulative number of finished calls with a latency of at most the key in seconds
+        * ``request_bytes`` and ``response_bytes``: the total size of the serialized requests and responses
+
+        .. code-block:: python
+
+           mc = Minecraft(instrument=True)
+           mc.setBlockCube("stone", Vec3(0, 0, 0), Vec3(10, 10, 10))
+           print(mc.stats()["setBlockCube"]["latency_avg"])
+
+        .. note::
+
+           Events received with ``multiplex_events=True`` use their own connection and are not recorded.
+
+        :raises RuntimeError: if the instance was not constructed with ``instrument=True``
+        :return: the statistics by method name
+        :rtype: dict[str, dict[str, Any]]
+        """
+        return self._interceptor().stats()
+
+    def resetStats(self) -> None:
+        """Reset the statistics returned by :func:`stats`, calls currently in flight remain counted as such.
+
+        :raises RuntimeError: if the instance was not constructed with ``instrument=True``
+        """
+        self._interceptor().reset()
+
+    def addStatsExporter(self, exporter: Callable[[RpcRecord], None]) -> None:
+        """Add a function that is called with an :class:`~mcpq._instrumentation.RpcRecord` every time a call to the server finished,
+        e.g., to feed the latencies into Prometheus or your own logging.
+        The function is called on the thread that finished the call and should return quickly.
+
+        .. code-block:: python
+
+           mc = Minecraft(instrument=True)
+           mc.addStatsExporter(lambda record: print(record.method, record.latency))
+
+        :param exporter: the function called with every finished call
+        :type exporter: Callable[[RpcRecord], None]
+        :raises RuntimeError: if the instance was not constructed with ``instrument=True``
+        """
+        self._interceptor().add_exporter(exporter)
+
+    def removeStatsExporter(self, exporter: Callable[[RpcRecord], None]) -> None:
+        """Remove a function added with :func:`addStatsExporter`, does nothing if it was not added.
+
+        :param exporter: the function to remove
+        :type exporter: Callable[[RpcRecord], None]
+        :raises RuntimeError: if the instance was not constructed with ``instrument=True``
+        """
+        self._interceptor().remove_exporter(exporter)
+
     @property
     def host(self) -> str:
         """The Minecraft server host address this instance is connected to, default is ``localhost``."""
@@ -143,9 +344,14 @@ class Minecraft(_DefaultWorld, _SharedBase, _HasServer):
 
     @property
     def port(self) -> int:
-        """The Minecraft server port this instance is connected to, default is ``1789``."""
+        """The Minecraft server port this instance is connected to, default is ``1789``, ignored if :attr:`host` is a target such as ``unix:/path``."""
         return self._addr[1]
 
+    @property
+    def target(self) -> str:
+        """The gRPC target this instance is connected to, e.g., ``localhost:1789`` or ``unix:/tmp/mcpq.sock``."""
+        return self._config.target
+
     @property
     def Block(self) -> type[Block]:
         """Alias for constructing :class:`~mcpq.nbt.Block`, e.g., ``mc.Block("acacia_stairs")``"""
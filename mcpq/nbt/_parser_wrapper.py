@@ -1,6 +1,8 @@
+from ..tracing import traced
 from ._types import ComponentData, NbtCompound, NbtType
 
 
+@traced("nbt.parse_snbt")
 def parse_snbt(text: str) -> NbtType:
     from ._parser import parse_snbt
 
@@ -9,6 +11,7 @@ def parse_snbt(text: str) -> NbtType:
     return parse_snbt(text)
 
 
+@traced("nbt.parse_component")
 def parse_component(text: str) -> ComponentData:
     from ._parser import parse_component
 
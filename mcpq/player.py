@@ -8,6 +8,7 @@ from ._proto import minecraft_pb2 as pb
 from .entity import Entity
 from .exception import raise_on_error
 from .nbt import NBT, Block, EntityType
+from .tracing import traced
 from .vec3 import Vec3
 
 CACHE_PLAYER_TIME = 0.2
@@ -100,14 +101,15 @@ class Player(Entity, _SharedBase, _HasServer):
 
     def _inject_update(self, pb_player: pb.Player) -> bool:
         assert pb_player.name == self.name
-        self._world = self._server.get_world_by_name(pb_player.location.world.name)
-        self._pos = Vec3(
-            pb_player.location.pos.x, pb_player.location.pos.y, pb_player.location.pos.z
-        )
-        self._pitch = pb_player.location.orientation.pitch
-        self._yaw = pb_player.location.orientation.yaw
-        self._update_ts = time.time()
-        self._loaded = True
+        world = self._server.get_world_by_name(pb_player.location.world.name)
+        pos = Vec3(pb_player.location.pos.x, pb_player.location.pos.y, pb_player.location.pos.z)
+        with self._state_lock:
+            self._world = world
+            self._pos = pos
+            self._pitch = pb_player.location.orientation.pitch
+            self._yaw = pb_player.location.orientation.yaw
+            self._update_ts = time.time()
+            self._loaded = True
         return True
 
     def _set_entity_loc(self, entity_loc: pb.EntityLocation) -> None:
@@ -120,6 +122,7 @@ class Player(Entity, _SharedBase, _HasServer):
         if not ALLOW_OFFLINE_PLAYER_OPS or response.code != pb.PLAYER_NOT_FOUND:
             raise_on_error(response)
 
+    @traced("Player._update")
     def _update(self, allow_offline: bool = ALLOW_OFFLINE_PLAYER_OPS) -> bool:
         response = self._server.stub.getPlayers(
             pb.PlayerRequest(names=[self.name], withLocations=True)
@@ -145,6 +148,7 @@ class Player(Entity, _SharedBase, _HasServer):
         raise AttributeError("Remove cannot be used on a Player")
 
     # functions only for players
+    @traced("Player.gamemode")
     def gamemode(self, mode: Literal["adventure", "creative", "spectator", "survival"]) -> None:
         """Set the players gamemode to `mode`
 
@@ -169,6 +173,7 @@ class Player(Entity, _SharedBase, _HasServer):
         """Equivalent to :func:`gamemode` with argument ``"survival"``"""
         self.gamemode("survival")
 
+    @traced("Player.giveItems")
     def giveItems(self, item: str | Block, amount: int = 1, *, nbt: NBT | None = None) -> None:
         """Put `amount` of certain `item` into the player's inventory.
         The item can be a string or a :class:`~mcpq.nbt.Block` with component data:
@@ -192,6 +197,7 @@ class Player(Entity, _SharedBase, _HasServer):
         else:
             self.runCommand(f"give @s {item}{nbt} {amount}")
 
+    @traced("Player.postToChat")
     def postToChat(self, *objects, sep: str = " ") -> None:
         """Print `objects` in chat separated by `sep` and *only visible to player*.
         All objects are converted to strings using :func:`str()` first.
@@ -0,0 +1,9 @@
+from .eventrecording import EventRecorder, EventReplayer, read_events
+from .fakeserver import FakeServer
+
+__all__ = [
+    "EventRecorder",
+    "EventReplayer",
+    "FakeServer",
+    "read_events",
+]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+from queue import Empty, Queue
+from typing import Iterator
+
+import grpc
+
+from .._proto import minecraft_pb2 as pb
+from .._proto.minecraft_pb2_grpc import MinecraftServicer
+
+STREAM_CHECK_INTERVAL: float = 0.05  # seconds between checks whether a stream's client is gone
+
+
+class _EventStreamServicer(MinecraftServicer):
+    """Servicer implementing the event streams of the server, events are sent to all streams of their type with :func:`publish`."""
+
+    def __init__(self) -> None:
+        self._streams_lock = threading.Condition()
+        self._streams: dict[int, list[Queue[pb.Event]]] = {}
+
+    def getEventStream(
+        self, request: pb.EventStreamRequest, context: grpc.ServicerContext
+    ) -> Iterator[pb.Event]:
+        queue: Queue[pb.Event] = Queue()
+        with self._streams_lock:
+            self._streams.setdefault(request.eventType, []).append(queue)
+            self._streams_lock.notify_all()
+        try:
+            while context.is_active():
+                try:
+                    yield queue.get(timeout=STREAM_CHECK_INTERVAL)
+                except Empty:
+                    pass
+        finally:
+            with self._streams_lock:
+                self._streams[request.eventType].remove(queue)
+                self._streams_lock.notify_all()
+
+    def subscribers(self, event_type: int | None = None) -> int:
+        with self._streams_lock:
+            return self._subscribers(event_type)
+
+    def _subscribers(self, event_type: int | None) -> int:
+        if event_type is None:
+            return sum(map(len, self._streams.values()))
+        return len(self._streams.get(event_type, []))
+
+    def wait_for_subscribers(
+        self, count: int = 1, event_type: int | None = None, timeout: float | None = None
+    ) -> bool:
+        with self._streams_lock:
+            return self._streams_lock.wait_for(
+                lambda: self._subscribers(event_type) >= count, timeout
+            )
+
+    def publish(self, event: pb.Event) -> int:
+        with self._streams_lock:
+            queues = self._streams.get(event.type, [])
+            for queue in queues:
+                queue.put(event)
+            return len(queues)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import time
+from typing import BinaryIO, Iterator
+
+from .. import logger
+from .._proto import minecraft_pb2 as pb
+from ..events import EventHandler, SingleEventHandler
+from .fakeserver import FakeServer
+
+__all__ = ["EventRecorder", "EventReplayer", "read_events"]
+
+_MAGIC = b"MCPQEVT1"
+_HEADER = struct.Struct("<8sd")  # magic, wall clock time the recording started at
+_RECORD = struct.Struct("<dI")  # seconds since start of recording, length of serialized event
+
+
+def read_events(path: str | os.PathLike) -> Iterator[tuple[float, pb.Event]]:
+    """Read the events of a recording created by :class:`EventRecorder`.
+
+    :param path: the path of the recording
+    :type path: str | os.PathLike
+    :raises ValueError: if the file is not a recording or is truncated
+    :yield: the time in seconds since the start of the recording the event was received at and the raw event
+    :rtype: Iterator[tuple[float, pb.Event]]
+    """
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size or _HEADER.unpack(header)[0] != _MAGIC:
+            raise ValueError(f"File {path} is not an event recording")
+        while header := file.read(_RECORD.size):
+            if len(header) != _RECORD.size:
+                raise ValueError(f"Event recording {path} is truncated")
+            offset, length = _RECORD.unpack(header)
+            data = file.read(length)
+            if len(data) != length:
+                raise ValueError(f"Event recording {path} is truncated")
+            yield offset, pb.Event.FromString(data)
+
+
+class EventRecorder:
+    """Records the raw events received by an :class:`~mcpq.events.EventHandler` or :class:`~mcpq.events.SingleEventHandler`
+    together with the time they were received at into a compact file, which can be replayed with :class:`EventReplayer`.
+
+    Recording does not consume the events, they can still be polled or handled by callbacks as usual.
+    The events of a type are received from the moment they are recorded, so that they are captured even if they are never polled.
+
+    .. code-block:: python
+
+       from mcpq import Minecraft
+       from mcpq.testing import EventRecorder
+
+       mc = Minecraft()
+       with EventRecorder("session.events") as recorder:
+           recorder.record(mc.events)  # record all event types
+           time.sleep(60)
+       print(f"Recorded {recorder.count} events")
+
+    :param path: the path of the file the events are written to, an existing file is overwritten
+    :type path: str | os.PathLike
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, time.time()))
+        self._start = time.perf_counter()
+        self._count = 0
+        self._handlers: list[SingleEventHandler] = []
+
+    def __enter__(self) -> EventRecorder:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def count(self) -> int:
+        "The number of events recorded so far"
+        return self._count
+
+    def _write(self, rpc_event: pb.Event) -> None:
+        data = rpc_event.SerializeToString()
+        with self._lock:
+            if self._file is None:
+                return
+            offset = time.perf_counter() - self._start
+            self._file.write(_RECORD.pack(offset, len(data)))
+            self._file.write(data)
+            self._count += 1
+
+    def record(self, events: EventHandler | SingleEventHandler) -> EventRecorder:
+        """Start recording all event types of `events` if it is an :class:`~mcpq.events.EventHandler`,
+        or only the one event type if it is a :class:`~mcpq.events.SingleEventHandler`.
+
+        :param events: the event handler to record, e.g., ``mc.events`` or ``mc.events.chat``
+        :type events: EventHandler | SingleEventHandler
+        :return: the recorder itself
+        :rtype: EventRecorder
+        """
+        if isinstance(events, EventHandler):
+            handlers = [
+                events.player_join,
+                events.player_leave,
+                events.player_death,
+                events.chat,
+                events.block_hit,
+                events.projectile_hit,
+            ]
+        elif isinstance(events, SingleEventHandler):
+            handlers = [events]
+        else:
+            raise TypeError("Argument events must be of type EventHandler or SingleEventHandler")
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("Recorder was already stopped")
+            for handler in handlers:
+                if handler not in self._handlers:
+                    handler._taps = handler._taps + [self._write]
+                    self._handlers.append(handler)
+        for handler in handlers:
+            handler._have_thread()
+        return self
+
+    def stop(self) -> None:
+        "Stop recording and close the file, the event types continue to be received"
+        with self._lock:
+            for handler in self._handlers:
+                handler._taps = [tap for tap in handler._taps if tap != self._write]
+            self._handlers = []
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class EventReplayer:
+    """Replays a recording created by :class:`EventRecorder` on a local :class:`FakeServer`.
+    Connecting to that server with :class:`~mcpq.Minecraft` lets the recorded events run through
+    the normal receiving and callback path, which makes benchmarks and tests of event driven programs reproducible.
+
+    .. code-block:: python
+
+       from mcpq import Minecraft
+       from mcpq.testing import EventReplayer
+
+       with EventReplayer("session.events") as replayer:
+           mc = Minecraft("localhost", replayer.port)
+           mc.events.chat.register(my_bot)
+           replayer.wait_for_subscribers(1)
+           replayer.play(speed=None)  # as fast as possible
+
+    :param path: the path of the recording
+    :type path: str | os.PathLike
+    :param port: the port of the stand-in server, if 0 pick any free port, defaults to 0
+    :type port: int, optional
+    """
+
+    def __init__(self, path: str | os.PathLike, port: int = 0) -> None:
+        self._events = list(read_events(path))
+        self._server = FakeServer(port)
+
+    def __enter__(self) -> EventReplayer:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def port(self) -> int:
+        "The port of the local stand-in server"
+        return self._server.port
+
+    @property
+    def server(self) -> FakeServer:
+        "The local stand-in server, e.g., to add players the events refer to"
+        return self._server
+
+    def wait_for_subscribers(
+        self, count: int = 1, event_type: int | None = None, timeout: float | None = 5.0
+    ) -> bool:
+        """Wait until at least `count` event streams (of `event_type` if given) are open.
+        Streams are opened after the first call to a receiving function such as :func:`poll` or :func:`register`,
+        so to not miss any events, wait for them before calling :func:`play`.
+
+        :param count: the number of open streams to wait for, defaults to 1
+        :type count: int, optional
+        :param event_type: only count the streams of this event type (e.g. ``pb.EVENT_CHAT_MESSAGE``), defaults to None
+        :type event_type: int | None, optional
+        :param timeout: time in seconds to wait at most, if None wait indefinitely, defaults to 5.0
+        :type timeout: float | None, optional
+        :return: whether the streams were open before `timeout`
+        :rtype: bool
+        """
+        return self._server.wait_for_subscribers(count, event_type, timeout)
+
+    def play(self, speed: float | None = 1.0) -> int:
+        """Send the recorded events to all open streams of their type and block until all were sent.
+        Events of types that no stream is open for are skipped.
+
+        :param speed: the factor of the original speed to replay the events at, if None replay as fast as possible, defaults to 1.0
+        :type speed: float | None, optional
+        :return: the number of events that were sent to at least one stream
+        :rtype: int
+        """
+        sent = self._server.play(self._events, speed)
+        logger.debug(f"EventReplayer: play: sent {sent} of {len(self._events)} events")
+        return sent
+
+    def close(self) -> None:
+        "Stop the local stand-in server"
+        self._server.close()
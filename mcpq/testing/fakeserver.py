@@ -0,0 +1,623 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, get_args
+
+import grpc
+
+from .._proto import minecraft_pb2 as pb
+from .._proto.minecraft_pb2_grpc import add_MinecraftServicer_to_server
+from .._types import COLOR
+from ._eventstream import _EventStreamServicer
+
+__all__ = ["FakeServer"]
+
+MIN_HEIGHT: int = -64  # height returned by getHeight for columns without any blocks
+
+_COLORED = ["wool", "concrete", "concrete_powder", "terracotta", "stained_glass", "carpet", "bed"]
+_BLOCKS = [
+    "stone", "granite", "diorite", "andesite", "deepslate", "dirt", "grass_block", "cobblestone",
+    "bedrock", "sand", "gravel", "clay", "terracotta", "glass", "obsidian", "oak_log",
+    "spruce_log", "birch_log", "oak_planks", "spruce_planks", "birch_planks", "acacia_planks",
+    "oak_stairs", "acacia_stairs", "stone_bricks", "bricks", "gold_block", "iron_block",
+    "diamond_block", "emerald_block", "redstone_block", "lapis_block", "coal_block", "tnt",
+    "furnace", "chest", "crafting_table", "oak_sign", "torch", "water", "lava", "ice", "snow_block",
+]  # fmt: skip
+_BLOCKS += [f"{color}_{kind}" for kind in _COLORED for color in get_args(COLOR)]
+_ITEMS = ["diamond", "iron_ingot", "stick", "arrow", "iron_sword", "bow", "apple", "bread"]
+_NOT_SOLID = ("air", "water", "lava", "torch", "sign", "carpet")
+_BURNABLE = ("log", "planks", "stairs", "wool", "carpet", "bed", "chest", "crafting_table")
+
+_SPAWNABLE = [
+    "armor_stand", "arrow", "bat", "chicken", "cow", "creeper", "horse", "pig", "sheep",
+    "skeleton", "spider", "villager", "wolf", "zombie",
+]  # fmt: skip
+_NOT_SPAWNABLE = ["falling_block", "item", "player"]
+
+
+def _material(key: str) -> pb.MaterialResponse.Material:
+    is_air = key.endswith("air")
+    is_item = key in _ITEMS
+    burnable = any(key.endswith(suffix) for suffix in _BURNABLE)
+    return pb.MaterialResponse.Material(
+        key=key,
+        isAir=is_air,
+        isBlock=not is_item,
+        isBurnable=burnable,
+        isEdible=key in ("apple", "bread"),
+        isFlammable=burnable,
+        isFuel=burnable or key in ("coal_block", "stick", "bow"),
+        isInteractable=key in ("furnace", "chest", "crafting_table", "oak_sign")
+        or key.endswith(("stairs", "bed")),
+        isItem=not is_air,
+        isOccluding=not is_item and not any(key.endswith(end) for end in _NOT_SOLID + ("glass",)),
+        isSolid=not is_item and not any(key.endswith(end) for end in _NOT_SOLID),
+        hasGravity=key in ("sand", "gravel") or key.endswith("concrete_powder"),
+    )
+
+
+def _strip_namespace(key: str) -> str:
+    return key[10:] if key.startswith("minecraft:") else key
+
+
+@dataclass
+class _FakeWorld:
+    name: str
+    key: str
+    pvp: bool = False
+
+    def __post_init__(self) -> None:
+        # sparse block store, columns by (x, z) then blocks by y as (type, data), air is not stored
+        self.columns: dict[tuple[int, int], dict[int, tuple[str, str]]] = {}
+
+
+@dataclass
+class _FakeEntity:
+    id: str
+    type: str
+    world: _FakeWorld
+    pos: tuple[float, float, float]
+    yaw: float = 0.0
+    pitch: float = 0.0
+
+
+def _rpc(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self: FakeServer, request, context):
+        self._before_call(func.__name__, context)
+        with self._lock:
+            return func(self, request, context)
+
+    return wrapper
+
+
+class FakeServer(_EventStreamServicer):
+    """In-process stand-in for a Minecraft server with the MCPQ plugin, for tests and benchmarks
+    that should run without network or Minecraft.
+
+    The server implements all functions of the protocol on an in-memory state:
+    a sparse block store per world, entities, players, worlds, materials and entity types.
+    Events are sent to the connected clients with :func:`publish` or scripted with :func:`play`.
+    Commands are not executed but recorded in :attr:`commands`, and chat messages in :attr:`chat`.
+
+    .. code-block:: python
+
+       from mcpq import Minecraft, Vec3
+       from mcpq.testing import FakeServer
+
+       with FakeServer(latency=0.001) as server:  # every call takes at least 1ms
+           server.add_player("Steve", Vec3(0, 64, 0))
+           mc = Minecraft("localhost", server.port)
+           mc.setBlockCube("stone", Vec3(0, 0, 0), Vec3(9, 9, 9))
+           assert server.get_block(Vec3(5, 5, 5)) == "stone"
+           assert server.calls["setBlockCube"] == 1
+
+    :param port: the port to listen on, if 0 pick any free port, defaults to 0
+    :type port: int, optional
+    :param latency: artificial delay in seconds added to every call, defaults to 0.0
+    :type latency: float, optional
+    :param workers: the number of threads handling calls, open event streams also occupy a thread each, defaults to 32
+    :type workers: int, optional
+    :param mc_version: the Minecraft version reported by the server, defaults to "1.21.4"
+    :type mc_version: str, optional
+    :param unix_socket: if given, additionally listen on a Unix domain socket at this path, see :attr:`unix_target`, defaults to None
+    :type unix_socket: str | None, optional
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        workers: int = 32,
+        mc_version: str = "1.21.4",
+        unix_socket: str | None = None,
+    ) -> None:
+        super().__init__()
+        self._lock = threading.RLock()
+        #: Artificial delay in seconds added to every call.
+        self.latency: float = latency
+        #: Artificial delay in seconds for specific functions, e.g., ``{"getBlock": 0.01}``, overrides :attr:`latency`.
+        self.method_latency: dict[str, float] = {}
+        #: Faults of the next calls per function name in order, either an additional delay in seconds or a status code the call fails with,
+        #: e.g., ``{"getBlock": [grpc.StatusCode.UNAVAILABLE, 0.5]}`` lets the next call fail and delays the one after.
+        self.faults: dict[str, list[float | grpc.StatusCode]] = {}
+        #: Number of calls received per function name, e.g., ``server.calls["setBlocks"]``.
+        self.calls: Counter[str] = Counter()
+        #: Number of calls received per client connection (address and port of the peer), e.g., to check how calls were spread.
+        self.peers: Counter[str] = Counter()
+        #: Commands received by ``runCommand`` or ``runCommandBlocking`` in order.
+        self.commands: list[str] = []
+        #: Function returning the output of a blocking command, returns empty output if None.
+        self.command_output: Callable[[str], str] | None = None
+        #: Chat messages received by ``postToChat`` in order as (receiving player name or None, message).
+        self.chat: list[tuple[str | None, str]] = []
+        self._mc_version = mc_version
+        self._worlds = [
+            _FakeWorld("world", "minecraft:overworld"),
+            _FakeWorld("world_nether", "minecraft:the_nether"),
+            _FakeWorld("world_the_end", "minecraft:the_end"),
+        ]
+        self._materials = {
+            key: _material(key) for key in ["air", "cave_air", "void_air"] + _BLOCKS + _ITEMS
+        }
+        self._entity_types = {key: True for key in _SPAWNABLE} | {
+            key: False for key in _NOT_SPAWNABLE
+        }
+        self._entities: dict[str, _FakeEntity] = {}
+        self._players: dict[str, _FakeEntity] = {}
+        self._entity_ids = 0
+        self._server = grpc.server(ThreadPoolExecutor(max_workers=workers))
+        add_MinecraftServicer_to_server(self, self._server)
+        self._port = self._server.add_insecure_port(f"localhost:{port}")
+        self._unix_target = None if unix_socket is None else f"unix:{unix_socket}"
+        if self._unix_target is not None:
+            self._server.add_insecure_port(self._unix_target)
+        self._server.start()
+
+    def __enter__(self) -> FakeServer:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def port(self) -> int:
+        "The port the server listens on"
+        return self._port
+
+    @property
+    def unix_target(self) -> str | None:
+        "The target of the Unix domain socket the server listens on, e.g., ``Minecraft(server.unix_target)``, or None"
+        return self._unix_target
+
+    def close(self) -> None:
+        "Stop the server, open event streams are closed"
+        self._server.stop(None)
+
+    def _before_call(self, method: str, context: grpc.ServicerContext) -> None:
+        with self._lock:
+            self.calls[method] += 1
+            self.peers[context.peer()] += 1
+            faults = self.faults.get(method)
+            fault = faults.pop(0) if faults else None
+        delay = self.method_latency.get(method, self.latency)
+        if isinstance(fault, grpc.StatusCode):
+            context.abort(fault, f"Injected fault in {method}")
+        elif fault is not None:
+            delay += fault
+        if delay > 0:
+            time.sleep(delay)
+
+    # state helpers
+
+    def _world(self, world: pb.World | str | None) -> _FakeWorld | None:
+        name = world.name if isinstance(world, pb.World) else world
+        if not name:
+            return self._worlds[0]  # default world
+        for fake_world in self._worlds:
+            if fake_world.name == name:
+                return fake_world
+        return None
+
+    def _set(self, fake_world: _FakeWorld, info: pb.BlockInfo, positions: Iterable[tuple]) -> None:
+        block_type = _strip_namespace(info.blockType)
+        columns = fake_world.columns
+        if self._materials[block_type].isAir:
+            for x, y, z in positions:
+                column = columns.get((x, z))
+                if column is not None:
+                    column.pop(y, None)
+        else:
+            block = (block_type, info.blockData)
+            for x, y, z in positions:
+                column = columns.get((x, z))
+                if column is None:
+                    column = columns[(x, z)] = {}
+                column[y] = block
+
+    def _check_block(self, info: pb.BlockInfo) -> pb.Status | None:
+        material = self._materials.get(_strip_namespace(info.blockType))
+        if material is None or not material.isBlock:
+            return pb.Status(code=pb.BLOCK_TYPE_NOT_FOUND, extra=info.blockType)
+        return None
+
+    def _next_id(self) -> str:
+        self._entity_ids += 1
+        return str(uuid.UUID(int=self._entity_ids))
+
+    @staticmethod
+    def _pb_location(entity: _FakeEntity) -> pb.EntityLocation:
+        x, y, z = entity.pos
+        return pb.EntityLocation(
+            world=pb.World(name=entity.world.name, info=pb.WorldInfo(key=entity.world.key)),
+            pos=pb.Vec3f(x=x, y=y, z=z),
+            orientation=pb.EntityOrientation(yaw=entity.yaw, pitch=entity.pitch),
+        )
+
+    def _move(self, entity: _FakeEntity, location: pb.EntityLocation) -> pb.Status:
+        if location.HasField("world"):
+            fake_world = self._world(location.world)
+            if fake_world is None:
+                return pb.Status(code=pb.WORLD_NOT_FOUND, extra=location.world.name)
+            entity.world = fake_world
+        if location.HasField("pos"):
+            entity.pos = (location.pos.x, location.pos.y, location.pos.z)
+        if location.HasField("orientation"):
+            entity.yaw, entity.pitch = location.orientation.yaw, location.orientation.pitch
+        return pb.Status()
+
+    def get_block(self, pos, world: str | None = None) -> str:
+        """The block at `pos` in the world with name `world` (or the default world) including block data.
+
+        :param pos: the position of the block, anything that can be unpacked into x, y and z
+        :param world: the name of the world, e.g., ``"world_nether"``, defaults to the default world
+        :type world: str | None, optional
+        :return: the block type and data, e.g., ``"furnace[lit=true]"``, or ``"air"``
+        :rtype: str
+        """
+        x, y, z = map(int, pos)
+        with self._lock:
+            block_type, data = self._world(world).columns.get((x, z), {}).get(y, ("air", ""))
+        return block_type + data
+
+    def set_block(self, block: str, pos, world: str | None = None) -> None:
+        """Set the block at `pos` in the world with name `world` (or the default world) without a call from a client.
+
+        :param block: the block type with optional block data, e.g., ``"furnace[lit=true]"``
+        :type block: str
+        :param pos: the position of the block, anything that can be unpacked into x, y and z
+        :param world: the name of the world, e.g., ``"world_nether"``, defaults to the default world
+        :type world: str | None, optional
+        """
+        block_type, _, data = block.partition("[")
+        info = pb.BlockInfo(blockType=block_type, blockData="[" + data if data else "")
+        if self._check_block(info) is not None:
+            raise ValueError(f"Unknown block type '{block_type}'")
+        with self._lock:
+            self._set(self._world(world), info, [tuple(map(int, pos))])
+
+    def block_count(self, world: str | None = None) -> int:
+        "The number of non-air blocks in the world with name `world` (or the default world)"
+        with self._lock:
+            return sum(map(len, self._world(world).columns.values()))
+
+    def add_player(self, name: str, pos=(0.0, 0.0, 0.0), world: str | None = None) -> None:
+        """Let a player with `name` join the server at `pos`, which also sends a :class:`~mcpq.events.PlayerJoinEvent`.
+
+        :param name: the name of the player
+        :type name: str
+        :param pos: the position of the player, anything that can be unpacked into x, y and z, defaults to the origin
+        :param world: the name of the world, e.g., ``"world_nether"``, defaults to the default world
+        :type world: str | None, optional
+        """
+        with self._lock:
+            self._players[name] = _FakeEntity(
+                self._next_id(), "player", self._world(world), tuple(map(float, pos))
+            )
+        self.publish(
+            pb.Event(
+                type=pb.EVENT_PLAYER_JOIN,
+                playerMsg=pb.Event.PlayerAndMessage(trigger=pb.Player(name=name)),
+            )
+        )
+
+    def remove_player(self, name: str) -> None:
+        "Let the player with `name` leave the server, which also sends a :class:`~mcpq.events.PlayerLeaveEvent`"
+        with self._lock:
+            del self._players[name]
+        self.publish(
+            pb.Event(
+                type=pb.EVENT_PLAYER_LEAVE,
+                playerMsg=pb.Event.PlayerAndMessage(trigger=pb.Player(name=name)),
+            )
+        )
+
+    def add_entity(self, type: str, pos=(0.0, 0.0, 0.0), world: str | None = None) -> str:
+        """Add an entity of `type` at `pos` without a call from a client, also non-spawnable types are allowed.
+
+        :param type: the entity type, e.g., ``"cow"`` or ``"item"``
+        :type type: str
+        :param pos: the position of the entity, anything that can be unpacked into x, y and z, defaults to the origin
+        :param world: the name of the world, e.g., ``"world_nether"``, defaults to the default world
+        :type world: str | None, optional
+        :return: the id of the new entity
+        :rtype: str
+        """
+        with self._lock:
+            entity = _FakeEntity(
+                self._next_id(), _strip_namespace(type), self._world(world), tuple(map(float, pos))
+            )
+            self._entities[entity.id] = entity
+        return entity.id
+
+    def remove_entity(self, entity_id: str) -> None:
+        "Remove the entity with id `entity_id`"
+        with self._lock:
+            del self._entities[entity_id]
+
+    def play(
+        self, events: Iterable[pb.Event | tuple[float, pb.Event]], speed: float | None = None
+    ) -> int:
+        """Send a script of events to all connected streams of their type and block until all were sent.
+        Events can be given with the time in seconds they should be sent at after the start, e.g., ``(0.5, event)``.
+
+        :param events: the events or tuples of time and event to send in order
+        :type events: Iterable[pb.Event | tuple[float, pb.Event]]
+        :param speed: the factor of the given times to send the events at, if None send as fast as possible, defaults to None
+        :type speed: float | None, optional
+        :return: the number of events that were sent to at least one stream
+        :rtype: int
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("The speed must be a positive number or None")
+        sent = 0
+        start = time.perf_counter()
+        for item in events:
+            offset, event = item if isinstance(item, tuple) else (0.0, item)
+            if speed is not None:
+                delay = start + offset / speed - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            if self.publish(event):
+                sent += 1
+        return sent
+
+    # servicer
+
+    @_rpc
+    def getServerInfo(self, request, context) -> pb.ServerInfoResponse:
+        return pb.ServerInfoResponse(
+            mcVersion=self._mc_version,
+            mcpqVersion="2.0",
+            serverVersion=f"FakeServer (MC: {self._mc_version})",
+        )
+
+    @_rpc
+    def getMaterials(self, request, context) -> pb.MaterialResponse:
+        if request.only_keys:
+            materials = [pb.MaterialResponse.Material(key=key) for key in self._materials]
+        else:
+            materials = list(self._materials.values())
+        return pb.MaterialResponse(materials=materials)
+
+    @_rpc
+    def getEntityTypes(self, request, context) -> pb.EntityTypeResponse:
+        return pb.EntityTypeResponse(
+            types=[
+                pb.EntityTypeResponse.EntityType(
+                    key=key, isSpawnable=False if request.only_keys else spawnable
+                )
+                for key, spawnable in self._entity_types.items()
+            ]
+        )
+
+    def _command(self, request) -> str:
+        self.commands.append(request.command)
+        if request.output and self.command_output is not None:
+            return self.command_output(request.command)
+        return ""
+
+    @_rpc
+    def runCommand(self, request, context) -> pb.Status:
+        self._command(request)
+        return pb.Status()
+
+    @_rpc
+    def runCommandWithOptions(self, request, context) -> pb.CommandResponse:
+        return pb.CommandResponse(output=self._command(request))
+
+    @_rpc
+    def postToChat(self, request, context) -> pb.Status:
+        if request.HasField("player"):
+            if request.player.name not in self._players:
+                return pb.Status(code=pb.PLAYER_NOT_FOUND, extra=request.player.name)
+            self.chat.append((request.player.name, request.message))
+        else:
+            self.chat.append((None, request.message))
+        return pb.Status()
+
+    @_rpc
+    def accessWorlds(self, request, context) -> pb.WorldResponse:
+        worlds = []
+        for world in request.worlds or [pb.World(name=w.name) for w in self._worlds]:
+            fake_world = self._world(world)
+            if fake_world is None or not world.name:
+                return pb.WorldResponse(
+                    status=pb.Status(code=pb.WORLD_NOT_FOUND, extra=world.name)
+                )
+            if world.HasField("info"):
+                fake_world.pvp = world.info.pvp
+            worlds.append(
+                pb.World(
+                    name=fake_world.name,
+                    info=pb.WorldInfo(key=fake_world.key, pvp=fake_world.pvp),
+                )
+            )
+        return pb.WorldResponse(worlds=worlds)
+
+    @_rpc
+    def getHeight(self, request, context) -> pb.HeightResponse:
+        fake_world = self._world(request.world)
+        if fake_world is None:
+            return pb.HeightResponse(
+                status=pb.Status(code=pb.WORLD_NOT_FOUND, extra=request.world.name)
+            )
+        column = fake_world.columns.get((request.x, request.z))
+        y = max(column) if column else MIN_HEIGHT
+        block_type, _ = column[y] if column else ("void_air", "")
+        return pb.HeightResponse(
+            block=pb.Block(
+                info=pb.BlockInfo(blockType=block_type),
+                world=pb.World(name=fake_world.name),
+                pos=pb.Vec3(x=request.x, y=y, z=request.z),
+            )
+        )
+
+    @_rpc
+    def getBlock(self, request, context) -> pb.BlockResponse:
+        fake_world = self._world(request.world)
+        if fake_world is None:
+            return pb.BlockResponse(
+                status=pb.Status(code=pb.WORLD_NOT_FOUND, extra=request.world.name)
+            )
+        pos = request.pos
+        block_type, data = fake_world.columns.get((pos.x, pos.z), {}).get(pos.y, ("air", ""))
+        if request.withData:
+            return pb.BlockResponse(info=pb.BlockInfo(blockType=block_type, blockData=data))
+        return pb.BlockResponse(info=pb.BlockInfo(blockType=block_type))
+
+    @_rpc
+    def setBlock(self, request, context) -> pb.Status:
+        fake_world = self._world(request.world)
+        if fake_world is None:
+            return pb.Status(code=pb.WORLD_NOT_FOUND, extra=request.world.name)
+        status = self._check_block(request.info)
+        if status is not None:
+            return status
+        self._set(fake_world, request.info, [(request.pos.x, request.pos.y, request.pos.z)])
+        return pb.Status()
+
+    @_rpc
+    def setBlocks(self, request, context) -> pb.Status:
+        fake_world = self._world(request.world)
+        if fake_world is None:
+            return pb.Status(code=pb.WORLD_NOT_FOUND, extra=request.world.name)
+        status = self._check_block(request.info)
+        if status is not None:
+            return status
+        self._set(fake_world, request.info, [(pos.x, pos.y, pos.z) for pos in request.pos])
+        return pb.Status()
+
+    @_rpc
+    def setBlockCube(self, request, context) -> pb.Status:
+        fake_world = self._world(request.world)
+        if fake_world is None:
+            return pb.Status(code=pb.WORLD_NOT_FOUND, extra=request.world.name)
+        if len(request.pos) != 2:
+            return pb.Status(code=pb.INVALID_ARGUMENT, extra="exactly two positions required")
+        status = self._check_block(request.info)
+        if status is not None:
+            return status
+        pos1, pos2 = request.pos
+        xs = range(min(pos1.x, pos2.x), max(pos1.x, pos2.x) + 1)
+        ys = range(min(pos1.y, pos2.y), max(pos1.y, pos2.y) + 1)
+        zs = range(min(pos1.z, pos2.z), max(pos1.z, pos2.z) + 1)
+        self._set(fake_world, request.info, ((x, y, z) for x in xs for y in ys for z in zs))
+        return pb.Status()
+
+    @_rpc
+    def getPlayers(self, request, context) -> pb.PlayerResponse:
+        names = list(request.names) or list(self._players)
+        players = []
+        for name in names:
+            player = self._players.get(name)
+            if player is None:
+                return pb.PlayerResponse(status=pb.Status(code=pb.PLAYER_NOT_FOUND, extra=name))
+            if request.withLocations:
+                players.append(pb.Player(name=name, location=self._pb_location(player)))
+            else:
+                players.append(pb.Player(name=name))
+        return pb.PlayerResponse(players=players)
+
+    @_rpc
+    def setPlayer(self, request, context) -> pb.Status:
+        player = self._players.get(request.name)
+        if player is None:
+            return pb.Status(code=pb.PLAYER_NOT_FOUND, extra=request.name)
+        return self._move(player, request.location)
+
+    @_rpc
+    def spawnEntity(self, request, context) -> pb.SpawnedEntityResponse:
+        entity_type = _strip_namespace(request.type)
+        if entity_type not in self._entity_types:
+            return pb.SpawnedEntityResponse(
+                status=pb.Status(code=pb.ENTITY_TYPE_NOT_FOUND, extra=request.type)
+            )
+        if not self._entity_types[entity_type]:
+            return pb.SpawnedEntityResponse(
+                status=pb.Status(code=pb.ENTITY_NOT_SPAWNABLE, extra=request.type)
+            )
+        fake_world = self._world(request.location.world)
+        if fake_world is None:
+            return pb.SpawnedEntityResponse(
+                status=pb.Status(code=pb.WORLD_NOT_FOUND, extra=request.location.world.name)
+            )
+        pos = request.location.pos
+        entity = _FakeEntity(self._next_id(), entity_type, fake_world, (pos.x, pos.y, pos.z))
+        self._entities[entity.id] = entity
+        return pb.SpawnedEntityResponse(
+            entity=pb.Entity(id=entity.id, type=entity.type, location=self._pb_location(entity))
+        )
+
+    @_rpc
+    def setEntity(self, request, context) -> pb.Status:
+        entity = self._entities.get(request.id)
+        if entity is None:
+            return pb.Status(code=pb.ENTITY_NOT_FOUND, extra=request.id)
+        return self._move(entity, request.location)
+
+    @_rpc
+    def getEntities(self, request, context) -> pb.EntityResponse:
+        if request.HasField("specific"):
+            found = [
+                self._entities[e.id] for e in request.specific.entities if e.id in self._entities
+            ]
+        else:
+            worldwide = request.worldwide
+            fake_world = self._world(worldwide.world)
+            if fake_world is None:
+                return pb.EntityResponse(
+                    status=pb.Status(code=pb.WORLD_NOT_FOUND, extra=worldwide.world.name)
+                )
+            entity_type = _strip_namespace(worldwide.type)
+            candidates: Iterator[_FakeEntity] = iter(self._entities.values())
+            if worldwide.includeNotSpawnable:  # like the plugin, also returns players
+                candidates = iter([*self._entities.values(), *self._players.values()])
+            found = [
+                entity
+                for entity in candidates
+                if entity.world is fake_world
+                and (not entity_type or entity.type == entity_type)
+                and (worldwide.includeNotSpawnable or self._entity_types.get(entity.type, False))
+            ]
+        return pb.EntityResponse(
+            entities=[
+                (
+                    pb.Entity(id=e.id, type=e.type, location=self._pb_location(e))
+                    if request.withLocations
+                    else pb.Entity(id=e.id, type=e.type)
+                )
+                for e in found
+            ]
+        )
+
+    def getEventStream(self, request, context) -> Iterator[pb.Event]:
+        self._before_call("getEventStream", context)
+        return super().getEventStream(request, context)
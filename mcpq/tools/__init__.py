@@ -1,10 +1,24 @@
+from .blockvideo import PlaybackStats, VideoWall
 from .chatcmd import ChatCmd
-from .imagequantizer import convert_image, konvertiere_bild
+from .imagequantizer import (
+    PALETTES,
+    BlockPalette,
+    convert_image,
+    image_to_blocks,
+    konvertiere_bild,
+    place_image,
+)
 from .mcturtle import Turtle
 
 __all__ = [
     "ChatCmd",
     "convert_image",
     "konvertiere_bild",
+    "BlockPalette",
+    "PALETTES",
+    "image_to_blocks",
+    "place_image",
+    "VideoWall",
+    "PlaybackStats",
     "Turtle",
 ]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .. import BlockPos, Vec3, logger
+from .imagequantizer import BlockPalette, _as_palette, _import_numpy, _load_image, _resize
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .. import Minecraft, World
+
+FPS: float = 10.0  # default frame rate of VideoWall.play
+
+
+@dataclass(frozen=True)
+class PlaybackStats:
+    "The result of :func:`VideoWall.play`"
+
+    frames: int  #: the number of frames that were shown
+    dropped: int  #: the number of frames that were skipped, because the server fell behind
+    blocks: int  #: the number of blocks that were changed
+    seconds: float  #: the duration of the playback
+
+    @property
+    def fps(self) -> float:
+        "The achieved frame rate"
+        return self.frames / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def blocks_per_frame(self) -> float:
+        "The average number of blocks changed per shown frame"
+        return self.blocks / self.frames if self.frames else 0.0
+
+
+class VideoWall:
+    """A wall of blocks in `world` that shows frames, e.g. of a video, an animation or a scoreboard, in the colors of `palette`.
+    Only the blocks that differ from what the wall currently shows are changed, grouped by block type into one
+    :func:`~mcpq.world.World.setBlockList` call each, thus mostly static content is cheap to update.
+
+    .. code-block:: python
+
+       from mcpq import Minecraft
+       from mcpq.tools import VideoWall
+
+       mc = Minecraft()
+       wall = VideoWall(mc, mc.getPlayer().pos.north(10), size=(64, 36), palette="concrete")
+       # frames are arrays of shape (height, width, 3 or 4), e.g., read with imageio, or paths of image files
+       stats = wall.play(frames, fps=15)
+       print(f"{stats.fps:.1f} fps, {stats.blocks_per_frame:.0f} blocks per frame, {stats.dropped} frames dropped")
+
+    :param world: the world (or :class:`Minecraft` for the default world) to build in
+    :type world: World | Minecraft
+    :param pos: the bottom left corner of the wall if `vertical`, else the top left (north-west) corner
+    :type pos: Vec3 | BlockPos
+    :param size: (width, height) in blocks every frame is scaled to, defaults to None (the size of the frames)
+    :type size: tuple[int, int] | None, optional
+    :param palette: the blocks to use, see :class:`BlockPalette`, defaults to "wool"
+    :type palette: BlockPalette | str | Mapping[str, Any], optional
+    :param dither: whether to use Floyd-Steinberg dithering, makes frames change more blocks, defaults to False
+    :type dither: bool, optional
+    :param vertical: whether to build the wall upright along the x and y axis, otherwise along the x and z axis, defaults to True
+    :type vertical: bool, optional
+    """
+
+    def __init__(
+        self,
+        world: World | Minecraft,
+        pos: Vec3 | BlockPos,
+        size: tuple[int, int] | None = None,
+        palette: BlockPalette | str | Mapping[str, Any] = "wool",
+        dither: bool = False,
+        vertical: bool = True,
+    ):
+        self._world = world
+        self._origin = pos.floor().to_tuple()
+        self._size = size
+        self._palette = _as_palette(palette)
+        self._dither = dither
+        self._vertical = vertical
+        self._shown: np.ndarray | None = None  # block indices on the wall, -1 if unknown
+
+    @property
+    def palette(self) -> BlockPalette:
+        "The palette the frames are converted to"
+        return self._palette
+
+    def reset(self) -> None:
+        "Forget what the wall shows, such that the next frame is sent completely, e.g. after the wall was changed by something else"
+        self._shown = None
+
+    def show(self, frame: Any, budget: float | None = None) -> int:
+        """Show a single `frame` on the wall by changing all blocks that differ from the current frame.
+        Transparent pixels leave their blocks unchanged.
+
+        :param frame: RGB(A) image as array of shape (height, width, 3 or 4), nested list or path of an image file
+        :type frame: Any
+        :param budget: the time in seconds after which no further block types are sent, the remaining blocks are then sent with the next frame, defaults to None (no limit)
+        :type budget: float | None, optional
+        :return: the number of blocks changed
+        :rtype: int
+        """
+        np = _import_numpy()
+        deadline = None if budget is None else time.perf_counter() + budget
+        img = _load_image(frame)
+        if self._size is not None:
+            img = _resize(img, self._size)
+        indices = self._palette.quantize(img, self._dither)
+        if self._shown is None or self._shown.shape != indices.shape:
+            self._shown = np.full(indices.shape, -1, dtype=np.int16)
+        shown = self._shown.ravel()  # view, updated in place
+        flat = indices.ravel()
+        changed = np.flatnonzero((flat != shown) & (flat >= 0))
+        if not len(changed):
+            return 0
+        order = changed[np.argsort(flat[changed], kind="stable")]
+        types, first, counts = np.unique(flat[order], return_index=True, return_counts=True)
+        rows, cols = np.divmod(order, indices.shape[1])
+        x0, y0, z0 = self._origin
+        xs = (cols + x0).tolist()
+        if self._vertical:
+            ys, zs = (y0 + indices.shape[0] - 1 - rows).tolist(), [z0] * len(order)
+        else:
+            ys, zs = [y0] * len(order), (z0 + rows).tolist()
+        sent = 0
+        # the largest changes first, as they are the most visible if the budget runs out
+        for n in np.argsort(-counts, kind="stable").tolist():
+            if deadline is not None and sent and time.perf_counter() > deadline:
+                break
+            group = range(first[n], first[n] + counts[n])
+            self._world.setBlockList(
+                self._palette.blocks[types[n]], [BlockPos(xs[k], ys[k], zs[k]) for k in group]
+            )
+            shown[order[group.start : group.stop]] = types[n]
+            sent += len(group)
+        return sent
+
+    def play(
+        self, frames: Iterable[Any], fps: float = FPS, budget: float | None = None
+    ) -> PlaybackStats:
+        """Show `frames` one after the other at `fps` frames per second.
+        If the server falls behind, frames are dropped until playback has caught up again, but the last frame is always shown completely.
+
+        :param frames: the frames, see :func:`show`
+        :type frames: Iterable[Any]
+        :param fps: the frame rate, defaults to :data:`FPS`
+        :type fps: float, optional
+        :param budget: the time in seconds that each frame may take to send, see :func:`show`, defaults to None (the duration of a frame)
+        :type budget: float | None, optional
+        :return: the number of shown and dropped frames, the number of changed blocks and the duration, including the achieved frame rate
+        :rtype: PlaybackStats
+        """
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}")
+        interval = 1.0 / fps
+        budget = interval if budget is None else budget
+        shown = dropped = blocks = 0
+        last: Any = None
+        last_dropped = False
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            last = frame
+            due = start + i * interval
+            now = time.perf_counter()
+            last_dropped = now > due + interval
+            if last_dropped:
+                # the next frame is due already, skip this one instead of falling further behind
+                dropped += 1
+                continue
+            if now < due:
+                time.sleep(due - now)
+            blocks += self.show(frame, budget)
+            shown += 1
+        if last is not None:
+            # without budget, such that the wall ends up showing the last frame completely
+            blocks += self.show(last)
+            if last_dropped:
+                dropped -= 1
+                shown += 1
+        stats = PlaybackStats(shown, dropped, blocks, time.perf_counter() - start)
+        logger.debug(
+            f"VideoWall: {stats.fps:.1f} fps, {stats.blocks_per_frame:.0f} blocks per frame, {dropped} dropped"
+        )
+        return stats
@@ -1,5 +1,20 @@
+from __future__ import annotations
+
 import os
+from collections.abc import Iterator, Mapping
 from pathlib import Path as _Path
+from typing import TYPE_CHECKING, Any
+
+from .. import BlockPos, Vec3
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .. import Minecraft, World
+
+LUT_BITS: int = 6  # bits per color channel of the color lookup tables, i.e. 64^3 entries
+TILE_ROWS: int = 32  # image rows that are converted and placed at once by place_image
+ALPHA_THRESHOLD: int = 128  # pixels with lower alpha values are transparent and not placed
 
 
 def konvertiere_bild(
@@ -153,3 +168,369 @@ _RGB = {
     "red_wool": _colorCodeToRGB("A12722"),
     "black_wool": _colorCodeToRGB("141519"),
 }
+
+
+_CONCRETE = {
+    "white_concrete": _colorCodeToRGB("CFD5D6"),
+    "orange_concrete": _colorCodeToRGB("E06101"),
+    "magenta_concrete": _colorCodeToRGB("A9309F"),
+    "light_blue_concrete": _colorCodeToRGB("2489C7"),
+    "yellow_concrete": _colorCodeToRGB("F1AF15"),
+    "lime_concrete": _colorCodeToRGB("5EA918"),
+    "pink_concrete": _colorCodeToRGB("D5658F"),
+    "gray_concrete": _colorCodeToRGB("373A3E"),
+    "light_gray_concrete": _colorCodeToRGB("7D7D73"),
+    "cyan_concrete": _colorCodeToRGB("157788"),
+    "purple_concrete": _colorCodeToRGB("64209C"),
+    "blue_concrete": _colorCodeToRGB("2D2F8F"),
+    "brown_concrete": _colorCodeToRGB("603C20"),
+    "green_concrete": _colorCodeToRGB("495B24"),
+    "red_concrete": _colorCodeToRGB("8E2121"),
+    "black_concrete": _colorCodeToRGB("080A0F"),
+}
+
+_TERRACOTTA = {
+    "terracotta": _colorCodeToRGB("985E44"),
+    "white_terracotta": _colorCodeToRGB("D2B2A1"),
+    "orange_terracotta": _colorCodeToRGB("A25426"),
+    "magenta_terracotta": _colorCodeToRGB("96586D"),
+    "light_blue_terracotta": _colorCodeToRGB("716D8A"),
+    "yellow_terracotta": _colorCodeToRGB("BA8523"),
+    "lime_terracotta": _colorCodeToRGB("677535"),
+    "pink_terracotta": _colorCodeToRGB("A24E4F"),
+    "gray_terracotta": _colorCodeToRGB("3A2A24"),
+    "light_gray_terracotta": _colorCodeToRGB("876B62"),
+    "cyan_terracotta": _colorCodeToRGB("575B5B"),
+    "purple_terracotta": _colorCodeToRGB("764656"),
+    "blue_terracotta": _colorCodeToRGB("4A3C5B"),
+    "brown_terracotta": _colorCodeToRGB("4D3324"),
+    "green_terracotta": _colorCodeToRGB("4C532A"),
+    "red_terracotta": _colorCodeToRGB("8F3D2F"),
+    "black_terracotta": _colorCodeToRGB("251710"),
+}
+
+PALETTES: dict[str, dict[str, tuple[int, int, int]]] = {
+    "wool": _RGB,
+    "concrete": _CONCRETE,
+    "terracotta": _TERRACOTTA,
+    "all": {**_RGB, **_CONCRETE, **_TERRACOTTA},
+}  # average texture colors of the blocks, usable by name in BlockPalette
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        print("WARN: BlockPalette needs additional requirements!")
+        print("Install with: 'pip install numpy'")
+        raise exc
+    return numpy
+
+
+def _rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    # sRGB (0-255) -> linear RGB -> XYZ (D65) -> CIELAB, in which euclidean distances follow perceived differences
+    np = _import_numpy()
+    c = np.asarray(rgb, dtype=np.float64) / 255.0
+    c = np.where(c > 0.04045, ((c + 0.055) / 1.055) ** 2.4, c / 12.92)
+    xyz = c @ np.array(
+        [
+            [0.4124564 / 0.95047, 0.2126729, 0.0193339 / 1.08883],
+            [0.3575761 / 0.95047, 0.7151522, 0.1191920 / 1.08883],
+            [0.1804375 / 0.95047, 0.0721750, 0.9503041 / 1.08883],
+        ]
+    )
+    f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    return np.stack(
+        (116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])),
+        axis=-1,
+    )
+
+
+class BlockPalette:
+    """A set of blocks with their (average) colors that images are converted to, see :func:`place_image`.
+    Either the name of one of the predefined :data:`PALETTES` (``"wool"``, ``"concrete"``, ``"terracotta"`` or ``"all"``)
+    or a mapping of block type to color, given as RGB tuple or color code like ``"E9ECEC"``.
+
+    Every color is matched to the perceptually closest block, i.e. the closest color in the CIELAB color space.
+    The matches for all colors are computed once per palette into a lookup table with :data:`LUT_BITS` bits per channel,
+    afterwards converting an image is a single table lookup per pixel.
+
+    .. code-block:: python
+
+       from mcpq.tools import BlockPalette
+
+       palette = BlockPalette("concrete")
+       palette.match((255, 0, 0))
+       # >>> 'red_concrete'
+       palette = BlockPalette({"snow_block": "F9FEFE", "obsidian": (15, 10, 24)})
+
+    .. note::
+
+       Requires `NumPy <https://numpy.org/>`_.
+    """
+
+    def __init__(
+        self,
+        colors: str | Mapping[str, tuple[int, int, int] | str] = "wool",
+        lut_bits: int = LUT_BITS,
+    ):
+        np = _import_numpy()
+        if isinstance(colors, str):
+            if colors not in PALETTES:
+                raise ValueError(f"Unknown palette '{colors}', expected one of {list(PALETTES)}")
+            colors = PALETTES[colors]
+        if not colors:
+            raise ValueError("A palette needs at least one block")
+        if not 1 <= lut_bits <= 8:
+            raise ValueError(f"lut_bits must be between 1 and 8, got {lut_bits}")
+        self.blocks: tuple[str, ...] = tuple(colors)
+        self.rgb = np.array(
+            [_colorCodeToRGB(c) if isinstance(c, str) else tuple(c) for c in colors.values()],
+            dtype=np.uint8,
+        ).reshape(-1, 3)
+        self._lab = _rgb_to_lab(self.rgb)
+        self._bits = lut_bits
+        self._lut: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.blocks)!r})"
+
+    @property
+    def lut(self) -> np.ndarray:
+        "The index of the closest block for every color, indexed by the top :data:`LUT_BITS` bits of red, green and blue"
+        if self._lut is None:
+            np = _import_numpy()
+            levels = 1 << self._bits
+            # colors at the center of every cell of the table
+            centers = (np.arange(levels) + 0.5) * (256 / levels)
+            grid = np.stack(np.meshgrid(centers, centers, centers, indexing="ij"), axis=-1)
+            lab = _rgb_to_lab(grid.reshape(-1, 3))
+            best = np.zeros(len(lab), dtype=np.uint16 if len(self) > 256 else np.uint8)
+            best_distance = np.full(len(lab), np.inf)
+            for i, color in enumerate(self._lab):
+                distance = ((lab - color) ** 2).sum(axis=1)
+                closer = distance < best_distance
+                best[closer] = i
+                best_distance[closer] = distance[closer]
+            self._lut = best.reshape(levels, levels, levels)
+        return self._lut
+
+    def match(self, color: tuple[int, int, int] | str) -> str:
+        "The block with the color closest to `color`"
+        r, g, b = _colorCodeToRGB(color) if isinstance(color, str) else color
+        shift = 8 - self._bits
+        return self.blocks[self.lut[r >> shift, g >> shift, b >> shift]]
+
+    def quantize(self, image: Any, dither: bool = False) -> np.ndarray:
+        """The index into :attr:`blocks` of the closest block for every pixel of `image`, or -1 for transparent pixels.
+
+        :param image: RGB(A) image as array of shape (height, width, 3 or 4) with values 0 - 255, or path of an image file
+        :type image: Any
+        :param dither: whether to diffuse the color error of each pixel to its neighbours (Floyd-Steinberg), defaults to False
+        :type dither: bool, optional
+        :return: array of shape (height, width) with the block indices
+        :rtype: numpy.ndarray
+        """
+        np = _import_numpy()
+        img = _load_image(image)
+        return np.concatenate(list(self._iter_quantized(img, dither, len(img) or 1)), axis=0)
+
+    def _iter_quantized(self, img: np.ndarray, dither: bool, rows: int) -> Iterator[np.ndarray]:
+        # quantized bands of `rows` rows, the dithering error is carried from one band to the next
+        np = _import_numpy()
+        lut, shift = self.lut, 8 - self._bits
+        opaque = img[..., 3] >= ALPHA_THRESHOLD if img.shape[2] == 4 else None
+        carry = np.zeros(img.shape[1:2] + (3,)) if dither else None
+        for start in range(0, len(img), rows):
+            rgb = img[start : start + rows, :, :3]
+            mask = None if opaque is None else opaque[start : start + rows]
+            if dither:
+                band, carry = self._dither(rgb, mask, carry)
+            else:
+                band = lut[rgb[..., 0] >> shift, rgb[..., 1] >> shift, rgb[..., 2] >> shift]
+                band = band.astype(np.int16)
+            if mask is not None:
+                band[~mask] = -1
+            yield band
+
+    def _dither(
+        self, rgb: np.ndarray, mask: np.ndarray | None, carry: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Floyd-Steinberg: the error is pushed right within a row, which is inherently sequential,
+        # and to the row below, which is accumulated for the whole row and added vectorised
+        np = _import_numpy()
+        lut = self.lut.ravel().tolist()
+        palette = self.rgb.tolist()
+        bits, shift = self._bits, 8 - self._bits
+        height, width = rgb.shape[:2]
+        result = np.empty((height, width), dtype=np.int16)
+        work = rgb.astype(np.float64)
+        visible = np.ones((height, width), dtype=bool) if mask is None else mask
+        for y in range(height):
+            row = (work[y] + carry).tolist()
+            shown = visible[y].tolist()
+            indices = [0] * width
+            errors = np.zeros((width, 3))
+            er = eg = eb = 0.0
+            for x in range(width):
+                if not shown[x]:
+                    er = eg = eb = 0.0  # transparent pixels neither take nor pass on errors
+                    continue
+                red, green, blue = row[x]
+                r = min(max(red + er, 0.0), 255.0)
+                g = min(max(green + eg, 0.0), 255.0)
+                b = min(max(blue + eb, 0.0), 255.0)
+                i = lut[
+                    (((int(r) >> shift) << bits) | (int(g) >> shift)) << bits | (int(b) >> shift)
+                ]
+                indices[x] = i
+                pr, pg, pb = palette[i]
+                er, eg, eb = r - pr, g - pg, b - pb
+                errors[x] = er, eg, eb
+                er, eg, eb = er * (7 / 16), eg * (7 / 16), eb * (7 / 16)
+            result[y] = indices
+            carry = errors * (5 / 16)
+            carry[1:] += errors[:-1] * (1 / 16)
+            carry[:-1] += errors[1:] * (3 / 16)
+        return result, carry
+
+
+def _load_image(image: Any) -> np.ndarray:
+    np = _import_numpy()
+    if isinstance(image, (str, os.PathLike)):
+        try:
+            from PIL import Image
+        except ImportError as exc:
+            print("WARN: Reading image files needs additional requirements!")
+            print("Install with: 'pip install Pillow'")
+            raise exc
+        with Image.open(image) as file:
+            image = file.convert("RGBA")
+    img = np.asarray(image)
+    if img.ndim != 3 or img.shape[2] not in (3, 4):
+        raise TypeError(f"Expected an image of shape (height, width, 3 or 4), got {img.shape}")
+    if img.dtype != np.uint8:
+        img = np.clip(img, 0, 255).astype(np.uint8)
+    return img
+
+
+def _resize(img: np.ndarray, newsize: tuple[int, int]) -> np.ndarray:
+    # nearest neighbour, each block shows exactly one pixel of the original
+    np = _import_numpy()
+    width, height = newsize
+    if width <= 0 or height <= 0:
+        raise ValueError(f"newsize must be positive, got {newsize}")
+    rows = (np.arange(height) + 0.5) * (img.shape[0] / height)
+    cols = (np.arange(width) + 0.5) * (img.shape[1] / width)
+    return img[rows.astype(np.intp)][:, cols.astype(np.intp)]
+
+
+def _as_palette(palette: BlockPalette | str | Mapping[str, Any]) -> BlockPalette:
+    return palette if isinstance(palette, BlockPalette) else BlockPalette(palette)
+
+
+def image_to_blocks(
+    image: Any,
+    palette: BlockPalette | str | Mapping[str, Any] = "wool",
+    newsize: tuple[int, int] | None = None,
+    dither: bool = False,
+) -> list[list[str | None]]:
+    """Convert `image` to the blocks of `palette` with the perceptually closest colors.
+
+    :param image: RGB(A) image as array of shape (height, width, 3 or 4), nested list or path of an image file
+    :type image: Any
+    :param palette: the blocks to use, see :class:`BlockPalette`, defaults to "wool"
+    :type palette: BlockPalette | str | Mapping[str, Any], optional
+    :param newsize: (width, height) the image is scaled to first, defaults to None
+    :type newsize: tuple[int, int] | None, optional
+    :param dither: whether to use Floyd-Steinberg dithering, defaults to False
+    :type dither: bool, optional
+    :return: the rows of blocks from top to bottom, with None for transparent pixels
+    :rtype: list[list[str | None]]
+    """
+    palette = _as_palette(palette)
+    img = _load_image(image)
+    if newsize is not None:
+        img = _resize(img, newsize)
+    blocks = palette.blocks + (None,)  # index -1 is transparent
+    return [[blocks[i] for i in row] for row in palette.quantize(img, dither).tolist()]
+
+
+def place_image(
+    world: World | Minecraft,
+    image: Any,
+    pos: Vec3 | BlockPos,
+    palette: BlockPalette | str | Mapping[str, Any] = "wool",
+    newsize: tuple[int, int] | None = None,
+    dither: bool = False,
+    vertical: bool = True,
+    tile_rows: int = TILE_ROWS,
+) -> int:
+    """Build `image` out of the blocks of `palette` in `world`, e.g. as map art or a wall picture.
+    The image is converted and placed in bands of `tile_rows` rows, where the blocks of each band are grouped by type into one
+    :func:`~mcpq.world.World.setBlockList` call per block type, so that large images need few requests and placing starts right away.
+
+    .. code-block:: python
+
+       from mcpq import Minecraft
+       from mcpq.tools import place_image
+
+       mc = Minecraft()
+       pos = mc.getPlayer().pos.north(5)
+       # upright picture that faces south, 128 blocks wide, starting at pos as the bottom left corner
+       place_image(mc, "picture.png", pos, "concrete", newsize=(128, 96), dither=True)
+       # map art lying on the ground, the top of the image pointing north
+       place_image(mc, "picture.png", pos, vertical=False)
+
+    :param world: the world (or :class:`Minecraft` for the default world) to build in
+    :type world: World | Minecraft
+    :param image: RGB(A) image as array of shape (height, width, 3 or 4), nested list or path of an image file, transparent pixels are skipped
+    :type image: Any
+    :param pos: the bottom left corner of the image if `vertical`, else the top left (north-west) corner
+    :type pos: Vec3 | BlockPos
+    :param palette: the blocks to use, see :class:`BlockPalette`, defaults to "wool"
+    :type palette: BlockPalette | str | Mapping[str, Any], optional
+    :param newsize: (width, height) the image is scaled to first, i.e., its size in blocks, defaults to None
+    :type newsize: tuple[int, int] | None, optional
+    :param dither: whether to use Floyd-Steinberg dithering, defaults to False
+    :type dither: bool, optional
+    :param vertical: whether to build the image upright along the x and y axis, otherwise along the x and z axis, defaults to True
+    :type vertical: bool, optional
+    :param tile_rows: the number of image rows that are converted and placed together, defaults to :data:`TILE_ROWS`
+    :type tile_rows: int, optional
+    :return: the number of blocks placed
+    :rtype: int
+    """
+    np = _import_numpy()
+    palette = _as_palette(palette)
+    img = _load_image(image)
+    if newsize is not None:
+        img = _resize(img, newsize)
+    x0, y0, z0 = pos.floor().to_tuple()
+    height = len(img)
+    placed = 0
+    start = 0
+    for band in palette._iter_quantized(img, dither, max(1, tile_rows)):
+        flat = band.ravel()
+        order = np.argsort(flat, kind="stable")
+        indices, first = np.unique(flat[order], return_index=True)
+        rows, cols = np.divmod(order, band.shape[1])
+        xs = (cols + x0).tolist()
+        if vertical:
+            ys, zs = (y0 + height - 1 - start - rows).tolist(), [z0] * len(flat)
+        else:
+            ys, zs = [y0] * len(flat), (z0 + start + rows).tolist()
+        bounds = first.tolist() + [len(flat)]
+        for n, index in enumerate(indices.tolist()):
+            if index < 0:
+                continue
+            group = range(bounds[n], bounds[n + 1])
+            world.setBlockList(
+                palette.blocks[index], [BlockPos(xs[k], ys[k], zs[k]) for k in group]
+            )
+            placed += len(group)
+        start += len(band)
+    return placed
@@ -1,15 +1,47 @@
 from __future__ import annotations
 
 from threading import Thread
-from time import sleep
+from time import perf_counter, sleep
+from typing import Iterator
 
-from .. import Minecraft, Vec3, World
+from .. import BlockPos, Minecraft, Vec3, World
+
+FPS: float = 20.0  # default frames per second of the animated mode
+FRAME_MAX_BLOCKS: int = 4096  # default maximum of changed blocks per frame of the animated mode
+CUBOID_MIN_BLOCKS: int = 64  # smaller cuboids are cheaper to send as part of a setBlockList call
+
+_Pos = tuple[int, int, int]
 
 
 def _sign(num: int | float) -> float:
     return 1.0 if num >= 0.0 else -1.0
 
 
+def _chunk_order(pos: _Pos) -> tuple[int, int, int, int, int]:
+    x, y, z = pos
+    return x >> 4, z >> 4, y, z, x
+
+
+def _cuboids(positions: set[_Pos]) -> Iterator[tuple[_Pos, _Pos]]:
+    # greedy: grow a box from the lowest remaining position along z, then y, then x
+    remaining = set(positions)
+    for start in sorted(positions):
+        if start not in remaining:
+            continue
+        x0, y0, z0 = start
+        x1, y1, z1 = start
+        while (x0, y0, z1 + 1) in remaining:
+            z1 += 1
+        zs = range(z0, z1 + 1)
+        while all((x0, y1 + 1, z) in remaining for z in zs):
+            y1 += 1
+        ys = range(y0, y1 + 1)
+        while all((x1 + 1, y, z) in remaining for y in ys for z in zs):
+            x1 += 1
+        remaining.difference_update((x, y, z) for x in range(x0, x1 + 1) for y in ys for z in zs)
+        yield start, (x1, y1, z1)
+
+
 class Turtle:
     """Turtle is a construct that can move precisely in 3D while drawing a line behind it on the Minecraft server made of blocks.
     It is inspired by the Python turtle module.
@@ -44,12 +76,17 @@ class Turtle:
     .. note::
 
        Most methods have shortcuts, such as :func:`forward` = `fd` or :func:`right` = `rt`.
+
+    .. note::
+
+       By default every step of the turtle is sent to the server on its own. For large drawings use
+       :func:`start_compile_mode` to send the whole drawing at once, or :func:`start_animated_mode` to send it in frames.
     """
 
     def __init__(
         self,
         mc: Minecraft | None = None,
-        pos: Vec3 | None = None,
+        pos: Vec3 | BlockPos | None = None,
         world: World | str | None = None,
     ) -> None:
         if mc is None:
@@ -73,6 +110,8 @@ class Turtle:
             self._pos = player.pos
             if world is None:
                 self._world = player.world
+        elif isinstance(pos, BlockPos):
+            self._pos = pos.to_vec3()
         elif not isinstance(pos, Vec3):
             raise TypeError("Argument pos must be of type Vec3")
         else:
@@ -80,8 +119,10 @@ class Turtle:
 
         if self._world is None:
             self._set_block_list = self._mc.setBlockList
+            self._set_block_cube = self._mc.setBlockCube
         else:
             self._set_block_list = self._world.setBlockList
+            self._set_block_cube = self._world.setBlockCube
 
         self._home_pos = self._pos
         self._dir_front: Vec3 = Vec3().east(1)
@@ -93,6 +134,13 @@ class Turtle:
         self._show_head: bool = True
         self._pensize: int = 1
         self._batch_time: float = 0.0
+        self._drawing: dict[
+            _Pos, str
+        ] | None = None  # blocks not sent yet in compile and animated mode
+        self._compiling: bool = False
+        self._frame_time: float = 0.0
+        self._frame_max_blocks: int = FRAME_MAX_BLOCKS
+        self._next_frame: float = 0.0
 
         self._head_pos = []
         self._paint()
@@ -142,12 +190,13 @@ class Turtle:
         return self._dir_front.cross(self._dir_up).norm()
 
     @property
-    def _body_pos(self) -> list[Vec3]:
-        c = self._pos.floor()  # center of head
+    def _body_pos(self) -> list[BlockPos]:
+        c = self._pos.block_pos()  # center of head
         if self._pensize == 1:
             return [c]
         ra = range(-(self._pensize // 2), self._pensize // 2 + self._pensize % 2)
-        return [Vec3(c.x + x, c.y + y, c.z + z) for x in ra for y in ra for z in ra]
+        cx, cy, cz = c
+        return [BlockPos(cx + x, cy + y, cz + z) for x in ra for y in ra for z in ra]
 
     def _rotate(self, angle: float, to: Vec3) -> None:
         k = self._dir_front.cross(to).norm()
@@ -164,19 +213,65 @@ class Turtle:
         except ZeroDivisionError:
             pass  # we are already at location
 
+    def _draw(self, block: str, positions: list[BlockPos]) -> None:
+        drawing = self._drawing
+        if drawing is None:
+            self._set_block_list(block, positions)
+        else:
+            for pos in positions:
+                drawing[pos] = block  # only the last block drawn at a position is sent
+
     def _paint(self) -> None:
         new_head = self._body_pos
         if self._head_pos:  # if old head exists
             if self._pendown:
-                self._set_block_list(self._body, self._head_pos)
+                self._draw(self._body, self._head_pos)
             else:
-                self._set_block_list("air", self._head_pos)
+                self._draw("air", self._head_pos)
             self._head_pos = []
         if self._show_head:
-            self._set_block_list(self._head, new_head)
+            self._draw(self._head, new_head)
             self._head_pos = new_head  # remember head
         elif self._pendown:
-            self._set_block_list(self._body, new_head)
+            self._draw(self._body, new_head)
+        if self._drawing is not None and not self._compiling:
+            if len(self._drawing) >= self._frame_max_blocks or perf_counter() >= self._next_frame:
+                self._send_frame()
+
+    def _send_drawing(self) -> None:
+        # one request per block type, except for large cuboids, in the order of the chunks
+        drawing, self._drawing = self._drawing or {}, {}
+        by_block: dict[str, set[_Pos]] = {}
+        for pos, block in drawing.items():
+            by_block.setdefault(block, set()).add(pos)
+        for block, positions in by_block.items():
+            singles: list[_Pos] = []
+            if len(positions) >= CUBOID_MIN_BLOCKS:
+                for low, high in _cuboids(positions):
+                    volume = (
+                        (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+                    )
+                    if volume >= CUBOID_MIN_BLOCKS:
+                        self._set_block_cube(block, BlockPos(*low), BlockPos(*high))
+                    else:
+                        singles.extend(
+                            (x, y, z)
+                            for x in range(low[0], high[0] + 1)
+                            for y in range(low[1], high[1] + 1)
+                            for z in range(low[2], high[2] + 1)
+                        )
+            else:
+                singles.extend(positions)
+            if singles:
+                singles.sort(key=_chunk_order)
+                self._set_block_list(block, [BlockPos(*pos) for pos in singles])
+
+    def _send_frame(self) -> None:
+        now = perf_counter()
+        if now < self._next_frame:
+            sleep(self._next_frame - now)  # frame is full early, keep the frame rate
+        self._send_drawing()
+        self._next_frame = max(self._next_frame, perf_counter()) + self._frame_time
 
     def home(self) -> Turtle:
         "Equivalent to :func:`goto` with the position the turtle spawned at"
@@ -226,7 +321,7 @@ class Turtle:
 
     def forward(self, by: float) -> Turtle:
         "Move `by` 1-sized steps in the current forward direction"
-        wait = (1.0 / self._speed) if self._speed else 0
+        wait = (1.0 / self._speed) if self._speed and not self._compiling else 0
         for _ in range(int(abs(by))):
             self._pos = self._pos + (self._dir_front * _sign(by))
             self._paint()
@@ -329,3 +424,66 @@ class Turtle:
         self._set_block_list(self._body, self._batch_list)
         self._batch_list = []
         return self
+
+    def start_compile_mode(self) -> Turtle:
+        """Record everything the turtle draws from now on without sending it to the server, until :func:`stop_compile_mode` is called.
+        The turtle does not wait between steps and every position is only sent once with the block drawn there last,
+        thus even large drawings only need a few requests.
+
+        .. code-block:: python
+
+           t = Turtle(mc).pensize(3).start_compile_mode()
+           for i in range(36):
+               t.fd(50).rt(170)
+           t.stop_compile_mode()  # the drawing appears at once
+        """
+        if self._drawing is not None and not self._compiling:
+            self._send_drawing()  # switching from animated mode
+        if self._drawing is None:
+            self._drawing = {}
+        self._compiling = True
+        return self
+
+    def stop_compile_mode(self) -> Turtle:
+        """Send everything drawn since :func:`start_compile_mode` was called and return to drawing every step.
+        The blocks are sent grouped by block type in one :func:`~mcpq.world.World.setBlockList` call each in the order of the chunks,
+        large cuboids of the same block type are sent with :func:`~mcpq.world.World.setBlockCube` instead.
+        """
+        if not self._compiling:
+            return self
+        self._send_drawing()
+        self._drawing = None
+        self._compiling = False
+        return self
+
+    def start_animated_mode(self, fps: float = FPS, max_blocks: int = FRAME_MAX_BLOCKS) -> Turtle:
+        """Draw in frames instead of sending every step, until :func:`stop_animated_mode` is called.
+        Every frame sends the changes of all steps since the last frame, like :func:`stop_compile_mode`,
+        with at most `fps` frames per second and at most about `max_blocks` changed blocks per frame, thus the
+        drawing is still animated while the cost per frame is bounded.
+        The speed of the turtle (see :func:`speed`) still determines how long each step takes.
+
+        :param fps: the maximum number of frames per second, defaults to :data:`FPS`
+        :type fps: float, optional
+        :param max_blocks: the number of changed blocks after which a frame is sent early, defaults to :data:`FRAME_MAX_BLOCKS`
+        :type max_blocks: int, optional
+        """
+        if fps <= 0:
+            raise ValueError("The frames per second must be a positive number")
+        if max_blocks < 1:
+            raise ValueError("The maximum number of blocks per frame must be at least 1")
+        self.stop_compile_mode()
+        if self._drawing is None:
+            self._drawing = {}
+            self._next_frame = perf_counter()
+        self._frame_time = 1.0 / fps
+        self._frame_max_blocks = max_blocks
+        return self
+
+    def stop_animated_mode(self) -> Turtle:
+        "Send the last frame and return to drawing every step"
+        if self._drawing is None or self._compiling:
+            return self
+        self._send_drawing()
+        self._drawing = None
+        return self
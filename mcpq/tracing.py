@@ -0,0 +1,331 @@
+"""Lightweight spans around the high-level operations of the library, such as :func:`~mcpq.world.World.pasteBlockCube`,
+:func:`~mcpq.world.World.getNbt` or event callbacks, including their local computation like flattening, rotating or SNBT parsing.
+
+Tracing is disabled by default, in which case the spans cost a single check.
+Enable it by setting a tracer, e.g., the :class:`RecordingTracer` to profile a script
+or the :class:`OpenTelemetryTracer` to export the spans to any OpenTelemetry backend:
+
+.. code-block:: python
+
+   from mcpq import Minecraft, Vec3, tracing
+
+   tracer = tracing.RecordingTracer()
+   tracing.set_tracer(tracer)
+
+   mc = Minecraft(instrument=True)  # with instrument=True, every call to the server is a span too
+   blocks = mc.copyBlockCube(Vec3(0, 0, 0), Vec3(10, 10, 10))
+   mc.pasteBlockCube(blocks, Vec3(20, 0, 0), rotation="north")
+   print(tracer.summary())  # {"World.pasteBlockCube": {"count": 1, "total": ..., "max": ...}, ...}
+
+Spans opened inside of other spans on the same thread (or asyncio task) are nested:
+
+.. code-block:: python
+
+   with tracing.span("build_house", size=10):
+       ...  # all spans of the library opened in here are children of "build_house"
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, TypeVar
+
+from . import logger
+
+__all__ = [
+    "Span",
+    "Tracer",
+    "RecordingTracer",
+    "OpenTelemetryTracer",
+    "set_tracer",
+    "get_tracer",
+    "current_span",
+    "span",
+    "traced",
+]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """A single timed operation, spans are created by a :class:`Tracer` and ended exactly once."""
+
+    __slots__ = ("name", "attributes", "parent", "start", "end_time")
+
+    def __init__(self, name: str, attributes: dict[str, Any], parent: Span | None) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.end_time: float | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, duration={self.duration})"
+
+    @property
+    def duration(self) -> float | None:
+        "The duration of the span in seconds or None if the span has not ended yet"
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        "Set an attribute on the span, such as the number of blocks that were set"
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        "Record that `exception` was raised while the span was active"
+        self.attributes["exception"] = repr(exception)
+
+    def end(self) -> None:
+        "End the span, further calls have no effect"
+        if self.end_time is None:
+            self.end_time = time.perf_counter()
+
+
+class _NoopSpan(Span):
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__("", {}, None)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Base class of tracers, which create the spans and decide what happens to them once they end.
+    Subclasses should override :func:`start_span` and/or :func:`end_span`."""
+
+    def start_span(self, name: str, attributes: dict[str, Any], parent: Span | None) -> Span:
+        """Create and start a new span.
+
+        :param name: the name of the operation, e.g., ``World.setBlockList``
+        :type name: str
+        :param attributes: the initial attributes of the span
+        :type attributes: dict[str, Any]
+        :param parent: the span that is active on the current thread or None
+        :type parent: Span | None
+        :return: the new span
+        :rtype: Span
+        """
+        return Span(name, attributes, parent)
+
+    def end_span(self, span: Span) -> None:
+        """End `span`, called exactly once for every span started by this tracer.
+
+        :param span: the span to end
+        :type span: Span
+        """
+        span.end()
+
+
+class RecordingTracer(Tracer):
+    """Tracer keeping all ended spans in memory, useful to profile where the time of a script goes.
+
+    :param max_spans: the maximum number of spans kept, older spans are discarded first, defaults to 100_000
+    :type max_spans: int, optional
+    """
+
+    def __init__(self, max_spans: int = 100_000) -> None:
+        self._lock = threading.Lock()
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    def end_span(self, span: Span) -> None:
+        span.end()
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> list[Span]:
+        "The ended spans in the order they ended, children end before their parents"
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        "Discard all recorded spans"
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return the number of spans, total and maximum duration in seconds by name.
+
+        :return: the aggregated spans by name, sorted by total duration descending
+        :rtype: dict[str, dict[str, float]]
+        """
+        summary: dict[str, dict[str, float]] = {}
+        for span in self.spans:
+            entry = summary.setdefault(span.name, {"count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += span.duration or 0.0
+            entry["max"] = max(entry["max"], span.duration or 0.0)
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True))
+
+
+class _OpenTelemetrySpan(Span):
+    __slots__ = ("otel_span",)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        super().set_attribute(key, value)
+        self.otel_span.set_attribute(key, _otel_value(value))
+
+    def record_exception(self, exception: BaseException) -> None:
+        super().record_exception(exception)
+        self.otel_span.record_exception(exception)
+
+
+def _otel_value(value: Any) -> Any:
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer forwarding all spans to OpenTelemetry, requires the ``opentelemetry-api`` package
+    (``pip install mcpq[tracing]``) and a configured OpenTelemetry SDK to actually export the spans.
+
+    :param tracer: the OpenTelemetry tracer to use, if None the tracer ``mcpq`` of the global tracer provider is used, defaults to None
+    :type tracer: opentelemetry.trace.Tracer | None, optional
+    """
+
+    def __init__(self, tracer=None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as exc:
+            logger.warning(
+                "OpenTelemetryTracer requires opentelemetry, install it with: 'pip install opentelemetry-api'"
+            )
+            raise exc
+        self._trace = trace
+        self._tracer = tracer if tracer is not None else trace.get_tracer("mcpq")
+
+    def start_span(self, name: str, attributes: dict[str, Any], parent: Span | None) -> Span:
+        span = _OpenTelemetrySpan(name, attributes, parent)
+        context = None
+        if isinstance(parent, _OpenTelemetrySpan):
+            context = self._trace.set_span_in_context(parent.otel_span)
+        span.otel_span = self._tracer.start_span(
+            name,
+            context=context,
+            attributes={key: _otel_value(value) for key, value in attributes.items()},
+        )
+        return span
+
+    def end_span(self, span: Span) -> None:
+        span.end()
+        if isinstance(span, _OpenTelemetrySpan):
+            span.otel_span.end()
+
+
+_tracer: Tracer | None = None
+_current_span: ContextVar[Span | None] = ContextVar("mcpq_current_span", default=None)
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Set the tracer used by all spans of the library, or disable tracing with None (the default).
+
+    :param tracer: the tracer to use or None
+    :type tracer: Tracer | None
+    """
+    global _tracer
+    if tracer is not None and not isinstance(tracer, Tracer):
+        raise TypeError(f"Argument tracer must be of type Tracer or None was '{type(tracer)}'")
+    _tracer = tracer
+
+
+def get_tracer() -> Tracer | None:
+    """Return the tracer set with :func:`set_tracer` or None if tracing is disabled.
+
+    :return: the current tracer
+    :rtype: Tracer | None
+    """
+    return _tracer
+
+
+def current_span() -> Span | None:
+    """Return the innermost active span of the current thread (or asyncio task) or None.
+
+    :return: the active span
+    :rtype: Span | None
+    """
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Context manager measuring the enclosed code as span `name`, nested in the currently active span.
+    If tracing is disabled, a span that ignores all attributes is returned.
+
+    .. code-block:: python
+
+       with tracing.span("load_schematic", file=path) as s:
+           blocks = load(path)
+           s.set_attribute("blocks", len(blocks))
+
+    :param name: the name of the span
+    :type name: str
+    :yield: the active span
+    :rtype: Iterator[Span]
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+    new_span = tracer.start_span(name, attributes, _current_span.get())
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except BaseException as e:
+        new_span.record_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        tracer.end_span(new_span)
+
+
+def _start_detached(name: str, **attributes: Any) -> tuple[Tracer, Span] | None:
+    # span that may end on another thread, it is not set as the active span
+    tracer = _tracer
+    if tracer is None:
+        return None
+    return tracer, tracer.start_span(name, attributes, _current_span.get())
+
+
+def traced(name: str | None = None) -> Callable[[F], F]:
+    """Decorator running every call of the decorated function in a :func:`span`.
+    If tracing is disabled, the function is called directly.
+
+    .. code-block:: python
+
+       @tracing.traced()
+       def build_tower(pos):
+           ...
+
+    :param name: the name of the span, defaults to the qualified name of the function
+    :type name: str | None, optional
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 from numbers import Number
+from operator import index, itemgetter
 from typing import Any, Callable, Iterator, Union, final, overload
 
 from ._types import CARDINAL, DIRECTION
@@ -9,8 +10,9 @@ from ._util import deprecated
 
 _NumType = Union[int, float]
 _NumVec = Union["Vec3", _NumType]
+_SCALARS = (int, float)  # checked by type first, as isinstance with Number is slow
 
-__all__ = ["Vec3"]
+__all__ = ["Vec3", "BlockPos"]
 
 
 @final
@@ -39,7 +41,7 @@ class Vec3:
     SOUTH: Vec3  #: Vec3(1, 0, 0)
     NORTH: Vec3  #: Vec3(-1, 0, 0)
 
-    __slots__ = ("_x", "_y", "_z")
+    __slots__ = ("_x", "_y", "_z", "_hash")  # _hash is set on first use
 
     def __init__(self, x: _NumType = 0, y: _NumType = 0, z: _NumType = 0):
         self._x = x
@@ -62,14 +64,18 @@ class Vec3:
         return f"{self.__class__.__name__}(x={self._x}, y={self._y}, z={self._z})"
 
     def __eq__(self, other):
-        return isinstance(other, Vec3) and (self._x, self._y, self._z) == (
-            other._x,
-            other._y,
-            other._z,
-        )
+        if isinstance(other, Vec3):
+            return self._x == other._x and self._y == other._y and self._z == other._z
+        if type(other) is BlockPos:
+            return (self._x, self._y, self._z) == other
+        return False
 
     def __hash__(self) -> int:
-        return hash((self._x, self._y, self._z))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self._x, self._y, self._z))  # the same as of an equal BlockPos
+            return self._hash
 
     def __lt__(self, other: Vec3) -> bool:
         return (self._x, self._y, self._z) < (other._x, other._y, other._z)
@@ -112,10 +118,10 @@ class Vec3:
 
     def __add__(self, v: _NumVec) -> Vec3:
         "Vector addition or add scalar to x, y and z"
-        if isinstance(v, Number):
-            return Vec3(self._x + v, self._y + v, self._z + v)
-        if isinstance(v, Vec3):
+        if type(v) is Vec3:
             return Vec3(self._x + v._x, self._y + v._y, self._z + v._z)
+        if type(v) in _SCALARS or isinstance(v, Number):
+            return Vec3(self._x + v, self._y + v, self._z + v)
         return NotImplemented
 
     def __radd__(self, v: _NumVec) -> Vec3:
@@ -123,10 +129,10 @@ class Vec3:
 
     def __sub__(self, v: _NumVec) -> Vec3:
         "Vector subtraction or subtract scalar from x, y and z"
-        if isinstance(v, Number):
-            return Vec3(self._x - v, self._y - v, self._z - v)
-        if isinstance(v, Vec3):
+        if type(v) is Vec3:
             return Vec3(self._x - v._x, self._y - v._y, self._z - v._z)
+        if type(v) in _SCALARS or isinstance(v, Number):
+            return Vec3(self._x - v, self._y - v, self._z - v)
         return NotImplemented
 
     def __rsub__(self, v: _NumVec) -> Vec3:
@@ -144,9 +150,9 @@ class Vec3:
 
     def __mul__(self, v: _NumVec) -> Vec3:
         "Scalar multiplication if v is a number or equivalent to :func:`multiply_elementwise` otherwise"
-        if isinstance(v, Number):
+        if type(v) in _SCALARS or isinstance(v, Number):
             return Vec3(self._x * v, self._y * v, self._z * v)
-        if isinstance(v, Vec3):
+        if type(v) is Vec3:
             return self.multiply_elementwise(v)
         return NotImplemented
 
@@ -155,12 +161,12 @@ class Vec3:
 
     def __truediv__(self, v: _NumType) -> Vec3:
         "Equivalent to multiplying `x`, `y` and `z` with 1.0 / `v`"
-        if isinstance(v, Number):
+        if type(v) in _SCALARS or isinstance(v, Number):
             return Vec3(self._x / v, self._y / v, self._z / v)
         return NotImplemented
 
     def __floordiv__(self, v: _NumType) -> Vec3:
-        if isinstance(v, Number):
+        if type(v) in _SCALARS or isinstance(v, Number):
             return Vec3(self._x // v, self._y // v, self._z // v)
         return NotImplemented
 
@@ -172,20 +178,31 @@ class Vec3:
 
     def __round__(self, ndigits: int = 0) -> Vec3:
         if ndigits == 0:
+            if self._is_integral():
+                return self
             # round returns int if no second parameter is given
             return self.map(round)
         else:
             # returns float otherwise (even if ndigits = 0)
             return self.map(lambda v: round(v, ndigits))
 
+    def _is_integral(self) -> bool:
+        return type(self._x) is int and type(self._y) is int and type(self._z) is int
+
     def __floor__(self) -> Vec3:
-        return self.map(math.floor)
+        if self._is_integral():
+            return self  # immutable, block positions are usually integral already
+        return Vec3(math.floor(self._x), math.floor(self._y), math.floor(self._z))
 
     def __ceil__(self) -> Vec3:
-        return self.map(math.ceil)
+        if self._is_integral():
+            return self
+        return Vec3(math.ceil(self._x), math.ceil(self._y), math.ceil(self._z))
 
     def __trunc__(self) -> Vec3:
-        return self.map(math.trunc)
+        if self._is_integral():
+            return self
+        return Vec3(math.trunc(self._x), math.trunc(self._y), math.trunc(self._z))
 
     def __copy__(self) -> Vec3:
         if type(self) is Vec3:
@@ -307,17 +324,21 @@ class Vec3:
         return self.__round__(ndigits)
 
     def floor(self) -> Vec3:
-        "Round `x`, `y` and `z` down to the nearest integer"
+        "Round `x`, `y` and `z` down to the nearest integer, `self` if they are integers already"
         return self.__floor__()
 
     def ceil(self) -> Vec3:
-        "Round `x`, `y` and `z` up to the nearest integer"
+        "Round `x`, `y` and `z` up to the nearest integer, `self` if they are integers already"
         return self.__ceil__()
 
     def trunc(self) -> Vec3:
-        "Leave only the integer part of `x`, `y` and `z`"
+        "Leave only the integer part of `x`, `y` and `z`, `self` if they are integers already"
         return self.__trunc__()
 
+    def block_pos(self) -> BlockPos:
+        "The :class:`BlockPos` of the block `self` is in, i.e., with `x`, `y` and `z` rounded down"
+        return BlockPos(math.floor(self._x), math.floor(self._y), math.floor(self._z))
+
     @deprecated("asdict is deprected, use to_dict instead")
     def asdict(self) -> dict[str, _NumType]:
         "Deprecated: Use :func:`to_dict` instead"
@@ -525,6 +546,241 @@ Vec3.DOWN = Vec3(0, -1, 0)
 Vec3.SOUTH = Vec3(0, 0, 1)
 Vec3.NORTH = Vec3(0, 0, -1)
 
+_new_tuple = tuple.__new__
+
+
+@final
+class BlockPos(tuple):
+    """:class:`BlockPos` is an immutable position of a block with integer ``x``, ``y`` and ``z`` coordinates.
+    It is a :class:`tuple` of ``(x, y, z)``, thus it is cheap to create, hash and unpack, and can be used anywhere a :class:`Vec3` is expected by the block functions without conversion.
+    Coordinates are never rounded silently, floats are rejected with a :class:`TypeError` - use :func:`of` or :func:`Vec3.block_pos` to get the block a point is in.
+
+    .. code::
+
+       pos = BlockPos(1, 4, 8)
+       assert pos.x == 1 and pos.y == 4 and pos.z == 8
+       x, y, z = pos
+       # arithmetic with integers or other block positions yields block positions
+       assert pos.up(2) + BlockPos(1, 1, 1) == BlockPos(2, 7, 9)
+       # arithmetic with floats or Vec3 yields Vec3 instead
+       assert pos + 0.5 == Vec3(1.5, 4.5, 8.5)
+       # a BlockPos is equal to (and has the same hash as) a Vec3 with the same coordinates
+       assert BlockPos(1, 4, 8) == Vec3(1, 4, 8) and BlockPos.of(Vec3(1.5, 4.2, 8.9)) == pos
+       mc.setBlock("stone", pos)
+    """
+
+    __slots__ = ()
+
+    x = property(itemgetter(0), doc="The x coordinate")
+    y = property(itemgetter(1), doc="The y coordinate")
+    z = property(itemgetter(2), doc="The z coordinate")
+    # the methods of Vec3 taking another vector only use these, so they accept a BlockPos as well
+    _x = property(itemgetter(0))
+    _y = property(itemgetter(1))
+    _z = property(itemgetter(2))
+
+    def __new__(cls, x: int = 0, y: int = 0, z: int = 0) -> BlockPos:
+        return _new_tuple(cls, (index(x), index(y), index(z)))
+
+    @classmethod
+    def of(cls, pos: Vec3 | BlockPos | tuple[_NumType, _NumType, _NumType]) -> BlockPos:
+        "The :class:`BlockPos` of the block that `pos` is in, i.e., with `x`, `y` and `z` rounded down"
+        if type(pos) is BlockPos:
+            return pos
+        x, y, z = pos.to_tuple() if type(pos) is Vec3 else pos
+        return _new_tuple(cls, (math.floor(x), math.floor(y), math.floor(z)))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(x={self[0]}, y={self[1]}, z={self[2]})"
+
+    def __getnewargs__(self) -> tuple[int, int, int]:
+        return tuple(self)
+
+    def __copy__(self) -> BlockPos:
+        return self  # immutable
+
+    def __deepcopy__(self, memo: Any) -> BlockPos:
+        return self  # immutable
+
+    # equality and hashing are those of tuple, which are consistent with Vec3
+
+    def __add__(self, v):
+        "Component-wise addition, a :class:`BlockPos` if `v` is an int or :class:`BlockPos`, a :class:`Vec3` otherwise"
+        x, y, z = self
+        if type(v) is BlockPos:
+            a, b, c = v
+            return _new_tuple(BlockPos, (x + a, y + b, z + c))
+        if type(v) is int:
+            return _new_tuple(BlockPos, (x + v, y + v, z + v))
+        if type(v) is Vec3 or isinstance(v, Number):
+            return Vec3(x, y, z) + v
+        return NotImplemented  # in particular no tuple concatenation
+
+    __radd__ = __add__
+
+    def __sub__(self, v):
+        "Component-wise subtraction, a :class:`BlockPos` if `v` is an int or :class:`BlockPos`, a :class:`Vec3` otherwise"
+        x, y, z = self
+        if type(v) is BlockPos:
+            a, b, c = v
+            return _new_tuple(BlockPos, (x - a, y - b, z - c))
+        if type(v) is int:
+            return _new_tuple(BlockPos, (x - v, y - v, z - v))
+        if type(v) is Vec3 or isinstance(v, Number):
+            return Vec3(x, y, z) - v
+        return NotImplemented
+
+    def __rsub__(self, v):
+        return -self + v
+
+    def __mul__(self, v):
+        "Scalar or element-wise multiplication, a :class:`BlockPos` if `v` is an int or :class:`BlockPos`, a :class:`Vec3` otherwise"
+        x, y, z = self
+        if type(v) is int:
+            return _new_tuple(BlockPos, (x * v, y * v, z * v))
+        if type(v) is BlockPos:
+            a, b, c = v
+            return _new_tuple(BlockPos, (x * a, y * b, z * c))
+        if type(v) is Vec3 or isinstance(v, Number):
+            return Vec3(x, y, z) * v
+        return NotImplemented  # in particular no tuple repetition
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, v: _NumType) -> Vec3:
+        "Equivalent to multiplying `x`, `y` and `z` with 1.0 / `v`"
+        if isinstance(v, Number):
+            return Vec3(*self) / v
+        return NotImplemented
+
+    def __floordiv__(self, v: int) -> BlockPos:
+        if type(v) is int:
+            x, y, z = self
+            return _new_tuple(BlockPos, (x // v, y // v, z // v))
+        if isinstance(v, Number):
+            return Vec3(*self) // v
+        return NotImplemented
+
+    def __neg__(self) -> BlockPos:
+        x, y, z = self
+        return _new_tuple(BlockPos, (-x, -y, -z))
+
+    def __pos__(self) -> BlockPos:
+        return self
+
+    def __round__(self, ndigits: int = 0) -> BlockPos:
+        return self
+
+    def __floor__(self) -> BlockPos:
+        return self
+
+    def __ceil__(self) -> BlockPos:
+        return self
+
+    def __trunc__(self) -> BlockPos:
+        return self
+
+    def round(self, ndigits: int = 0) -> BlockPos:
+        "`self`, as the coordinates are integers already"
+        return self
+
+    def floor(self) -> BlockPos:
+        "`self`, as the coordinates are integers already"
+        return self
+
+    def ceil(self) -> BlockPos:
+        "`self`, as the coordinates are integers already"
+        return self
+
+    def trunc(self) -> BlockPos:
+        "`self`, as the coordinates are integers already"
+        return self
+
+    def block_pos(self) -> BlockPos:
+        "`self`, equivalent to :func:`Vec3.block_pos`"
+        return self
+
+    def to_vec3(self) -> Vec3:
+        "`self` as a :class:`Vec3`"
+        return Vec3(*self)
+
+    def to_tuple(self) -> tuple[int, int, int]:
+        "`self`, which is a tuple of `x`, `y` and `z` already"
+        return self
+
+    def to_dict(self) -> dict[str, int]:
+        "`x`, `y` and `z` in a dictionary"
+        return {"x": self[0], "y": self[1], "z": self[2]}
+
+    def length(self) -> float:
+        "The length/magnitude of vector `self`"
+        return math.hypot(*self)
+
+    def distance(self, v: Vec3 | BlockPos) -> float:
+        "The distance between `self` and another point-vector `v`"
+        return math.dist(self, v.to_tuple())
+
+    def map(self, func: Callable[[int], _NumType]) -> BlockPos | Vec3:
+        "A :class:`BlockPos` with `func` applied to `x`, `y` and `z`, or a :class:`Vec3` if `func` does not return only integers"
+        return _pos_or_vec3(func(self[0]), func(self[1]), func(self[2]))
+
+    def map_pairwise(
+        self, func: Callable[[_NumType, _NumType], _NumType], v: Vec3 | BlockPos
+    ) -> BlockPos | Vec3:
+        "A :class:`BlockPos` with `func` applied to each `x`, `y` and `z` of *both* `self` and `v`, or a :class:`Vec3` if `func` does not return only integers"
+        x, y, z = v.to_tuple()
+        return _pos_or_vec3(func(self[0], x), func(self[1], y), func(self[2], z))
+
+    def in_box(self, corner1: Vec3 | BlockPos, corner2: Vec3 | BlockPos) -> bool:
+        "Whether `self` is enclosed in the bounding box/cube spanned between `corner1` and `corner2`, both corners *inclusive*"
+        return all(
+            min(c1, c2) <= c <= max(c1, c2)
+            for c, c1, c2 in zip(self, corner1.to_tuple(), corner2.to_tuple())
+        )
+
+    def east(self, n: int = 1) -> BlockPos:
+        "`self` moved `n` blocks east, i.e., with `n` added to `x`"
+        return _new_tuple(BlockPos, (self[0] + index(n), self[1], self[2]))
+
+    def west(self, n: int = 1) -> BlockPos:
+        "`self` moved `n` blocks west, i.e., with `n` subtracted from `x`"
+        return _new_tuple(BlockPos, (self[0] - index(n), self[1], self[2]))
+
+    def up(self, n: int = 1) -> BlockPos:
+        "`self` moved `n` blocks up, i.e., with `n` added to `y`"
+        return _new_tuple(BlockPos, (self[0], self[1] + index(n), self[2]))
+
+    def down(self, n: int = 1) -> BlockPos:
+        "`self` moved `n` blocks down, i.e., with `n` subtracted from `y`"
+        return _new_tuple(BlockPos, (self[0], self[1] - index(n), self[2]))
+
+    def south(self, n: int = 1) -> BlockPos:
+        "`self` moved `n` blocks south, i.e., with `n` added to `z`"
+        return _new_tuple(BlockPos, (self[0], self[1], self[2] + index(n)))
+
+    def north(self, n: int = 1) -> BlockPos:
+        "`self` moved `n` blocks north, i.e., with `n` subtracted from `z`"
+        return _new_tuple(BlockPos, (self[0], self[1], self[2] - index(n)))
+
+    def withX(self, n: int) -> BlockPos:
+        "`self` with `x` replaced with `n`"
+        return _new_tuple(BlockPos, (index(n), self[1], self[2]))
+
+    def withY(self, n: int) -> BlockPos:
+        "`self` with `y` replaced with `n`"
+        return _new_tuple(BlockPos, (self[0], index(n), self[2]))
+
+    def withZ(self, n: int) -> BlockPos:
+        "`self` with `z` replaced with `n`"
+        return _new_tuple(BlockPos, (self[0], self[1], index(n)))
+
+
+def _pos_or_vec3(x: _NumType, y: _NumType, z: _NumType) -> BlockPos | Vec3:
+    if type(x) is int and type(y) is int and type(z) is int:
+        return _new_tuple(BlockPos, (x, y, z))
+    return Vec3(x, y, z)
+
+
 # TODO: clamp, scale?, from_tuple?, normalize?, test for missing and cls.constants
 
 if __name__ == "__main__":
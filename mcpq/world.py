@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import time
+from typing import Any, Iterable
+
+import grpc
+
 from . import entity
 from ._abc import _ServerInterface
 from ._base import _HasServer, _SharedBase
+from ._chunkcache import MAX_SECTIONS, ChunkCache, _as_grid, _fetch_blocks, _fetch_heights
+from ._nbtquery import _data_command, _parse_nbt_output, _query_nbt_many
 from ._proto import minecraft_pb2 as pb
 from ._types import CARDINAL, COLOR, DIRECTION
 from ._util import warning
 from .exception import raise_on_error
-from .nbt import NBT, Block, EntityType
-from .vec3 import Vec3
-
-MAX_BLOCKS = 50000  # TODO: replace with block stream
+from .nbt import NBT, Block, EntityType, NbtType
+from .tracing import span, traced
+from .vec3 import BlockPos, Vec3
 
 
 class _DefaultWorld(_SharedBase, _HasServer):
@@ -48,17 +54,20 @@ class _DefaultWorld(_SharedBase, _HasServer):
        mc.setBed(ground_pos.up(1))  # place a bed on top of diamond block
     """
 
+    _chunk_cache: ChunkCache | None = None
+
     @property
     def _pb_world(self) -> pb.World | None:
         return None
 
     def __getitem__(
         self,
-        pos: tuple[int, int, int] | Vec3,
+        pos: tuple[int, int, int] | Vec3 | BlockPos,
     ) -> str:
         """Allowed access:
-        world[1,2,3] == world[Vec3(1,2,3)] == world[(1,2,3)] for single block access"""
-        if isinstance(pos, Vec3):
+        world[1,2,3] == world[Vec3(1,2,3)] == world[BlockPos(1,2,3)] == world[(1,2,3)] for single block access
+        """
+        if isinstance(pos, (Vec3, BlockPos)):
             return self.getBlock(pos)
         elif isinstance(pos, tuple):
             if len(pos) == 3:
@@ -76,16 +85,16 @@ class _DefaultWorld(_SharedBase, _HasServer):
 
     def __setitem__(
         self,
-        pos: tuple[int | slice, int | slice, int | slice] | Vec3,
+        pos: tuple[int | slice, int | slice, int | slice] | Vec3 | BlockPos,
         blocktype: str,
     ) -> None:
         """Allowed access:
-        world[1,2,3] == world[Vec3(1,2,3)] == world[(1,2,3)] for single block access
+        world[1,2,3] == world[Vec3(1,2,3)] == world[BlockPos(1,2,3)] == world[(1,2,3)] for single block access
         world[1:4, 2, 0:10:2] == world[1:4, 2:3, 0:10:2] for slice access]"""
         if not isinstance(blocktype, str):
             raise TypeError(f"Expected to set blocktype str, got {type(blocktype)} instead")
 
-        if isinstance(pos, Vec3):
+        if isinstance(pos, (Vec3, BlockPos)):
             return self.setBlock(blocktype, pos)
         elif isinstance(pos, tuple):
             if len(pos) == 3:
@@ -163,12 +172,50 @@ class _DefaultWorld(_SharedBase, _HasServer):
         )
         raise_on_error(response.status)
 
+    @property
+    def chunkCache(self) -> ChunkCache | None:
+        "The :class:`~mcpq._chunkcache.ChunkCache` of this world if enabled with :func:`enableChunkCache`, otherwise None"
+        return self._chunk_cache
+
+    def enableChunkCache(self, max_sections: int = MAX_SECTIONS) -> ChunkCache:
+        """Cache the block types of this world in 16x16x16 sections, so that reading many nearby blocks mostly does not need the server,
+        see :class:`~mcpq._chunkcache.ChunkCache` for details. If the cache is already enabled, it is replaced by an empty one.
+
+        .. code-block:: python
+
+           mc.enableChunkCache()
+           blocks = mc.copyBlockCube(Vec3(0, 0, 0), Vec3(63, 63, 63))  # loads 64 sections
+           block = mc.getBlock(Vec3(10, 10, 10))  # answered by the cache
+
+        :param max_sections: the maximum number of sections kept, each about 4 KiB, defaults to 1024
+        :type max_sections: int, optional
+        :return: the new cache
+        :rtype: ChunkCache
+        """
+        self._chunk_cache = ChunkCache(self, max_sections)
+        return self._chunk_cache
+
+    def disableChunkCache(self) -> None:
+        "Disable and drop the cache enabled with :func:`enableChunkCache`, all reads go to the server again."
+        self._chunk_cache = None
+
+    def _invalidate(self, pos1: Vec3, pos2: Vec3 | None = None) -> None:
+        cache = self._chunk_cache
+        if cache is not None:
+            cache.invalidate(pos1, pos2)
+
     def getHighestPos(self, x: int | float, z: int | float) -> Vec3:
         """The position of the highest non-air block with given `x` and `z` in the world.
 
         :return: The position of the highest non-air block with given `x` and `z`
         :rtype: Vec3
         """
+        cache = self._chunk_cache
+        if cache is not None:
+            return Vec3(int(x), cache.getHeight(x, z), int(z))
+        return self._fetch_highest_pos(x, z)
+
+    def _fetch_highest_pos(self, x: int | float, z: int | float) -> Vec3:
         response = self._server.stub.getHeight(
             pb.HeightRequest(world=self._pb_world, x=int(x), z=int(z))
         )
@@ -180,6 +227,47 @@ class _DefaultWorld(_SharedBase, _HasServer):
         "Equivalent to the y value of :func:`getHighestPos` with `x` and `z`."
         return self.getHighestPos(x, z).y  # type: ignore
 
+    @traced("World.getHeightmap")
+    def getHeightmap(
+        self, x1: int | float, z1: int | float, x2: int | float, z2: int | float
+    ) -> Any:
+        """The heights (see :func:`getHeight`) of all columns in the rectangle between the corners `x1`, `z1` and `x2`, `z2` (inclusive).
+        The columns are queried in a pipelined batch instead of one round trip each.
+        If the chunk cache is enabled (see :func:`enableChunkCache`), the heights are cached per chunk
+        and invalidated by blocks set through this world.
+
+        The result is indexed with ``[x - min(x1, x2)][z - min(z1, z2)]``.
+        It is a 2D :class:`numpy.ndarray` of type ``int32`` if `NumPy <https://numpy.org/>`_ is installed,
+        otherwise a list of compact :class:`array.array` rows.
+
+        .. code-block:: python
+
+           heights = mc.getHeightmap(0, 0, 63, 63)  # 4096 columns
+           print(heights[10][20])  # same as mc.getHeight(10, 20)
+           print(heights.max())  # with NumPy installed
+
+        :param x1: x coordinate of one corner
+        :type x1: int | float
+        :param z1: z coordinate of one corner
+        :type z1: int | float
+        :param x2: x coordinate of the opposite corner
+        :type x2: int | float
+        :param z2: z coordinate of the opposite corner
+        :type z2: int | float
+        :return: the heights of the columns in the rectangle
+        :rtype: numpy.ndarray | list[array.array]
+        """
+        x1, z1, x2, z2 = int(x1), int(z1), int(x2), int(z2)
+        xs = range(min(x1, x2), max(x1, x2) + 1)
+        zs = range(min(z1, z2), max(z1, z2) + 1)
+        columns = [(x, z) for x in xs for z in zs]
+        cache = self._chunk_cache
+        if cache is not None:
+            heights = cache.getHeights(columns)
+        else:
+            heights = _fetch_heights(self._server, self._pb_world, columns)
+        return _as_grid(heights, len(xs), len(zs))
+
     def getBlock(self, pos: Vec3) -> Block:
         """The block :class:`Block` type/id at position `pos` in world.
 
@@ -193,6 +281,9 @@ class _DefaultWorld(_SharedBase, _HasServer):
         :return: block type/id at queried position
         :rtype: Block
         """
+        cache = self._chunk_cache
+        if cache is not None:
+            return cache.getBlock(pos)
         pos = pos.floor()
         response = self._server.stub.getBlock(
             pb.BlockRequest(world=self._pb_world, pos=pb.Vec3(x=pos.x, y=pos.y, z=pos.z))
@@ -231,6 +322,7 @@ class _DefaultWorld(_SharedBase, _HasServer):
         raise_on_error(response.status)
         return Block(response.info.blockType + response.info.blockData)
 
+    @traced("World.getBlockList")
     def getBlockList(self, positions: list[Vec3]) -> list[Block]:
         """The list of all block :class:`Block` types/ids at given `positions` in world in the same order.
 
@@ -243,9 +335,15 @@ class _DefaultWorld(_SharedBase, _HasServer):
         :return: list of block types/ids at given positions (same order)
         :rtype: list[Block]
         """
-        # TODO: natively support this operation
-        return [self.getBlock(pos) for pos in positions]
+        cache = self._chunk_cache
+        if cache is not None:
+            return cache.getBlockList(positions)
+        floored = [pos.floor() for pos in positions]
+        return [
+            Block(block) for block in _fetch_blocks(self._server, self._pb_world, floored, False)
+        ]
 
+    @traced("World.getBlockListWithData")
     def getBlockListWithData(self, positions: list[Vec3]) -> list[Block]:
         """The list of all block :class:`Block` at given `positions` in world with component data in the same order.
 
@@ -254,8 +352,10 @@ class _DefaultWorld(_SharedBase, _HasServer):
         :return: list of block type/ids and component data at given positions (same order)
         :rtype: list[Block]
         """
-        # TODO: natively support this operation
-        return [self.getBlockWithData(pos) for pos in positions]
+        floored = [pos.floor() for pos in positions]
+        return [
+            Block(block) for block in _fetch_blocks(self._server, self._pb_world, floored, True)
+        ]
 
     def setBlock(self, blocktype: str | Block, pos: Vec3) -> None:
         """Change the block at position `pos` to `blocktype` in world.
@@ -305,7 +405,9 @@ class _DefaultWorld(_SharedBase, _HasServer):
             )
         )
         raise_on_error(response)
+        self._invalidate(pos)
 
+    @traced("World.setBlockList")
     def setBlockList(self, blocktype: str | Block, positions: list[Vec3]) -> None:
         """Change all blocks at `positions` to `blocktype` in world.
         This will overwrite all blocks at the given positions.
@@ -333,19 +435,40 @@ class _DefaultWorld(_SharedBase, _HasServer):
             if isinstance(blocktype, Block) and blocktype.hasData
             else pb.BlockInfo(blockType=blocktype)
         )
-        for chunk in (
-            positions[index : index + MAX_BLOCKS] for index in range(0, len(positions), MAX_BLOCKS)
-        ):
-            floored = (pos.floor() for pos in chunk)
-            response = self._server.stub.setBlocks(
-                pb.Blocks(
-                    world=self._pb_world,
-                    info=pb_info,
-                    pos=[pb.Vec3(x=pos.x, y=pos.y, z=pos.z) for pos in floored],
+        # the number of blocks per request adapts to the latency of the server and the message size limit
+        batcher = self._server.block_batcher()
+        floored = (pos.floor() for pos in positions)
+        pb_positions = [pb.Vec3(x=pos.x, y=pos.y, z=pos.z) for pos in floored]
+        index = 0
+        try:
+            while index < len(pb_positions):
+                count = batcher.chunk_size()
+                request = pb.Blocks(
+                    world=self._pb_world, info=pb_info, pos=pb_positions[index : index + count]
                 )
-            )
-            raise_on_error(response)
-
+                count = len(request.pos)
+                fitting = batcher.fit(count, request.ByteSize())
+                if fitting < count:
+                    count = fitting
+                    del request.pos[count:]
+                start = time.perf_counter()
+                try:
+                    response = self._server.stub.setBlocks(request)
+                except grpc.RpcError as e:
+                    if e.code() == grpc.StatusCode.RESOURCE_EXHAUSTED and count > 1:
+                        batcher.rejected(count)  # message was too large, retry in smaller chunks
+                        continue
+                    raise
+                raise_on_error(response)
+                batcher.record(count, time.perf_counter() - start)
+                index += count
+        finally:
+            # also if a chunk failed, the chunks before it (and maybe the failed one) were written
+            cache = self._chunk_cache
+            if cache is not None:
+                cache._invalidate_positions(positions)
+
+    @traced("World.setBlockCube")
     def setBlockCube(self, blocktype: str | Block, pos1: Vec3, pos2: Vec3) -> None:
         """Change all blocks in a cube between the corners `pos1` and `pos2` in world to `blocktype`, where both positions are *inclusive*. meaning that both given positions/corners will be part of the cube.
         This will overwrite all blocks between the given positions.
@@ -390,7 +513,9 @@ class _DefaultWorld(_SharedBase, _HasServer):
             )
         )
         raise_on_error(response)
+        self._invalidate(pos1, pos2)
 
+    @traced("World.setBed")
     def setBed(self, pos: Vec3, direction: CARDINAL = "east", color: COLOR = "red") -> None:
         """Place a bed at `pos` in `direction` with `color`, which is composed of two placed blocks with specific block data.
 
@@ -407,6 +532,7 @@ class _DefaultWorld(_SharedBase, _HasServer):
         self.setBlock(Block(f"{color}_bed[part=head,facing={direction}]"), pos2)
         self.setBlock(Block(f"{color}_bed[part=foot,facing={direction}]"), pos)
 
+    @traced("World.setSign")
     def setSign(
         self,
         pos: Vec3,
@@ -513,6 +639,7 @@ class _DefaultWorld(_SharedBase, _HasServer):
         self.setBlock(sign_block, pos)
         self.runCommand(cmd)
 
+    @traced("World.copyBlockCube")
     def copyBlockCube(
         self, pos1: Vec3, pos2: Vec3, withData: bool = False
     ) -> list[list[list[Block]]]:
@@ -530,15 +657,13 @@ class _DefaultWorld(_SharedBase, _HasServer):
         """
         pos1, pos2 = pos1.map_pairwise(min, pos2), pos1.map_pairwise(max, pos2)
         pos1, pos2 = pos1.floor(), pos2.floor()
-        getfunc = self.getBlockWithData if withData else self.getBlock
-        return [
-            [
-                [getfunc(Vec3(x, y, z)) for z in range(pos1.z, pos2.z + 1)]
-                for y in range(pos1.y, pos2.y + 1)
-            ]
-            for x in range(pos1.x, pos2.x + 1)
-        ]
+        xs, ys, zs = (range(a, b + 1) for a, b in zip(pos1, pos2))
+        positions = [Vec3(x, y, z) for x in xs for y in ys for z in zs]
+        blocks = self.getBlockListWithData(positions) if withData else self.getBlockList(positions)
+        it = iter(blocks)
+        return [[[next(it) for _ in zs] for _ in ys] for _ in xs]
 
+    @traced("World.pasteBlockCube")
     def pasteBlockCube(
         self,
         blocktypes: list[list[list[str | Block]]],
@@ -580,7 +705,10 @@ class _DefaultWorld(_SharedBase, _HasServer):
         pos = pos.floor()
         xlen, ylen, zlen = len(blocktypes), len(blocktypes[0]), len(blocktypes[0][0])
         xstride, ystride, zstride = ylen * zlen, zlen, 1
-        blocks = [blocktype for xslice in blocktypes for yline in xslice for blocktype in yline]
+        with span("World.pasteBlockCube.flatten"):
+            blocks = [
+                blocktype for xslice in blocktypes for yline in xslice for blocktype in yline
+            ]
         if rotation == "east":
             pass  # noting to do
         elif rotation == "south":
@@ -611,18 +739,20 @@ class _DefaultWorld(_SharedBase, _HasServer):
         xrange = range(xlen) if xstride >= 0 else range(xlen - 1, -1, -1)
         yrange = range(ylen) if ystride >= 0 else range(ylen - 1, -1, -1)
         zrange = range(zlen) if zstride >= 0 else range(zlen - 1, -1, -1)
-        for xindex, x in enumerate(xrange):
-            for yindex, y in enumerate(yrange):
-                for zindex, z in enumerate(zrange):
-                    index = x * abs(xstride) + y * abs(ystride) + z * abs(zstride)
-                    assert (
-                        0 <= index < len(blocks)
-                    ), f"{x=} {y=}, {z=} {xstride=} {ystride=} {zstride=} {index=} len={len(blocks)}"
-                    self.setBlock(
-                        blocks[index],
-                        Vec3(pos.x + xindex, pos.y + yindex, pos.z + zindex),
-                    )
-
+        with span("World.pasteBlockCube.place", blocks=len(blocks)):
+            for xindex, x in enumerate(xrange):
+                for yindex, y in enumerate(yrange):
+                    for zindex, z in enumerate(zrange):
+                        index = x * abs(xstride) + y * abs(ystride) + z * abs(zstride)
+                        assert (
+                            0 <= index < len(blocks)
+                        ), f"{x=} {y=}, {z=} {xstride=} {ystride=} {zstride=} {index=} len={len(blocks)}"
+                        self.setBlock(
+                            blocks[index],
+                            Vec3(pos.x + xindex, pos.y + yindex, pos.z + zindex),
+                        )
+
+    @traced("World.spawnEntity")
     def spawnEntity(self, type: str | EntityType, pos: Vec3) -> entity.Entity:
         """Spawn and return a new entitiy of given `type` at position `pos` in world.
         The entity has default settings and behavior.
@@ -659,6 +789,7 @@ class _DefaultWorld(_SharedBase, _HasServer):
         entity._type = EntityType(response.entity.type)
         return entity
 
+    @traced("World.spawnItems")
     def spawnItems(self, type: str | Block, pos: Vec3, amount: int = 1) -> None:
         """Spawn `amount` many collectable items of `type` at `pos`.
 
@@ -696,6 +827,7 @@ class _DefaultWorld(_SharedBase, _HasServer):
                 nbt["Item"]["components"] = data.asCompound()
         self.runCommand(f"summon item {pos.x} {pos.y} {pos.z} {nbt}")
 
+    @traced("World.getEntities")
     def getEntities(
         self, type: str | EntityType | None = None, only_spawnable: bool = True
     ) -> list[entity.Entity]:
@@ -719,6 +851,7 @@ class _DefaultWorld(_SharedBase, _HasServer):
         """
         return self._fetch_entities(not only_spawnable, False, type if type else "")
 
+    @traced("World.getEntitiesAround")
     def getEntitiesAround(
         self,
         pos: Vec3,
@@ -740,8 +873,10 @@ class _DefaultWorld(_SharedBase, _HasServer):
         :rtype: list[entity.Entity]
         """
         entities = self._fetch_entities(not only_spawnable, True, type if type else "")
-        return [e for e in entities if pos.distance(e.pos) <= distance]
+        with span("World.getEntitiesAround.filter", entities=len(entities)):
+            return [e for e in entities if pos.distance(e.pos) <= distance]
 
+    @traced("World.removeEntities")
     def removeEntities(self, type: str | EntityType | None = None) -> None:
         """Remove all entities (except players) from the world, they do not drop anything.
         If `type` is provided remove only entities of that type.
@@ -762,36 +897,87 @@ class _DefaultWorld(_SharedBase, _HasServer):
         else:
             raise TypeError("Type should be of type str")
 
-    def getNbt(self, pos: Vec3) -> NBT | False | None:
+    @traced("World.getNbt")
+    def getNbt(self, pos: Vec3, path: str | None = None) -> NBT | NbtType | False | None:
         """Get the block entitiy's NBT data at `pos` as :class:`NBT`.
         Return `None` if the block is not loaded or `False` if the block is loaded but not a block entity.
         The data is not cached NBT data is always queried on call.
 
+        If only a part of the data is needed, select it with an `NBT path <https://minecraft.wiki/w/NBT_path_format>`_,
+        which is applied by the server, so that less data is transferred and parsed.
+        The selected value may be of any NBT type and `None` is returned if nothing matches `path`.
+
+        .. code-block:: python
+
+           items = mc.getNbt(Vec3(0, 64, 0), path="Items")  # NbtList of the items in a chest
+           first = mc.getNbt(Vec3(0, 64, 0), path="Items[0].id")  # id of the first item
+
         .. caution::
 
            This function requires command output captuing.
            The plugin that is built against the ``spigot-Bukkit API`` does *not* fully support the return of command output.
+
+        :param pos: the position of the block entity
+        :type pos: Vec3
+        :param path: if given, only return the data selected by this NBT path, defaults to None
+        :type path: str | None, optional
         """
         pos = pos.floor()
-        out = self.runCommandBlocking(f"data get block {pos.x} {pos.y} {pos.z}")
-        if out and "{" in out and "}" in out:
-            nbtstr = out[out.index("{") : out.rindex("}") + 1]
-            try:
-                return NBT.parse(nbtstr)
-            except Exception:
-                import traceback
-
-                traceback.print_exc()
-                _in_world = f" in {self.key}" if isinstance(self, World) else ""
-                warning(
-                    f"NBT data of block entity at {pos}{_in_world} could not be parsed: {nbtstr}"
-                )
-        elif not out:
-            warning(
-                "No response received. Your plugin version may not support command output capturing (built against Spigot API)."
-            )
-        elif "not a block entity" in out.lower():
-            return False
+        out = self.runCommandBlocking(_data_command(f"block {pos.x} {pos.y} {pos.z}", path))
+        return _parse_nbt_output(out, path, self._describe_block(pos))
+
+    @traced("World.getNbtMany")
+    def getNbtMany(
+        self, positions: Iterable[Vec3], path: str | None = None
+    ) -> list[NBT | NbtType | False | None]:
+        """Equivalent to calling :func:`getNbt` for every position in `positions`, but much faster for many positions,
+        as the queries are pipelined and their outputs are parsed while the remaining outputs are still received.
+
+        .. code-block:: python
+
+           chests = [pos for pos in area if mc.getBlock(pos) == "chest"]
+           inventories = mc.getNbtMany(chests, path="Items")
+
+        :param positions: the positions of the block entities
+        :type positions: Iterable[Vec3]
+        :param path: if given, only return the data selected by this NBT path, defaults to None
+        :type path: str | None, optional
+        :return: the NBT data (or `None` or `False`, see :func:`getNbt`) in the same order as `positions`
+        :rtype: list[NBT | NbtType | False | None]
+        """
+        positions = [pos.floor() for pos in positions]
+        commands = [
+            self._prefix_command(_data_command(f"block {pos.x} {pos.y} {pos.z}", path))
+            for pos in positions
+        ]
+        whats = [self._describe_block(pos) for pos in positions]
+        return _query_nbt_many(self._server, commands, path, whats)
+
+    @traced("World.getNbtForEntities")
+    def getNbtForEntities(
+        self, entities: Iterable[entity.Entity], path: str | None = None
+    ) -> list[NBT | NbtType | None]:
+        """Equivalent to calling :func:`~mcpq.entity.Entity.getNbt` for every entity in `entities`, but much faster for many entities,
+        as the queries are pipelined and their outputs are parsed while the remaining outputs are still received.
+
+        .. code-block:: python
+
+           healths = mc.getNbtForEntities(mc.getEntities("zombie"), path="Health")
+
+        :param entities: the entities whose data should be returned
+        :type entities: Iterable[entity.Entity]
+        :param path: if given, only return the data selected by this NBT path, defaults to None
+        :type path: str | None, optional
+        :return: the NBT data (or `None` if not loaded) in the same order as `entities`
+        :rtype: list[NBT | NbtType | None]
+        """
+        entities = list(entities)
+        commands = [_data_command(f"entity {e.id}", path) for e in entities]
+        return _query_nbt_many(self._server, commands, path, [str(e) for e in entities])  # type: ignore
+
+    def _describe_block(self, pos: Vec3) -> str:
+        _in_world = f" in {self.key}" if isinstance(self, World) else ""
+        return f"block entity at {pos}{_in_world}"
 
 
 class World(_DefaultWorld, _SharedBase, _HasServer):
@@ -876,6 +1062,9 @@ class World(_DefaultWorld, _SharedBase, _HasServer):
         # return f"{self.__class__.__name__}(name={self.name}, key={self.key})"
         return f"{self.__class__.__name__}(key={self.key})"
 
+    def _prefix_command(self, command: str) -> str:
+        return f"execute in {self.key} run " + command
+
     def runCommand(self, command: str) -> None:
         """Run the `command` as if it was typed in chat as ``/``-command and executed in this specific world/dimension.
         Returns immediately without waiting for the command to finish executing.
@@ -887,8 +1076,7 @@ class World(_DefaultWorld, _SharedBase, _HasServer):
         :param command: the command without the slash ``/``
         :type command: str
         """
-        command = f"execute in {self.key} run " + command
-        return super().runCommand(command)
+        return super().runCommand(self._prefix_command(command))
 
     def runCommandBlocking(self, command: str) -> str:
         """Run the `command` as if it was typed in chat as ``/``-command and executed in this specific world/dimension.
@@ -909,5 +1097,4 @@ class World(_DefaultWorld, _SharedBase, _HasServer):
         :return: the console output of the command
         :rtype: str
         """
-        command = f"execute in {self.key} run " + command
-        return super().runCommandBlocking(command)
+        return super().runCommandBlocking(self._prefix_command(command))
@@ -30,6 +30,10 @@ LOCAL_PLUGIN_SEARCH_LOCATION = [
 SERVER_JAVA_EXE = Path("java")
 # location to download servers to
 SERVER_VERSIONS_FOLDER = Path(__file__).parent / ".nox_servers"
+# location of the tracked benchmark baselines (one folder per machine id, see pytest-benchmark)
+BENCHMARK_BASELINES = Path(__file__).parent / "benchmarks" / "baselines"
+# fail the benchmark session if the mean of a benchmark regressed by more than this
+BENCHMARK_MAX_REGRESSION = "mean:25%"
 
 # VERSIONS (always sort from newest to oldest!)
 
@@ -135,6 +139,28 @@ def plugin_test(session: nox.Session, plugin_version: str):
     session.run("pytest")
 
 
+@nox.session(python=PY_VERSIONS[-1], venv_backend="uv|virtualenv", default=False)
+def benchmark(session: nox.Session):
+    # not run by a plain `nox`, only with: nox -s benchmark
+    # runs against the local stand-in server, no minecraft server needed
+    # save a new baseline with: nox -s benchmark -- --benchmark-save=baseline
+    session.install("pytest", "pytest-benchmark", "pytest-timeout")
+    session.install(".")  # install latest according to pyproject.toml
+    check_installed_deps(session, ["grpcio", "protobuf", "mcpq"])
+    machine_id = session.run(
+        "python",
+        "-c",
+        "from pytest_benchmark.utils import get_machine_id; print(get_machine_id())",
+        silent=True,
+    ).strip()
+    args = ["pytest", "benchmarks", f"--benchmark-storage={BENCHMARK_BASELINES.as_posix()}"]
+    if list((BENCHMARK_BASELINES / machine_id).glob("*.json")):
+        args += ["--benchmark-compare", f"--benchmark-compare-fail={BENCHMARK_MAX_REGRESSION}"]
+    else:
+        session.warn(f"No benchmark baseline for {machine_id}, only running benchmarks")
+    session.run(*args, *session.posargs)
+
+
 def check_installed_deps(session: nox.Session, expected_installs: list[str]):
     if session.venv_backend == "uv":
         output = session.run("uv", "pip", "freeze", silent=True)
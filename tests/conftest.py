@@ -0,0 +1,17 @@
+import pytest
+
+from mcpq import Minecraft
+from mcpq.testing import FakeServer
+
+
+@pytest.fixture
+def fake():
+    with FakeServer() as server:
+        yield server
+
+
+@pytest.fixture
+def mc(fake):
+    mc = Minecraft("localhost", fake.port)
+    yield mc
+    mc._cleanup()
@@ -0,0 +1,79 @@
+import grpc
+import pytest
+
+from mcpq import Minecraft, Vec3
+from mcpq._batching import INCREASE_BLOCKS, MIN_BLOCKS, _AdaptiveBatcher
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+def test_aimd():
+    batcher = _AdaptiveBatcher(max_blocks=10000, target_latency=0.1)
+    assert batcher.chunk_size() == 10000
+    batcher.record(10000, 0.5)
+    assert batcher.chunk_size() == 5000
+    batcher.record(5000, 0.5)
+    assert batcher.chunk_size() == 2500
+    batcher.record(2500, 0.01)
+    assert batcher.chunk_size() == 2500 + INCREASE_BLOCKS
+    batcher.record(10, 0.01)  # small remainder of a list does not grow the chunk size
+    assert batcher.chunk_size() == 2500 + INCREASE_BLOCKS
+    for _ in range(10):
+        batcher.record(batcher.chunk_size(), 0.01)
+    assert batcher.chunk_size() == 10000
+    for _ in range(20):
+        batcher.record(batcher.chunk_size(), 1.0)
+    assert batcher.chunk_size() == MIN_BLOCKS
+    stats = batcher.stats()
+    assert stats["chunks"] == 34
+    assert stats["decreases"] == 22
+
+
+def test_fit_and_rejected():
+    batcher = _AdaptiveBatcher(max_message_size=1000)
+    assert batcher.fit(100, 900) == 100
+    assert batcher.fit(100, 2000) < 50
+    assert batcher.fit(1, 2000) == 1
+    assert batcher.rejected(1000) == 500
+    assert batcher.chunk_size() == 500
+    assert batcher.stats()["rejections"] == 1
+    with pytest.raises(ValueError):
+        _AdaptiveBatcher(max_blocks=0)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_set_block_list_respects_message_size(fake):
+    mc = Minecraft("localhost", fake.port, instrument=True)
+    mc._server._block_batcher = _AdaptiveBatcher(max_message_size=1000)
+    records = []
+    mc.addStatsExporter(records.append)
+    positions = [Vec3(x, -x, 0) for x in range(500)]
+    mc.setBlockList("stone", positions)
+    assert fake.block_count() == 500
+    sizes = [r.request_bytes for r in records if r.method == "setBlocks"]
+    assert len(sizes) >= 9
+    assert max(sizes) <= 1000
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_set_block_list_splits_rejected_requests(fake, mc):
+    fake.faults["setBlocks"] = [grpc.StatusCode.RESOURCE_EXHAUSTED] * 2
+    positions = [Vec3(x, 0, 0) for x in range(1000)]
+    mc.setBlockList("stone", positions)
+    assert fake.block_count() == 1000
+    assert mc._server.block_batcher().stats()["rejections"] == 2
+    assert fake.calls["setBlocks"] == 2 + 2  # two rejected, then a quarter and the rest
+    fake.faults["setBlocks"] = [grpc.StatusCode.UNAVAILABLE]
+    with pytest.raises(grpc.RpcError):  # other errors are raised
+        mc.setBlockList("dirt", positions)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_set_block_list_adapts_to_latency(fake, mc):
+    mc._server._block_batcher = _AdaptiveBatcher(max_blocks=4096, target_latency=0.05)
+    fake.method_latency["setBlocks"] = 0.1
+    mc.setBlockList("stone", [Vec3(x, 0, z) for x in range(64) for z in range(64)])
+    assert fake.block_count() == 4096
+    assert mc._server.block_batcher().chunk_size() == 2048
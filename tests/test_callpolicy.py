@@ -0,0 +1,145 @@
+import time
+
+import grpc
+import pytest
+
+from mcpq import Minecraft, RetryPolicy, Vec3
+from mcpq._proto import minecraft_pb2 as pb
+from mcpq.exception import BlockTypeNotFound
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+UNAVAILABLE = grpc.StatusCode.UNAVAILABLE
+
+
+def connect(fake, **kwargs) -> Minecraft:
+    mc = Minecraft("localhost", fake.port, **kwargs)
+    mc.getBlock(Vec3())  # connect before measuring
+    fake.calls.clear()
+    return mc
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_client_timeout(fake):
+    mc = connect(fake, timeout=0.1)
+    fake.faults["getBlock"] = [1.0]
+    start = time.perf_counter()
+    with pytest.raises(grpc.RpcError) as excinfo:
+        mc.getBlock(Vec3())
+    assert excinfo.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert time.perf_counter() - start < 0.5
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_deadline_scope(fake):
+    mc = connect(fake)
+    fake.faults["getBlock"] = [0.15, 0.15]
+    with mc.deadline(0.25):
+        mc.getBlock(Vec3())  # takes about 0.15s of the 0.25s
+        with pytest.raises(grpc.RpcError) as excinfo:
+            mc.getBlock(Vec3())  # only about 0.1s left
+    assert excinfo.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    fake.faults["getBlock"] = [0.15]
+    mc.getBlock(Vec3())  # no deadline outside of scope
+    with mc.deadline(10):
+        with mc.deadline(0.05):
+            fake.faults["getBlock"] = [0.15]
+            with pytest.raises(grpc.RpcError):
+                mc.getBlock(Vec3())
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_retry_idempotent_reads(fake):
+    mc = connect(fake, retry=RetryPolicy(max_attempts=3, initial_backoff=0.01))
+    fake.faults["getBlock"] = [UNAVAILABLE, UNAVAILABLE]
+    assert mc.getBlock(Vec3()) == "air"
+    assert fake.calls["getBlock"] == 3
+    fake.faults["getBlock"] = [UNAVAILABLE] * 3
+    with pytest.raises(grpc.RpcError):
+        mc.getBlock(Vec3())
+    assert fake.calls["getBlock"] == 6
+    fake.faults["getPlayers"] = [UNAVAILABLE]
+    assert mc.getPlayerList() == []
+    assert fake.calls["getPlayers"] == 2
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_retry_pipelined_reads(fake):
+    mc = connect(fake, retry=RetryPolicy(max_attempts=3, initial_backoff=0.01))
+    fake.set_block("stone", (1, 0, 0))
+    fake.faults["getBlock"] = [UNAVAILABLE, UNAVAILABLE, UNAVAILABLE]
+    positions = [Vec3(x, 0, 0) for x in range(3)]
+    assert mc.getBlockList(positions) == ["air", "stone", "air"]
+    assert fake.calls["getBlock"] == 6
+    fake.faults["getBlock"] = [UNAVAILABLE] * 3
+    with pytest.raises(grpc.RpcError):
+        mc.getBlockList(positions[:1])
+    future = mc._server.stub.getBlock.future(pb.BlockRequest())
+    assert future.result().info.blockType == "air" and future.done()
+    assert not future.cancel()
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_no_retry_of_writes_and_other_errors(fake):
+    mc = connect(fake, retry=RetryPolicy(initial_backoff=0.01))
+    fake.faults["setBlock"] = [UNAVAILABLE]
+    with pytest.raises(grpc.RpcError):
+        mc.setBlock("stone", Vec3())
+    assert fake.calls["setBlock"] == 1
+    fake.faults["getBlock"] = [grpc.StatusCode.INVALID_ARGUMENT]
+    with pytest.raises(grpc.RpcError):
+        mc.getBlock(Vec3())
+    assert fake.calls["getBlock"] == 1
+    with pytest.raises(BlockTypeNotFound):  # errors of the plugin are never retried
+        mc.setBlock("not_a_block", Vec3())
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_retry_respects_deadline(fake):
+    mc = connect(fake, retry=RetryPolicy(max_attempts=10, initial_backoff=0.2))
+    fake.faults["getBlock"] = [UNAVAILABLE] * 10
+    start = time.perf_counter()
+    with mc.deadline(0.3):
+        with pytest.raises(grpc.RpcError):
+            mc.getBlock(Vec3())
+    assert time.perf_counter() - start < 0.3
+    assert fake.calls["getBlock"] <= 2
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_hedged_reads(fake):
+    mc = connect(fake, retry=RetryPolicy(hedge_delay=0.05))
+    fake.faults["getBlock"] = [1.0]  # only the first request is slow
+    start = time.perf_counter()
+    assert mc.getBlock(Vec3()) == "air"
+    assert time.perf_counter() - start < 0.5
+    assert fake.calls["getBlock"] == 2
+    assert mc.getBlock(Vec3()) == "air"  # fast requests are not hedged
+    assert fake.calls["getBlock"] == 3
+    fake.faults["getBlock"] = [UNAVAILABLE]  # a failed request is hedged immediately
+    assert mc.getBlock(Vec3()) == "air"
+    assert fake.calls["getBlock"] == 5
+    fake.faults["getBlock"] = [grpc.StatusCode.INVALID_ARGUMENT]  # unless it cannot succeed
+    with pytest.raises(grpc.RpcError) as excinfo:
+        mc.getBlock(Vec3())
+    assert excinfo.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    assert fake.calls["getBlock"] == 6
+    mc._cleanup()
+
+
+def test_retry_policy_invalid_arguments():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
+    with pytest.raises(ValueError):
+        RetryPolicy(hedge_delay=0.1, max_hedges=0)
+    policy = RetryPolicy(initial_backoff=0.1, max_backoff=0.3, jitter=0)
+    assert [policy.backoff(i) for i in range(1, 5)] == [0.1, 0.2, 0.3, 0.3]
@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+
+from mcpq import Minecraft, Vec3
+from mcpq._channelpool import _StubPool
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_single_channel_has_no_pool(fake):
+    mc = Minecraft("localhost", fake.port)
+    assert mc._server.pool is None
+    assert mc._server.stub is mc._server.event_stub
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_invalid_arguments(fake):
+    with pytest.raises(ValueError):
+        Minecraft("localhost", fake.port, channels=0)
+    with pytest.raises(ValueError):
+        Minecraft("localhost", fake.port, channels=2, channel_selection="random")  # type: ignore
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_round_robin_spreads_calls(fake):
+    mc = Minecraft("localhost", fake.port, channels=4)
+    assert len(mc._server.pool) == 3
+    for _ in range(30):
+        mc.getBlock(Vec3())
+    assert len(fake.peers) == 3  # one connection per pooled channel
+    assert sorted(fake.peers.values()) == [10, 10, 10]
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_least_loaded_avoids_busy_channel(fake):
+    mc = Minecraft("localhost", fake.port, channels=3, channel_selection="least_loaded")
+    pool = mc._server.pool
+    for _ in range(4):
+        mc.getBlock(Vec3())  # connect all channels
+    fake.faults["getBlock"] = [1.0]
+    slow = threading.Thread(target=mc.getBlock, args=(Vec3(),))
+    slow.start()
+    while fake.faults["getBlock"]:  # wait until the slow call arrived at the server
+        time.sleep(0.001)
+    busy = pool.in_flight().index(1)
+    start = time.perf_counter()
+    for _ in range(10):
+        mc.getBlock(Vec3())  # all go to the other channel
+    assert time.perf_counter() - start < 0.5
+    assert pool.in_flight()[busy] == 1
+    slow.join()
+    assert pool.in_flight() == [0, 0]
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_events_use_dedicated_channel(fake):
+    mc = Minecraft("localhost", fake.port, channels=3)
+    mc.events.chat.poll()  # open the stream
+    assert mc._server.event_stub not in mc._server.pool.stubs
+    assert all(mc._server.stub is not mc._server.event_stub for _ in range(10))
+    fake.add_player("Steve")
+    mc.postToChat("hello")
+    mc._cleanup()
+
+
+def test_stub_pool_least_loaded_ties_round_robin():
+    class Counter:
+        in_flight = 0
+
+    stubs = [object(), object(), object()]
+    pool = _StubPool(stubs, [Counter(), Counter(), Counter()])  # type: ignore
+    assert [pool.next() for _ in range(6)] == stubs + stubs
+    with pytest.raises(ValueError):
+        _StubPool([])
@@ -0,0 +1,124 @@
+import sys
+
+import grpc
+import pytest
+
+from mcpq import Vec3
+from mcpq._batching import _AdaptiveBatcher
+from mcpq._chunkcache import _Section
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+def test_section_palette():
+    uniform = _Section(["air"] * 4096)
+    assert uniform.indices is None and uniform.nbytes() == 0
+    assert uniform.get(5, 5, 5) == "air"
+    mixed = _Section(["air", "stone"] * 2048)
+    assert mixed.nbytes() == 4096
+    assert mixed.get(0, 0, 0) == "air" and mixed.get(1, 0, 0) == "stone"
+    many = _Section([f"block_{i % 300}" for i in range(4096)])
+    assert many.indices.itemsize == 2
+    assert many.get(299 % 16, 299 // 256, (299 // 16) % 16) == "block_299"
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_reads_served_from_cache(fake, mc):
+    fake.set_block("stone", Vec3(1, 2, 3))
+    fake.set_block("dirt", Vec3(17, 0, 0))
+    assert mc.chunkCache is None
+    cache = mc.enableChunkCache()
+    assert mc.getBlock(Vec3(1, 2, 3)) == "stone"
+    assert fake.calls["getBlock"] == 4096  # the whole section was loaded
+    assert mc.getBlock(Vec3(15, 15, 15)) == "air"
+    assert mc.getBlockList([Vec3(1, 2, 3), Vec3(0, 0, 0)]) == ["stone", "air"]
+    assert mc[1, 2, 3] == "stone"
+    assert fake.calls["getBlock"] == 4096
+    blocks = mc.copyBlockCube(Vec3(1, 0, 0), Vec3(17, 2, 3))
+    assert blocks[16][0][0] == "dirt" and blocks[0][2][3] == "stone"
+    assert fake.calls["getBlock"] == 2 * 4096  # the cube touches 2 sections
+    stats = cache.stats()
+    assert stats["sections"] == len(cache) == 2
+    assert stats["misses"] == 2
+    mc.disableChunkCache()
+    assert mc.getBlock(Vec3(1, 2, 3)) == "stone"
+    assert fake.calls["getBlock"] == 2 * 4096 + 1
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_own_writes_invalidate(fake, mc):
+    cache = mc.enableChunkCache()
+    cache.getBlockList([Vec3(0, 0, 0), Vec3(40, 0, 0)])  # loads two sections at once
+    assert len(cache) == 2
+    mc.setBlockList("dirt", [Vec3(1, 2, 3)])
+    assert len(cache) == 1  # only the section of the written block is dropped
+    mc.setBlockCube("gold_block", Vec3(32, 0, 0), Vec3(48, 2, 2))
+    assert len(cache) == 0
+    mc.setBlock("stone", Vec3(1, 1, 1))
+    assert mc.getBlockList([Vec3(1, 1, 1), Vec3(1, 2, 3)]) == ["stone", "dirt"]
+    fake.set_block("diamond_block", Vec3(1, 1, 1))  # not noticed
+    assert mc.getBlock(Vec3(1, 1, 1)) == "stone"
+    mc.setBlock("stone", Vec3(100, 100, 100))  # other sections are kept
+    assert len(cache) == 1
+    cache.invalidate(Vec3(1, 1, 1))
+    assert len(cache) == 0
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_failed_write_invalidates(fake, mc):
+    mc._server._block_batcher = _AdaptiveBatcher(max_blocks=1)  # one request per block
+    cache = mc.enableChunkCache()
+    positions = [Vec3(1, 0, 0), Vec3(2, 0, 0)]  # both in one section
+    assert cache.getBlockList(positions) == ["air", "air"]
+    fake.faults["setBlocks"] = [0.0, grpc.StatusCode.UNAVAILABLE]
+    with pytest.raises(grpc.RpcError):
+        mc.setBlockList("dirt", positions)  # the first block was written, the second failed
+    assert len(cache) == 0
+    assert mc.getBlock(Vec3(1, 0, 0)) == "dirt"
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_lru_and_heights(fake, mc):
+    cache = mc.enableChunkCache(max_sections=1)
+    for x in range(2):
+        mc.getBlock(Vec3(x * 16, 0, 0))
+    assert len(cache) == 1 and cache.stats()["evictions"] == 1
+    calls = fake.calls["getBlock"]
+    mc.getBlock(Vec3(16, 0, 0))  # most recently used section is still cached
+    assert fake.calls["getBlock"] == calls
+    fake.set_block("stone", Vec3(3, 10, 3))
+    assert mc.getHeight(3, 3) == 10
+    assert mc.getHighestPos(3, 3) == Vec3(3, 10, 3)
+    assert fake.calls["getHeight"] == 256  # the heightmap of the whole chunk was loaded
+    assert mc.getHeight(15, 15) == -64
+    mc.setBlock("stone", Vec3(3, 20, 3))
+    assert mc.getHeight(3, 3) == 20
+    assert fake.calls["getHeight"] == 2 * 256
+    with pytest.raises(ValueError):
+        mc.enableChunkCache(max_sections=0)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_heightmap(fake, mc):
+    fake.set_block("stone", Vec3(1, 10, 2))
+    fake.set_block("stone", Vec3(-3, 5, 4))
+    heights = mc.getHeightmap(2, 4, -3, 0)
+    assert heights.shape == (6, 5)
+    assert heights[1 + 3][2] == 10 and heights[0][4] == 5 and heights.min() == -64
+    assert fake.calls["getHeight"] == 30
+    mc.enableChunkCache()
+    cached = mc.getHeightmap(-3, 0, 2, 4)
+    assert (cached == heights).all()
+    assert fake.calls["getHeight"] == 30 + 2 * 256  # the area touches 2 chunks
+    mc.setBlock("gold_block", Vec3(0, 30, 0))
+    assert mc.getHeightmap(0, 0, 1, 2).tolist() == [[30, -64, -64], [-64, -64, 10]]
+    assert fake.calls["getHeight"] == 30 + 3 * 256
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_heightmap_without_numpy(fake, mc, monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    fake.set_block("stone", Vec3(0, 7, 1))
+    heights = mc.getHeightmap(0, 0, 1, 1)
+    assert [list(row) for row in heights] == [[-64, 7], [-64, -64]]
@@ -0,0 +1,90 @@
+import time
+
+import grpc
+import pytest
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_run_commands_pipelined(fake, mc):
+    fake.latency = 0.02
+    commands = [f"say {i}" for i in range(100)]
+    start = time.perf_counter()
+    mc.runCommands(commands, ordered=False)
+    assert time.perf_counter() - start < 100 * 0.02 / 4  # not one round trip per command
+    assert sorted(fake.commands) == sorted(commands)
+    assert fake.calls["runCommandWithOptions"] == 100
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_run_commands_ordered(fake, mc):
+    commands = [f"say {i}" for i in range(50)]
+    # later commands are faster, so pipelined commands would overtake earlier ones
+    delays = [0.01 - i * 0.0002 for i in range(50)]
+    fake.faults["runCommandWithOptions"] = list(delays)
+    mc.runCommands(commands)
+    assert fake.commands == commands
+    fake.commands.clear()
+    fake.faults["runCommandWithOptions"] = list(delays)
+    with mc.commandSink() as sink:
+        for command in commands:
+            sink.run(command)
+    assert fake.commands == commands
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_run_commands_blocking_returns_outputs_in_order(fake, mc):
+    fake.command_output = lambda command: command.upper()
+    fake.method_latency["runCommandWithOptions"] = 0.001
+    outputs = mc.runCommandsBlocking(f"say {i}" for i in range(200))
+    assert outputs == [f"SAY {i}" for i in range(200)]
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_run_commands_prefixed(fake, mc):
+    mc.nether.runCommands(["kill @e"])
+    fake.add_player("Steve")
+    mc.getPlayer("Steve").runCommands(["clear"], blocking=True, ordered=False)
+    assert fake.commands[0] == "execute in minecraft:the_nether run kill @e"
+    assert fake.commands[1].endswith(" at @s run clear")
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_run_commands_raises_error(fake, mc):
+    fake.faults["runCommandWithOptions"] = [0.0, grpc.StatusCode.UNAVAILABLE]
+    with pytest.raises(grpc.RpcError):
+        mc.runCommands(["say 1", "say 2", "say 3"])
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_command_sink(fake, mc):
+    fake.latency = 0.01
+    with mc.commandSink(window=8, ordered=False) as sink:
+        start = time.perf_counter()
+        for i in range(50):
+            sink.run(f"say {i}")
+        assert time.perf_counter() - start < 0.1  # run does not wait for the server
+        sink.flush()
+        assert sorted(fake.commands) == sorted(f"say {i}" for i in range(50))
+        sink.run("say done")
+    assert fake.commands[-1] == "say done"
+    assert sink.sent == 51
+    with pytest.raises(RuntimeError):
+        sink.run("say closed")
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_command_sink_collects_errors(fake, mc):
+    sink = mc.overworld.commandSink()
+    fake.faults["runCommandWithOptions"] = [grpc.StatusCode.UNAVAILABLE]
+    sink.run("say 1")
+    sink.run("say 2")
+    with pytest.raises(grpc.RpcError):
+        sink.flush()
+    sink.flush()  # errors are only raised once
+    assert fake.commands == ["execute in minecraft:overworld run say 2"]
+    sink.close()
+    with pytest.raises(ValueError):
+        mc.commandSink(window=0)
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from mcpq import Minecraft
+from mcpq._proto import minecraft_pb2 as pb
+from mcpq.testing import EventRecorder, EventReplayer, read_events
+
+from .test_events import chat, chat_handler, server, wait_for  # noqa: F401
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+def block_hit(name: str, x: int) -> pb.Event:
+    return pb.Event(
+        type=pb.EVENT_BLOCK_HIT,
+        blockHit=pb.Event.BlockHit(
+            trigger=pb.Player(name=name),
+            right_hand=True,
+            pos=pb.Vec3(x=x, y=0, z=0),
+            face="up",
+        ),
+    )
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_record_and_read(server, tmp_path):
+    path = tmp_path / "chat.events"
+    handler = chat_handler(server, [chat("a", str(i)) for i in range(5)])
+    with EventRecorder(path) as recorder:
+        recorder.record(handler)  # starts receiving without consuming
+        wait_for(lambda: recorder.count == 5)
+    assert [e.message for e in handler.poll()] == [str(i) for i in range(5)]
+    events = list(read_events(path))
+    assert [e.playerMsg.message for _, e in events] == [str(i) for i in range(5)]
+    offsets = [offset for offset, _ in events]
+    assert offsets == sorted(offsets) and offsets[0] >= 0
+    handler.stop()
+    assert handler._taps == []
+
+
+def test_read_invalid_file(tmp_path):
+    path = tmp_path / "invalid.events"
+    path.write_bytes(b"not a recording at all")
+    with pytest.raises(ValueError):
+        list(read_events(path))
+    for data in (b"", b"MCPQEVT1"):  # shorter than the header
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            list(read_events(path))
+
+
+def record(path, events: list[tuple[float, pb.Event]]) -> None:
+    """Write a recording with the given offsets by faking the clock of the recorder."""
+    recorder = EventRecorder(path)
+    for offset, event in events:
+        recorder._start = time.perf_counter() - offset
+        recorder._write(event)
+    recorder.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_replay_through_minecraft(tmp_path):
+    path = tmp_path / "session.events"
+    record(path, [(0.0, chat("a", "hi")), (0.01, block_hit("a", 1)), (0.02, chat("b", "yo"))])
+    with EventReplayer(path) as replayer:
+        assert len(replayer) == 3
+        mc = Minecraft("localhost", replayer.port)
+        messages = []
+        mc.events.chat.register(lambda e: messages.append((e.player.name, e.message)))
+        assert replayer.wait_for_subscribers(1, pb.EVENT_CHAT_MESSAGE)
+        assert replayer.play(speed=None) == 2  # no stream for block hits
+        wait_for(lambda: len(messages) == 2)
+        assert messages == [("a", "hi"), ("b", "yo")]
+        mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_replay_original_speed(tmp_path):
+    path = tmp_path / "slow.events"
+    record(path, [(0.0, block_hit("a", 1)), (0.2, block_hit("a", 2))])
+    with EventReplayer(path) as replayer:
+        mc = Minecraft("localhost", replayer.port)
+        mc.events.block_hit.poll()
+        assert replayer.wait_for_subscribers(1)
+        start = time.perf_counter()
+        thread = threading.Thread(target=replayer.play, kwargs={"speed": 2.0})
+        thread.start()
+        assert mc.events.block_hit.get(timeout=2).pos.x == 1
+        assert mc.events.block_hit.get(timeout=2).pos.x == 2
+        assert time.perf_counter() - start >= 0.09
+        thread.join()
+        with pytest.raises(ValueError):
+            replayer.play(speed=0)
+        mc._cleanup()
@@ -0,0 +1,406 @@
+import threading
+import time
+
+import grpc
+import pytest
+
+from mcpq._proto import MinecraftStub
+from mcpq._proto import minecraft_pb2 as pb
+from mcpq._server import _Server
+from mcpq.events import ChatEvent, EventHandler, SingleEventHandler
+from mcpq.testing import FakeServer
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 5
+
+
+class FakeStream:
+    """Stand-in for the gRPC event stream, yields the given events and then waits until cancelled."""
+
+    def __init__(self, events, end: bool = False) -> None:
+        self._events = list(events)
+        self._cancelled = threading.Event()
+        self._end = end  # stream ends after the events, as if the connection was lost
+
+    def __iter__(self):
+        for event in self._events:
+            if self._cancelled.is_set():
+                break
+            yield event
+        if not self._end:
+            self._cancelled.wait()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+
+def chat(name: str, message: str) -> pb.Event:
+    return pb.Event(
+        type=pb.EVENT_CHAT_MESSAGE,
+        playerMsg=pb.Event.PlayerAndMessage(trigger=pb.Player(name=name), message=message),
+    )
+
+
+@pytest.fixture
+def server():
+    stub = MinecraftStub(grpc.insecure_channel("localhost:1"))
+    server = _Server(stub)
+    yield server
+    stub.getEventStream = None
+
+
+def chat_handler(server, events) -> SingleEventHandler[ChatEvent]:
+    server.stub.getEventStream = lambda request: FakeStream(events)
+    return SingleEventHandler(server, ChatEvent, pb.EVENT_CHAT_MESSAGE)
+
+
+def wait_for(condition, timeout: float = 2.0) -> None:
+    end = time.time() + timeout
+    while not condition():
+        assert time.time() < end, "Condition not met in time"
+        time.sleep(0.001)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_inline_dispatch(server):
+    handler = chat_handler(server, [chat("a", str(i)) for i in range(10)])
+    received = []
+    handler.register(lambda e: received.append(e.message))
+    wait_for(lambda: len(received) == 10)
+    assert received == [str(i) for i in range(10)]
+    stats = handler.stats()
+    assert stats["mode"] == "inline"
+    assert stats["handled"] == 10
+    assert stats["errors"] == 0
+    assert stats["queue_depth"] == 0
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_callback_errors_are_counted(server):
+    handler = chat_handler(server, [chat("a", "1"), chat("a", "2")])
+
+    def failing(event):
+        raise ValueError("expected")
+
+    handler.register(failing)
+    wait_for(lambda: handler.stats()["handled"] == 2)
+    assert handler.stats()["errors"] == 2
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_thread_dispatch_runs_concurrently(server):
+    handler = chat_handler(server, [chat(f"p{i}", str(i)) for i in range(4)])
+    handler.dispatch("thread", workers=4)
+    barrier = threading.Barrier(4, timeout=2)
+    received = []
+
+    def slow(event):
+        barrier.wait()  # only passes if all four callbacks run at the same time
+        received.append(event.message)
+
+    handler.register(slow)
+    wait_for(lambda: len(received) == 4)
+    assert sorted(received) == ["0", "1", "2", "3"]
+    stats = handler.stats()
+    assert stats["mode"] == "thread"
+    assert stats["workers"] == 4
+    assert stats["handled"] == 4
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_ordered_dispatch_keeps_order_per_player(server):
+    players = ["alice", "bob", "carol"]
+    events = [chat(players[i % 3], str(i)) for i in range(60)]
+    handler = chat_handler(server, events)
+    handler.dispatch("ordered", workers=3, max_pending=5)
+    received = {p: [] for p in players}
+    lock = threading.Lock()
+
+    def record(event):
+        time.sleep(0.0005)
+        with lock:
+            received[event.player.name].append(int(event.message))
+
+    handler.register(record)
+    wait_for(lambda: sum(map(len, received.values())) == 60)
+    for i, p in enumerate(players):
+        assert received[p] == list(range(i, 60, 3))
+    assert handler.stats()["latency_max"] > 0
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_dispatch_invalid_arguments(server):
+    handler = chat_handler(server, [])
+    with pytest.raises(ValueError):
+        handler.dispatch("parallel")
+    with pytest.raises(ValueError):
+        handler.dispatch("thread", workers=0)
+    with pytest.raises(ValueError):
+        handler.dispatch("ordered", max_pending=0)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_stop_shuts_down_workers(server):
+    handler = chat_handler(server, [chat("a", "1")])
+    handler.dispatch("ordered", workers=2)
+    received = []
+    handler.register(lambda e: received.append(e))
+    wait_for(lambda: len(received) == 1)
+    threads = [t for t in threading.enumerate() if t.name.startswith("EventCallbackThread")]
+    assert len(threads) == 2
+    handler.stop()
+    assert not any(t.is_alive() for t in threads)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_stop_from_worker_with_full_queue(server):
+    handler = chat_handler(server, [chat("a", str(i)) for i in range(10)])
+    handler.dispatch("thread", workers=1, max_pending=1)
+    received = []
+
+    def stopping(event):
+        received.append(event.message)
+        # the receiving thread is blocked on the full queue while the handler is stopped
+        wait_for(lambda: handler._dispatcher.pending() == 1)
+        time.sleep(0.05)
+        handler.stop()
+
+    handler.register(stopping)
+    wait_for(lambda: received == ["0"])
+    wait_for(lambda: handler._thread is None)
+    assert not any(t.name.startswith("EventPollingThread") for t in threading.enumerate())
+
+
+@pytest.fixture
+def event_server():
+    with FakeServer() as fake:
+        yield fake, f"localhost:{fake.port}"
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_multiplexed_events_share_one_thread(event_server):
+    servicer, target = event_server
+    server = _Server(MinecraftStub(grpc.insecure_channel(target)))
+    events = EventHandler(server, target)
+    received = []
+    events.chat.register(lambda e: received.append(e.message))
+    events.player_join.register(lambda e: received.append(e.player.name))
+    wait_for(lambda: servicer.subscribers(pb.EVENT_CHAT_MESSAGE) == 1)
+    wait_for(lambda: servicer.subscribers(pb.EVENT_PLAYER_JOIN) == 1)
+    threads = [t.name for t in threading.enumerate()]
+    assert threads.count("EventMultiplexThread") == 1
+    assert not any(name.startswith("EventPollingThread") for name in threads)
+
+    servicer.publish(pb.Event(type=pb.EVENT_PLAYER_JOIN, playerMsg=chat("alice", "").playerMsg))
+    wait_for(lambda: received == ["alice"])
+    servicer.publish(chat("alice", "hi"))
+    wait_for(lambda: received == ["alice", "hi"])
+    events._cleanup()
+    assert "EventMultiplexThread" not in [t.name for t in threading.enumerate()]
+    wait_for(lambda: servicer.subscribers(pb.EVENT_CHAT_MESSAGE) == 0)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_multiplexed_get_and_stop(event_server):
+    servicer, target = event_server
+    server = _Server(MinecraftStub(grpc.insecure_channel(target)))
+    events = EventHandler(server, target)
+    assert events.chat.poll() == []
+    wait_for(lambda: servicer.subscribers(pb.EVENT_CHAT_MESSAGE) == 1)
+    servicer.publish(chat("bob", "1"))
+    event = events.chat.get(timeout=2)
+    assert event is not None and event.message == "1"
+    events.chat.stop()
+    wait_for(lambda: servicer.subscribers(pb.EVENT_CHAT_MESSAGE) == 0)
+    # polling again resubscribes on the same multiplexer
+    assert events.chat.poll() == []
+    wait_for(lambda: servicer.subscribers(pb.EVENT_CHAT_MESSAGE) == 1)
+    servicer.publish(chat("bob", "2"))
+    event = events.chat.get(timeout=2)
+    assert event is not None and event.message == "2"
+    events._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_multiplexed_slow_callback_does_not_stall_other_events(event_server):
+    servicer, target = event_server
+    server = _Server(MinecraftStub(grpc.insecure_channel(target)))
+    events = EventHandler(server, target)
+    release = threading.Event()
+    received = []
+
+    def slow(event):
+        release.wait()
+        received.append(event.message)
+
+    events.chat.register(slow)
+    events.player_join.register(lambda e: received.append(e.player.name))
+    assert events.chat.stats()["mode"] == "thread"
+    wait_for(lambda: servicer.subscribers(pb.EVENT_CHAT_MESSAGE) == 1)
+    wait_for(lambda: servicer.subscribers(pb.EVENT_PLAYER_JOIN) == 1)
+    servicer.publish(chat("alice", "1"))
+    servicer.publish(chat("alice", "2"))
+    servicer.publish(pb.Event(type=pb.EVENT_PLAYER_JOIN, playerMsg=chat("bob", "").playerMsg))
+    wait_for(lambda: received == ["bob"])
+    release.set()
+    wait_for(lambda: received == ["bob", "1", "2"])
+    events._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_multiplexed_stop_from_worker_with_full_queue(event_server):
+    servicer, target = event_server
+    server = _Server(MinecraftStub(grpc.insecure_channel(target)))
+    events = EventHandler(server, target)
+    events.chat.dispatch("thread", workers=1, max_pending=1)
+    received = []
+
+    def stopping(event):
+        received.append(event.message)
+        # the shared loop thread is blocked on the full queue while the handler is stopped
+        wait_for(lambda: events.chat._dispatcher.pending() == 1)
+        time.sleep(0.05)
+        events.chat.stop()
+
+    events.chat.register(stopping)
+    events.player_join.register(lambda e: received.append(e.player.name))
+    wait_for(lambda: servicer.subscribers(pb.EVENT_CHAT_MESSAGE) == 1)
+    wait_for(lambda: servicer.subscribers(pb.EVENT_PLAYER_JOIN) == 1)
+    for i in range(5):
+        servicer.publish(chat("alice", str(i)))
+    wait_for(lambda: servicer.subscribers(pb.EVENT_CHAT_MESSAGE) == 0)
+    assert received == ["0"]
+    # the other event types are still received
+    servicer.publish(pb.Event(type=pb.EVENT_PLAYER_JOIN, playerMsg=chat("bob", "").playerMsg))
+    wait_for(lambda: received == ["0", "bob"])
+    events._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_get_wakes_up_on_event(server):
+    stream = FakeStream([])
+    server.stub.getEventStream = lambda request: stream
+    handler = SingleEventHandler(server, ChatEvent, pb.EVENT_CHAT_MESSAGE)
+    assert handler.get_nowait() is None
+    threading.Timer(0.05, lambda: handler._handle(chat("a", "late"))).start()
+    start = time.perf_counter()
+    event = handler.get()
+    assert event is not None and event.message == "late"
+    assert time.perf_counter() - start < 1
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_get_returns_immediately_on_stop(server):
+    handler = chat_handler(server, [])
+    handler.poll()
+    threading.Timer(0.05, handler.stop).start()
+    start = time.perf_counter()
+    assert handler.get() is None
+    assert time.perf_counter() - start < 1
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_get_returns_immediately_on_disconnect(server):
+    server.stub.getEventStream = lambda request: FakeStream([chat("a", "1")], end=True)
+    handler = SingleEventHandler(server, ChatEvent, pb.EVENT_CHAT_MESSAGE)
+    event = handler.get(timeout=1)
+    assert event is not None and event.message == "1"
+    wait_for(lambda: handler._thread_cancelled)
+    server.stub.getEventStream = lambda request: FakeStream([], end=True)  # reconnect fails
+    start = time.perf_counter()
+    assert handler.get() is None
+    assert time.perf_counter() - start < 1
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_get_many(server):
+    handler = chat_handler(server, [chat("a", str(i)) for i in range(5)])
+    assert [e.message for e in handler.get_many(3, timeout=1)] == ["0", "1", "2"]
+    start = time.perf_counter()
+    assert [e.message for e in handler.get_many(3, timeout=0.1)] == ["3", "4"]
+    assert time.perf_counter() - start >= 0.09
+    assert handler.get_many(3, timeout=0) == []
+    handler.stop()
+
+
+def idle_handler(server) -> SingleEventHandler[ChatEvent]:
+    handler = chat_handler(server, [])
+    handler.poll()  # start receiving, events are then fed in with _handle
+    return handler
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_backpressure_drop_newest(server):
+    handler = idle_handler(server)
+    handler.backpressure("drop_newest", capacity=3)
+    for i in range(5):
+        handler._handle(chat("a", str(i)))
+    assert [e.message for e in handler.poll()] == ["0", "1", "2"]
+    stats = handler.stats()
+    assert stats["policy"] == "drop_newest"
+    assert stats["capacity"] == 3
+    assert stats["dropped"] == 2
+    assert stats["high_water"] == 3
+    assert stats["queued"] == 0
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_backpressure_drop_oldest(server):
+    handler = idle_handler(server)
+    handler.backpressure("drop_oldest", capacity=3)
+    for i in range(5):
+        handler._handle(chat("a", str(i)))
+    assert [e.message for e in handler.poll()] == ["2", "3", "4"]
+    assert handler.stats()["dropped"] == 2
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_backpressure_coalesce(server):
+    handler = idle_handler(server)
+    handler.backpressure("coalesce", capacity=2)
+    for name, message in [("a", "1"), ("b", "2"), ("a", "3"), ("c", "4"), ("b", "5")]:
+        handler._handle(chat(name, message))
+    assert [(e.player.name, e.message) for e in handler.poll()] == [("a", "3"), ("b", "5")]
+    stats = handler.stats()
+    assert stats["coalesced"] == 2
+    assert stats["dropped"] == 1
+    # after polling, the same keys can be queued again
+    handler._handle(chat("c", "6"))
+    assert [e.message for e in handler.poll()] == ["6"]
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_backpressure_block(server):
+    handler = idle_handler(server)
+    handler.backpressure("block", capacity=1, timeout=2)
+    handler._handle(chat("a", "1"))
+    threading.Timer(0.05, handler.get).start()
+    start = time.perf_counter()
+    handler._handle(chat("a", "2"))  # blocks until the first event was taken
+    assert 0.03 < time.perf_counter() - start < 1
+    assert [e.message for e in handler.poll()] == ["2"]
+    handler.backpressure("block", capacity=1, timeout=0.05)
+    handler._handle(chat("a", "3"))
+    handler._handle(chat("a", "4"))  # dropped after timeout
+    assert [e.message for e in handler.poll()] == ["3"]
+    assert handler.stats()["dropped"] == 1
+    handler.stop()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_backpressure_invalid_arguments(server):
+    handler = chat_handler(server, [])
+    with pytest.raises(ValueError):
+        handler.backpressure("drop_all")
+    with pytest.raises(ValueError):
+        handler.backpressure("drop_oldest", capacity=0)
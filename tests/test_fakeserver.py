@@ -0,0 +1,128 @@
+import time
+
+import pytest
+
+from mcpq import BlockPos, ChatEvent, Vec3
+from mcpq._proto import minecraft_pb2 as pb
+from mcpq.exception import BlockTypeNotFound, EntityNotSpawnable, PlayerNotFound
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_server_info_and_registries(mc):
+    assert mc.getMinecraftVersion() == "1.21.4"
+    assert "stone" in mc.blocks
+    assert "air" not in mc.blocks.solid()
+    assert "sand" in mc.blocks.gravity()
+    assert "cow" in mc.entity_types.spawnable()
+    assert "item" not in mc.entity_types.spawnable()
+    assert [w.key for w in mc.worlds] == [
+        "minecraft:overworld",
+        "minecraft:the_nether",
+        "minecraft:the_end",
+    ]
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_blocks(fake, mc):
+    origin = Vec3(0, 0, 0)
+    mc.setBlock("gold_block", origin)
+    assert mc.getBlock(origin) == "gold_block"
+    mc.setBlock(mc.Block("furnace").withData({"lit": True}), origin.up())
+    assert mc.getBlock(origin.up()) == "furnace"
+    assert mc.getBlockWithData(origin.up()).getData()["lit"] is True
+    mc.setBlockList("minecraft:stone", [origin.east(i) for i in range(1, 5)])
+    assert fake.get_block(origin.east(4)) == "stone"
+    mc.setBlockCube("dirt", Vec3(10, 0, 10), Vec3(12, 2, 12))
+    assert fake.block_count() == 2 + 4 + 27
+    assert mc.getHeight(11, 11) == 2
+    assert mc.getHeight(100, 100) == -64
+    mc.setBlockCube("air", Vec3(10, 0, 10), Vec3(12, 2, 12))
+    assert fake.block_count() == 6
+    mc.nether.setBlock("obsidian", origin)
+    assert fake.get_block(origin, "world_nether") == "obsidian"
+    assert mc.getBlock(origin) == "gold_block"
+    with pytest.raises(BlockTypeNotFound):
+        mc.setBlock("not_a_block", origin)
+    fake.set_block("oak_stairs[facing=east]", (5, 5, 5))
+    assert mc.getBlockWithData(Vec3(5, 5, 5)) == "oak_stairs[facing=east]"
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_blocks_with_blockpos(fake, mc):
+    origin = BlockPos(0, 0, 0)
+    mc.setBlock("gold_block", origin)
+    assert mc.getBlock(Vec3(0.5, 0.5, 0.5)) == "gold_block"
+    mc.setBlockList("stone", [origin.east(i) for i in range(1, 5)])
+    assert mc.getBlockList([origin.east(i) for i in range(5)]) == ["gold_block"] + ["stone"] * 4
+    mc.setBlockCube("dirt", BlockPos(10, 0, 10), Vec3(12, 2, 12))
+    assert fake.block_count() == 1 + 4 + 27
+    assert mc.copyBlockCube(BlockPos(10, 0, 10), BlockPos(11, 1, 11)) == [[["dirt"] * 2] * 2] * 2
+    mc.overworld[BlockPos(0, 1, 0)] = "furnace"
+    assert mc.overworld[BlockPos(0, 1, 0)] == "furnace"
+    assert mc.spawnEntity("cow", origin.up(2)).pos == Vec3(0, 2, 0)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_entities(fake, mc):
+    cow = mc.spawnEntity("cow", Vec3(1, 2, 3))
+    assert cow.type == "cow"
+    assert cow.pos == Vec3(1, 2, 3)
+    item = fake.add_entity("item", (5, 0, 0))
+    assert mc.getEntities() == [cow]
+    assert {e.id for e in mc.getEntities(only_spawnable=False)} == {cow.id, item}
+    assert mc.getEntitiesAround(Vec3(), 5) == [cow]
+    cow.pos = Vec3(10, 0, 0)
+    cow._update()
+    assert cow.pos == Vec3(10, 0, 0)
+    cow.world = mc.end
+    assert mc.getEntities() == []
+    assert mc.end.getEntities("cow") == [cow]
+    with pytest.raises(EntityNotSpawnable):
+        mc.spawnEntity("player", Vec3())
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_players_chat_and_commands(fake, mc):
+    with pytest.raises(PlayerNotFound):
+        mc.getPlayer()
+    fake.add_player("Steve", (1, 64, 1))
+    player = mc.getPlayer()
+    assert player.name == "Steve"
+    assert player.pos == Vec3(1, 64, 1)
+    player.pos = Vec3(2, 64, 2)
+    player._update()
+    assert player.pos == Vec3(2, 64, 2)
+    mc.postToChat("hello")
+    player.postToChat("psst")
+    assert fake.chat == [(None, "hello"), ("Steve", "psst")]
+    fake.command_output = lambda command: f"ran {command}"
+    mc.runCommand("time set day")
+    assert mc.runCommandBlocking("list") == "ran list"
+    assert fake.commands == ["time set day", "list"]
+    mc.overworld.pvp = True
+    assert mc.overworld.pvp and not mc.nether.pvp
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_scripted_events(fake, mc):
+    mc.events.chat.poll()
+    assert fake.wait_for_subscribers(1, pb.EVENT_CHAT_MESSAGE)
+    message = pb.Event(
+        type=pb.EVENT_CHAT_MESSAGE,
+        playerMsg=pb.Event.PlayerAndMessage(trigger=pb.Player(name="Steve"), message="hi"),
+    )
+    assert fake.play([(0.0, message), (0.05, message)], speed=1.0) == 2
+    events = mc.events.chat.get_many(2, timeout=2)
+    assert len(events) == 2 and all(isinstance(e, ChatEvent) for e in events)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_latency_and_call_counts(fake, mc):
+    fake.method_latency["getBlock"] = 0.05
+    start = time.perf_counter()
+    mc.getBlock(Vec3())
+    assert time.perf_counter() - start >= 0.05
+    assert fake.calls["getBlock"] == 1
@@ -0,0 +1,52 @@
+import pytest
+
+from mcpq._filterindex import _FilterIndex
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_filters_match_brute_force(mc):
+    materials = list(mc._server.material_cache().values())
+
+    def brute(predicate) -> list[str]:
+        return [m.key for m in materials if predicate(m)]
+
+    blocks = mc.blocks
+    assert blocks.get() == brute(lambda m: m.is_block)
+    assert blocks.solid(False).flammable().get() == brute(
+        lambda m: m.is_block and not m.is_solid and m.is_flammable
+    )
+    assert blocks.contains("wool").or_.startswith("stone").get() == brute(
+        lambda m: m.is_block and ("wool" in m.key.name or m.key.name.startswith("stone"))
+    )
+    assert (blocks.endswith("wool", "planks") & ~mc.materials.contains("red")).get() == brute(
+        lambda m: m.is_block and m.key.name.endswith(("wool", "planks")) and "red" not in m.key
+    )
+    assert (mc.materials.item(False) | blocks.air()).get() == brute(
+        lambda m: not m.is_item or (m.is_block and m.is_air)
+    )
+    assert mc.materials.equals("stone", "minecraft:dirt", negate=True).len() == len(materials) - 2
+    assert mc.materials.vanilla(False).get() == []
+    assert mc.materials.namespace("minecraft").len() == len(materials)
+    assert blocks[0:2] == blocks.get()[:2]
+    assert blocks.contains("wool").choice() in blocks.contains("wool")
+    spawnable = [t.key for t in mc._server.entity_type_cache().values() if t.is_spawnable]
+    assert mc.spawnables.get() == spawnable
+    assert (~mc.spawnables).len() + len(spawnable) == mc.entity_types.len()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_index_memoizes_and_refreshes(fake, mc):
+    index = mc._server.material_index()
+    assert isinstance(index, _FilterIndex) and len(index) == len(mc._server.material_cache())
+    first = mc.blocks.solid().get()
+    assert mc.blocks.solid()._filtered() is index.select(mc.blocks.solid()._expr)
+    assert mc.blocks.solid().get() == first
+    assert fake.calls["getMaterials"] == 1
+    mc._server.material_cache(force_update=True)
+    assert mc._server.material_index() is not index  # rebuilt from the new cache
+    assert mc.blocks.solid().get() == first
+    callable_filter = mc.materials._add_filter(lambda m: m.key == "stone")
+    assert callable_filter.get() == ["stone"]
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import grpc
+import pytest
+
+from mcpq import Minecraft, Vec3
+from mcpq._instrumentation import LATENCY_BUCKETS
+from mcpq.exception import BlockTypeNotFound
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+@pytest.fixture
+def mc(fake):
+    mc = Minecraft("localhost", fake.port, instrument=True)
+    yield mc
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_stats_per_method(mc):
+    mc.setBlock("stone", Vec3(0, 0, 0))
+    mc.setBlock("dirt", Vec3(1, 0, 0))
+    assert mc.getBlock(Vec3(0, 0, 0)) == "stone"
+    stats = mc.stats()
+    assert stats["setBlock"]["calls"] == 2
+    assert stats["setBlock"]["in_flight"] == 0
+    assert stats["setBlock"]["request_bytes"] > 0
+    assert stats["getBlock"]["calls"] == 1
+    assert stats["getBlock"]["response_bytes"] > 0
+    assert stats["getBlock"]["errors"] == {}
+    histogram = stats["setBlock"]["latency_histogram"]
+    assert list(histogram) == list(LATENCY_BUCKETS) + [float("inf")]
+    assert histogram[float("inf")] == 2
+    assert 0 < stats["setBlock"]["latency_avg"] <= stats["setBlock"]["latency_max"]
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_stats_errors(fake, mc):
+    with pytest.raises(BlockTypeNotFound):
+        mc.setBlock("not_a_block", Vec3(0, 0, 0))
+    assert mc.stats()["setBlock"]["errors"] == {"BLOCK_TYPE_NOT_FOUND": 1}
+    fake.close()
+    with pytest.raises(grpc.RpcError):
+        mc.getBlock(Vec3(0, 0, 0))
+    assert mc.stats()["getBlock"]["errors"] == {"UNAVAILABLE": 1}
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_stats_in_flight_and_reset(fake, mc):
+    fake.method_latency["getBlock"] = 0.3
+    thread = threading.Thread(target=mc.getBlock, args=(Vec3(0, 0, 0),))
+    thread.start()
+    while mc.stats().get("getBlock", {}).get("in_flight") != 1:
+        time.sleep(0.001)
+    mc.setBlock("stone", Vec3(0, 0, 0))
+    mc.resetStats()
+    assert mc.stats() == {"getBlock": mc.stats()["getBlock"]}
+    assert mc.stats()["getBlock"]["calls"] == 0
+    assert mc.stats()["getBlock"]["in_flight"] == 1
+    thread.join()
+    assert mc.stats()["getBlock"]["in_flight"] == 0
+    assert mc.stats()["getBlock"]["latency_max"] >= 0.3
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_stats_exporter(mc):
+    records = []
+
+    def failing(record):
+        raise ValueError("expected")
+
+    mc.addStatsExporter(records.append)
+    mc.addStatsExporter(failing)  # does not affect the call or other exporters
+    mc.getBlock(Vec3(0, 0, 0))
+    mc.removeStatsExporter(records.append)
+    mc.getBlock(Vec3(0, 0, 0))
+    assert len(records) == 1
+    record = records[0]
+    assert record.method == "getBlock"
+    assert record.code == grpc.StatusCode.OK
+    assert record.status == "OK"
+    assert record.latency > 0
+    assert record.response_bytes > 0
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_stats_not_instrumented(fake):
+    mc = Minecraft("localhost", fake.port)
+    with pytest.raises(RuntimeError):
+        mc.stats()
+    with pytest.raises(RuntimeError):
+        mc.addStatsExporter(print)
+    mc._cleanup()
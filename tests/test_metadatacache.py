@@ -0,0 +1,63 @@
+import grpc
+import pytest
+
+from mcpq import Minecraft
+from mcpq._metadatacache import _read
+from mcpq.testing import FakeServer
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+TABLES = ("getMaterials", "getEntityTypes")
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_second_start_is_served_from_disk(tmp_path):
+    with FakeServer() as fake:
+        mc = Minecraft("localhost", fake.port, metadata_cache=tmp_path)
+        assert all(fake.calls[name] == 1 for name in TABLES)
+        files = list(tmp_path.glob("metadata-*.bin"))
+        assert len(files) == 1 and len(_read(files[0])) == 3
+        assert fake.calls["accessWorlds"] == 1
+        blocks, worlds = mc.blocks.get(), mc.worlds
+        mc._cleanup()
+
+        fake.calls.clear()
+        mc = Minecraft("localhost", fake.port, metadata_cache=str(tmp_path))
+        assert fake.calls["getServerInfo"] == 1
+        assert mc.blocks.get() == blocks and mc.spawnables.len() > 0
+        assert [w.key for w in mc.worlds] == [w.key for w in worlds]
+        assert mc.getMinecraftVersion() == "1.21.4"
+        assert not any(fake.calls[name] for name in TABLES)
+        assert fake.calls["accessWorlds"] == 1  # worlds are never stored, they may change
+        mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_version_change_or_damage_refetches(tmp_path):
+    with FakeServer() as fake:
+        Minecraft("localhost", fake.port, metadata_cache=tmp_path)._cleanup()
+    with FakeServer(mc_version="1.20.6") as fake:
+        mc = Minecraft("localhost", fake.port, metadata_cache=tmp_path)
+        assert all(fake.calls[name] == 1 for name in TABLES)
+        mc._cleanup()
+        files = list(tmp_path.glob("metadata-*.bin"))
+        assert len(files) == 2  # every server and version is stored separately
+        for file in files:
+            file.write_bytes(file.read_bytes()[:-3])  # truncated files are ignored
+        fake.calls.clear()
+        Minecraft("localhost", fake.port, metadata_cache=tmp_path)._cleanup()
+        assert all(fake.calls[name] == 1 for name in TABLES)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_failed_warm_up_closes_connections(tmp_path, mocker):
+    with FakeServer() as fake:
+        fake.faults["getServerInfo"] = [grpc.StatusCode.UNAVAILABLE]
+        mocker.patch.object(
+            Minecraft, "__del__", lambda self: None
+        )  # only count the explicit cleanup
+        cleanup = mocker.spy(Minecraft, "_cleanup")
+        with pytest.raises(grpc.RpcError):
+            Minecraft("localhost", fake.port, metadata_cache=tmp_path)
+        assert cleanup.call_count == 1
@@ -0,0 +1,68 @@
+import pytest
+
+from mcpq import Vec3
+from mcpq.nbt import NbtCompound, NbtList
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+ITEMS = '[{Slot:0b,id:"minecraft:stone",count:1}]'
+
+
+def command_output(command: str) -> str:
+    # emulates the output of the vanilla data command for chests at y=0
+    command = command.removeprefix("execute in minecraft:the_nether run ")
+    parts = command.split(" ")
+    if parts[2] == "entity":
+        return "Zombie has the following entity data: " + (
+            "20.0f" if len(parts) > 4 else "{Health:20.0f}"
+        )
+    x, y, z = parts[3:6]
+    if y != "0":
+        return "The target block is not a block entity"
+    if len(parts) == 6:
+        return f"{x}, {y}, {z} has the following block data: {{Items:{ITEMS}}}"
+    if parts[6] == "Items":
+        return f"{x}, {y}, {z} has the following block data: {ITEMS}"
+    if parts[6] == "Items[0].id":
+        return f'{x}, {y}, {z} has the following block data: "minecraft:stone"'
+    return f"Found no elements matching {parts[6]}"
+
+
+@pytest.fixture
+def fake(fake):
+    fake.command_output = command_output
+    return fake
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_get_nbt_path(fake, mc):
+    nbt = mc.getNbt(Vec3(1, 0, 2))
+    assert isinstance(nbt, NbtCompound) and nbt["Items"][0]["id"] == "minecraft:stone"
+    items = mc.getNbt(Vec3(1, 0, 2), path="Items")
+    assert isinstance(items, NbtList) and len(items) == 1
+    assert mc.getNbt(Vec3(1, 0, 2), path="Items[0].id") == "minecraft:stone"
+    assert mc.getNbt(Vec3(1, 0, 2), path="CustomName") is None
+    assert mc.getNbt(Vec3(1, 5, 2), path="Items") is False
+    assert fake.commands[1] == "data get block 1 0 2 Items"
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_get_nbt_many(fake, mc):
+    positions = [Vec3(x, 0, 0) for x in range(100)] + [Vec3(0, 1, 0)]
+    results = mc.nether.getNbtMany(positions, path="Items")
+    assert len(results) == 101
+    assert all(isinstance(items, NbtList) for items in results[:100])
+    assert results[100] is False
+    assert all(c.startswith("execute in minecraft:the_nether run") for c in fake.commands)
+    assert mc.getNbtMany([]) == []
+    assert mc.getNbtMany([Vec3(3, 0, 3)])[0]["Items"][0]["count"] == 1
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_get_nbt_for_entities(fake, mc):
+    entities = [mc.spawnEntity("zombie", Vec3(x, 0, 0)) for x in range(10)]
+    assert entities[0].getNbt()["Health"] == 20.0
+    assert entities[0].getNbt(path="Health") == 20.0
+    assert mc.getNbtForEntities(entities, path="Health") == [20.0] * 10
+    assert f"data get entity {entities[-1].id} Health" in fake.commands
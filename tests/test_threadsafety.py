@@ -0,0 +1,52 @@
+import pytest
+
+from mcpq import Vec3
+from mcpq._proto import minecraft_pb2 as pb
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+THREADS = 16
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_metadata_fetched_once(fake, mc, run_threads):
+    fake.method_latency.update(getMaterials=0.05, getServerInfo=0.05)
+    lengths, versions = [], []
+    run_threads(
+        THREADS,
+        lambda i: (lengths.append(mc.blocks.len()), versions.append(mc.getMinecraftVersion())),
+    )
+    assert len(set(lengths)) == 1 and versions == ["1.21.4"] * THREADS
+    assert fake.calls["getMaterials"] == 1 and fake.calls["getServerInfo"] == 1
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_concurrent_register_keeps_all_callbacks(mc, run_threads):
+    handler = mc.events.chat
+    snapshot = handler._callbacks
+    run_threads(THREADS, lambda i: [handler.register(lambda event: None) for _ in range(20)])
+    assert len(handler._callbacks) == THREADS * 20
+    assert snapshot == []  # lists seen by receiving threads are never changed
+    handler.stop()
+    assert handler._callbacks == []
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_entity_location_updated_together(mc, run_threads):
+    entity = mc.spawnEntity("sheep", Vec3(1, 2, 3))
+    torn = []
+
+    def update(i):
+        for _ in range(200):
+            location = pb.EntityLocation(
+                pos=pb.Vec3f(x=i, y=i, z=i),
+                orientation=pb.EntityOrientation(yaw=i, pitch=i),
+                world=pb.World(name=mc.overworld.name),
+            )
+            entity._inject_update(pb.Entity(id=entity.id, location=location))
+            with entity._state_lock:
+                if not entity._pos.x == entity._yaw == entity._pitch:
+                    torn.append(i)
+
+    run_threads(THREADS, update)
+    assert not torn
@@ -0,0 +1,107 @@
+import threading
+
+import pytest
+
+from mcpq import NBT, Minecraft, Vec3, tracing
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.RecordingTracer()
+    tracing.set_tracer(tracer)
+    yield tracer
+    tracing.set_tracer(None)
+
+
+def by_name(tracer) -> dict:
+    return {span.name: span for span in tracer.spans}
+
+
+def test_disabled_by_default():
+    assert tracing.get_tracer() is None
+    with tracing.span("anything", key=1) as s:
+        s.set_attribute("other", 2)
+        assert tracing.current_span() is None
+    assert NBT.parse("{a:1}") == {"a": 1}
+
+
+def test_nested_spans(tracer):
+    @tracing.traced()
+    def inner():
+        return tracing.current_span()
+
+    with tracing.span("outer", size=3) as outer:
+        assert inner().parent is outer
+    assert tracing.current_span() is None
+    spans = by_name(tracer)
+    assert set(spans) == {"outer", "test_nested_spans.<locals>.inner"}
+    assert spans["outer"].attributes == {"size": 3}
+    assert spans["outer"].duration >= spans["test_nested_spans.<locals>.inner"].duration
+    assert tracer.summary()["outer"]["count"] == 1
+
+
+def test_exception_is_recorded(tracer):
+    with pytest.raises(ValueError):
+        with tracing.span("failing"):
+            raise ValueError("expected")
+    assert "ValueError" in tracer.spans[0].attributes["exception"]
+
+
+def test_spans_are_per_thread(tracer):
+    parents = []
+    with tracing.span("main"):
+        thread = threading.Thread(target=lambda: parents.append(tracing.current_span()))
+        thread.start()
+        thread.join()
+    assert parents == [None]
+
+
+def test_nbt_parser_spans(tracer):
+    NBT.parse("{a:1,b:[1,2]}")
+    assert "nbt.parse_snbt" in by_name(tracer)
+
+
+def test_set_tracer_type():
+    with pytest.raises(TypeError):
+        tracing.set_tracer(object())
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_world_spans_contain_rpcs(tracer, fake):
+    mc = Minecraft("localhost", fake.port, instrument=True)
+    mc.setBlockCube("stone", Vec3(0, 0, 0), Vec3(1, 1, 1))
+    blocks = mc.copyBlockCube(Vec3(0, 0, 0), Vec3(1, 1, 1))
+    tracer.clear()
+    mc.pasteBlockCube(blocks, Vec3(10, 0, 0), rotation="north")
+    spans = by_name(tracer)
+    paste = spans["World.pasteBlockCube"]
+    assert spans["World.pasteBlockCube.flatten"].parent is paste
+    place = spans["World.pasteBlockCube.place"]
+    assert place.parent is paste
+    assert place.attributes["blocks"] == 8
+    rpcs = [s for s in tracer.spans if s.name == "rpc.setBlock"]
+    assert len(rpcs) == 8
+    assert all(s.parent is place and s.attributes["status"] == "OK" for s in rpcs)
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_event_callback_spans(tracer, fake):
+    mc = Minecraft("localhost", fake.port)
+    done = threading.Event()
+
+    def on_join(event):
+        done.set()
+
+    mc.events.player_join.register(on_join)
+    assert fake.wait_for_subscribers(1, timeout=5)
+    fake.add_player("alice")
+    assert done.wait(5)
+    mc._cleanup()
+    spans = by_name(tracer)
+    assert spans["EventHandler.callback"].attributes["callback"] == "on_join"
+    assert spans["EventHandler.callback"].parent is spans["EventHandler.dispatch"]
+    assert spans["EventHandler.dispatch"].attributes["event"] == "PlayerJoinEvent"
@@ -0,0 +1,93 @@
+import grpc
+import pytest
+
+from mcpq import Minecraft, Vec3
+from mcpq._proto import minecraft_pb2 as pb
+from mcpq._transport import _ChannelConfig, _target
+from mcpq.testing import FakeServer
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+
+@pytest.fixture
+def fake(tmp_path):
+    with FakeServer(unix_socket=str(tmp_path / "mcpq.sock")) as server:
+        yield server
+
+
+def test_target():
+    assert _target("localhost", 1789) == "localhost:1789"
+    assert _target("unix:/tmp/mcpq.sock", 1789) == "unix:/tmp/mcpq.sock"
+    assert _target("unix-abstract:mcpq", 1789) == "unix-abstract:mcpq"
+    assert _target("dns:///example.com:25565", 1789) == "dns:///example.com:25565"
+
+
+def test_channel_options():
+    config = _ChannelConfig.build(
+        "localhost",
+        1789,
+        compression="gzip",
+        keepalive=30,
+        max_message_size=1024,
+        http2_window=65536,
+        options=[("grpc.primary_user_agent", "bot")],
+    )
+    options = dict(config.options)
+    assert config.compression == grpc.Compression.Gzip
+    assert options["grpc.keepalive_time_ms"] == 30000
+    assert options["grpc.max_send_message_length"] == 1024
+    assert options["grpc.max_receive_message_length"] == 1024
+    assert options["grpc.http2.lookahead_bytes"] == 65536
+    assert options["grpc.primary_user_agent"] == "bot"
+    assert _ChannelConfig.build("localhost", 1789).options == ()
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        _ChannelConfig.build("localhost", 1789, compression="brotli")  # type: ignore
+    with pytest.raises(ValueError):
+        _ChannelConfig.build("localhost", 1789, keepalive=0)
+    with pytest.raises(ValueError):
+        _ChannelConfig.build("localhost", 1789, max_message_size=0)
+    with pytest.raises(ValueError):
+        _ChannelConfig.build("localhost", 1789, http2_window=-1)
+
+
+@pytest.mark.timeout(TIMEOUT)
+@pytest.mark.parametrize("multiplex_events", [False, True])
+def test_unix_socket(fake, multiplex_events):
+    mc = Minecraft(fake.unix_target, multiplex_events=multiplex_events)
+    assert mc.target == fake.unix_target
+    mc.setBlock("stone", Vec3(1, 2, 3))
+    assert fake.get_block(Vec3(1, 2, 3)) == "stone"
+    assert all(peer.startswith("unix:") for peer in fake.peers)
+    mc.events.chat.poll()  # open the stream
+    assert fake.wait_for_subscribers(1, pb.EVENT_CHAT_MESSAGE)
+    fake.publish(
+        pb.Event(
+            type=pb.EVENT_CHAT_MESSAGE,
+            playerMsg=pb.Event.PlayerAndMessage(trigger=pb.Player(name="Steve"), message="hi"),
+        )
+    )
+    assert mc.events.chat.get(timeout=TIMEOUT).message == "hi"
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+@pytest.mark.parametrize("compression", ["gzip", "deflate"])
+def test_compression(fake, compression):
+    mc = Minecraft("localhost", fake.port, compression=compression, keepalive=60)
+    mc.setBlockList("stone", [Vec3(x, 0, z) for x in range(50) for z in range(50)])
+    assert fake.block_count() == 2500
+    mc._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_max_message_size_limits_bulk_writes(fake):
+    mc = Minecraft("localhost", fake.port, max_message_size=1000)
+    assert mc._server.block_batcher().max_message_size == 1000
+    mc.setBlockList("stone", [Vec3(x, 0, 0) for x in range(500)])
+    assert fake.block_count() == 500
+    assert fake.calls["setBlocks"] > 1
+    mc._cleanup()
@@ -1,4 +1,6 @@
 import gc
+import threading
+import time
 
 import pytest
 
@@ -62,3 +64,31 @@ def test_no_default():
         cache.get_or_create(1)
 
     assert cache.get_or_create(2, TestObject)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_concurrent_get_or_create_is_singleton():
+    created = []
+
+    def factory(key):
+        time.sleep(0.001)  # widen the window for races between threads
+        created.append(key)
+        return object()
+
+    cache = ThreadSafeSingeltonCache(factory)
+    results = [[] for _ in range(16)]
+
+    def worker(i):
+        for key in range(20):
+            results[i].append(cache.get_or_create(key))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(created) == list(range(20))
+    assert all(result == results[0] for result in results)
+    assert cache[3] is results[0][3] and len(cache) == 20
+    with pytest.raises(KeyError):
+        cache[20]
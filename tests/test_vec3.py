@@ -3,7 +3,7 @@ from numbers import Number
 
 import pytest
 
-from mcpq import Vec3
+from mcpq import BlockPos, Vec3
 
 
 def close(a, b, abs_tol=10**-6) -> bool:
@@ -834,3 +834,95 @@ def test_constants() -> None:
     assert Vec3.DOWN == Vec3().down()
     assert Vec3.SOUTH == Vec3().south()
     assert Vec3.NORTH == Vec3().north()
+
+
+def test_integral_fast_paths() -> None:
+    v = Vec3(1, -2, 3)
+    assert v.floor() is v and v.ceil() is v and v.trunc() is v and round(v) is v
+    assert math.floor(v) is v
+    f = Vec3(1.0, -2.5, 3.7)
+    assert f.floor() == Vec3(1, -3, 3) and all(type(c) is int for c in f.floor())
+    assert f.ceil() == Vec3(1, -2, 4) and all(type(c) is int for c in f.ceil())
+    assert f.trunc() == Vec3(1, -2, 3) and all(type(c) is int for c in f.trunc())
+    assert Vec3(True, 0, 0).floor() == Vec3(1, 0, 0)
+    assert hash(v) == hash(v) == hash(Vec3(1.0, -2.0, 3.0)) == hash((1, -2, 3))
+
+
+def test_blockpos() -> None:
+    pos = BlockPos(1, 4, 8)
+    assert pos.x == 1 and pos.y == 4 and pos.z == 8
+    x, y, z = pos
+    assert (x, y, z) == (1, 4, 8) and isinstance(pos, tuple)
+    assert BlockPos() == BlockPos(0, 0, 0) == Vec3()
+    assert repr(pos) == str(pos) == "BlockPos(x=1, y=4, z=8)"
+    with pytest.raises(TypeError):
+        BlockPos(1.5, 2, 3)  # type: ignore
+    with pytest.raises(AttributeError):
+        pos.x = 5  # type: ignore
+    assert BlockPos.of(Vec3(1.5, 4.2, 8.9)) == pos == Vec3(1.5, 4.2, 8.9).block_pos()
+    assert BlockPos.of(Vec3(-0.5, -1, -1.5)) == BlockPos(-1, -1, -2)
+    assert BlockPos.of((1.9, 4, 8.0)) == pos and BlockPos.of(pos) is pos
+    assert pos.floor() is pos and pos.round() is pos and math.ceil(pos) is pos
+    assert pos.to_vec3() == Vec3(1, 4, 8) and type(pos.to_vec3()) is Vec3
+    assert pos.to_dict() == Vec3(1, 4, 8).to_dict()
+
+
+def test_blockpos_eq_and_hash() -> None:
+    pos = BlockPos(1, 4, 8)
+    assert pos == Vec3(1, 4, 8) and Vec3(1, 4, 8) == pos
+    assert pos != Vec3(1, 4, 8.5) and Vec3(1, 4, 8.5) != pos
+    assert hash(pos) == hash(Vec3(1, 4, 8)) == hash(Vec3(1.0, 4.0, 8.0))
+    assert {pos, Vec3(1, 4, 8), BlockPos(1, 4, 8)} == {pos}
+    assert Vec3(1, 4, 8) in {pos: True}
+    assert sorted([BlockPos(1, 2, 3), BlockPos(0, 5, 5), BlockPos(1, 0, 9)])[0] == BlockPos(
+        0, 5, 5
+    )
+
+
+def test_blockpos_arithmetic() -> None:
+    pos = BlockPos(1, 4, 8)
+    for result in (pos + 1, 1 + pos, pos - 1, pos * 2, 2 * pos, -pos, pos // 2, pos + pos):
+        assert type(result) is BlockPos
+    assert pos + BlockPos(1, 1, 1) == BlockPos(2, 5, 9)
+    assert pos - 1 == BlockPos(0, 3, 7) and 10 - pos == BlockPos(9, 6, 2)
+    assert pos * BlockPos(2, 0, -1) == BlockPos(2, 0, -8)
+    assert pos // 3 == BlockPos(0, 1, 2) and -pos == BlockPos(-1, -4, -8)
+    # anything that is not integral gives a Vec3
+    assert pos + 0.5 == Vec3(1.5, 4.5, 8.5) and type(pos + 0.5) is Vec3
+    assert pos + Vec3(1, 1, 1) == Vec3(1, 1, 1) + pos == Vec3(2, 5, 9)
+    assert type(pos + Vec3(1, 1, 1)) is Vec3 and type(Vec3(1, 1, 1) + pos) is Vec3
+    assert pos - Vec3(1, 1, 1) == Vec3(0, 3, 7) and Vec3(1, 1, 1) - pos == Vec3(0, -3, -7)
+    assert pos * 0.5 == Vec3(0.5, 2, 4) and pos / 2 == Vec3(0.5, 2, 4)
+    # no tuple concatenation or repetition
+    with pytest.raises(TypeError):
+        pos + "abc"  # type: ignore
+    assert len(pos * 3) == 3
+
+
+def test_blockpos_methods() -> None:
+    pos = BlockPos(1, 4, 8)
+    moved = pos.up(2).down().east(3).west().south(2).north()
+    assert moved == BlockPos(3, 5, 9) and type(moved) is BlockPos
+    with pytest.raises(TypeError):
+        pos.up(0.5)  # type: ignore
+    assert pos.withX(0).withY(1).withZ(2) == BlockPos(0, 1, 2)
+    assert pos.map(abs) == pos and type(pos.map(abs)) is BlockPos
+    assert pos.map(lambda c: c / 2) == Vec3(0.5, 2, 4)
+    assert pos.map_pairwise(min, Vec3(3, 3, 3)) == BlockPos(1, 3, 3)
+    assert pos.map_pairwise(max, Vec3(0.5, 5.5, 0)) == Vec3(1, 5.5, 8)
+    assert close(pos.distance(Vec3(1, 4, 9)), 1) and close(Vec3(1, 4, 9).distance(pos), 1)
+    assert close(BlockPos(3, 4, 0).length(), 5)
+    assert pos.in_box(BlockPos(0, 0, 10), Vec3(1, 4, 0)) and not pos.in_box(Vec3(), Vec3(1, 1, 1))
+    # methods of Vec3 taking another vector accept block positions
+    assert Vec3(1, 1, 1).map_pairwise(max, pos) == Vec3(1, 4, 8)
+    assert Vec3(1, 1, 1).dot(pos) == 13 and Vec3(2, 5, 9).in_box(pos, BlockPos(3, 5, 9))
+
+
+def test_blockpos_pickle_and_copy() -> None:
+    import copy
+    import pickle
+
+    pos = BlockPos(-123456, -22, 7)
+    loaded = pickle.loads(pickle.dumps(pos))
+    assert loaded == pos and type(loaded) is BlockPos
+    assert copy.copy(pos) is pos and copy.deepcopy(pos) is pos
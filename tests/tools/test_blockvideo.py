@@ -0,0 +1,84 @@
+import pytest
+
+from mcpq import Vec3
+from mcpq.tools import PlaybackStats, VideoWall
+
+np = pytest.importorskip("numpy")
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+PALETTE = {"black_wool": "000000", "white_wool": "FFFFFF", "red_wool": "FF0000"}
+
+
+def frame(*white: tuple[int, int], size: int = 4):
+    image = np.zeros((size, size, 3), dtype=np.uint8)
+    for row, col in white:
+        image[row, col] = 255
+    return image
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_show_sends_only_differences(fake, mc):
+    wall = VideoWall(mc, Vec3(0, 0, 0), palette=PALETTE)
+    assert wall.show(frame((0, 0))) == 16
+    assert fake.calls["setBlocks"] == 2  # grouped by block type
+    assert fake.get_block((0, 3, 0)) == "white_wool"  # top row is highest
+    fake.calls.clear()
+    assert wall.show(frame((0, 0))) == 0
+    assert fake.calls["setBlocks"] == 0
+    assert wall.show(frame((0, 1), (3, 3))) == 3
+    assert fake.calls["setBlocks"] == 2
+    assert fake.get_block((0, 3, 0)) == "black_wool"
+    assert fake.get_block((1, 3, 0)) == fake.get_block((3, 0, 0)) == "white_wool"
+    fake.set_block("stone", (2, 2, 0))
+    wall.reset()
+    assert wall.show(frame((0, 1), (3, 3))) == 16
+    assert fake.get_block((2, 2, 0)) == "black_wool"
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_show_with_size_and_transparency(fake, mc):
+    wall = VideoWall(mc, Vec3(0, 10, 0), size=(8, 2), palette=PALETTE, vertical=False)
+    image = np.zeros((1, 2, 4), dtype=np.uint8)
+    image[0, 0] = (255, 0, 0, 255)  # left half red, right half transparent
+    assert wall.show(image) == 8
+    assert fake.get_block((3, 10, 1)) == "red_wool"
+    assert fake.get_block((4, 10, 1)) == "air"
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_budget_defers_remaining_blocks(fake, mc):
+    fake.method_latency["setBlocks"] = 0.05
+    wall = VideoWall(mc, Vec3(0, 0, 0), palette=PALETTE)
+    image = frame((0, 0))
+    image[1:] = (255, 0, 0)
+    assert wall.show(image, budget=0.0) == 12  # largest group first, then out of time
+    assert wall.show(image, budget=0.0) == 3
+    assert wall.show(image, budget=0.0) == 1
+    assert wall.show(image) == 0
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_play(fake, mc):
+    wall = VideoWall(mc, Vec3(0, 0, 0), palette=PALETTE)
+    frames = [frame((i % 4, i // 4)) for i in range(16)]
+    stats = wall.play(frames, fps=200)
+    assert isinstance(stats, PlaybackStats)
+    assert stats.frames + stats.dropped == 16
+    assert stats.fps > 0 and stats.blocks_per_frame > 0
+    assert fake.get_block((3, 0, 0)) == "white_wool"  # last frame is always shown
+    with pytest.raises(ValueError):
+        wall.play(frames, fps=0)
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_play_drops_frames_when_server_is_slow(fake, mc):
+    fake.method_latency["setBlocks"] = 0.03
+    wall = VideoWall(mc, Vec3(0, 0, 0), palette=PALETTE)
+    frames = [frame((i % 4, i // 4)) for i in range(16)]
+    stats = wall.play(frames, fps=100)
+    assert stats.dropped > 0 and stats.frames < 16
+    assert stats.seconds < 16 * 0.06  # did not wait for every frame
+    assert fake.get_block((3, 0, 0)) == "white_wool"
+    assert fake.get_block((0, 0, 0)) == "black_wool"
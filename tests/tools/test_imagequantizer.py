@@ -0,0 +1,75 @@
+import pytest
+
+from mcpq import Vec3
+from mcpq.tools import PALETTES, BlockPalette, image_to_blocks, place_image
+
+np = pytest.importorskip("numpy")
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
+
+BLACK_WHITE = {"black_wool": "000000", "white_wool": "FFFFFF"}
+
+
+@pytest.mark.parametrize("name", list(PALETTES))
+def test_palette_matches_own_colors(name):
+    palette = BlockPalette(name)
+    assert all(palette.match(color) == block for block, color in PALETTES[name].items())
+    assert palette.lut.shape == (64, 64, 64)
+
+
+def test_palette_is_perceptual():
+    palette = BlockPalette({"dark": (0, 0, 0), "green": (0, 255, 0), "white": (255, 255, 255)})
+    # both are closer to black in RGB, but look closer to green and white respectively
+    assert palette.match((0, 115, 0)) == "green"
+    assert palette.match((125, 125, 125)) == "white"
+    assert palette.match("F0F0F0") == "white"
+    with pytest.raises(ValueError):
+        BlockPalette("not_a_palette")
+    with pytest.raises(ValueError):
+        BlockPalette({})
+
+
+def test_quantize_transparency_and_dither():
+    palette = BlockPalette(BLACK_WHITE)
+    gray = np.full((16, 16, 4), 128, dtype=np.uint8)
+    gray[..., 3] = 255
+    gray[0, 0, 3] = 0
+    plain = palette.quantize(gray)
+    assert plain[0, 0] == -1 and len(set(plain.ravel().tolist())) == 2  # transparent and one color
+    dithered = palette.quantize(gray, dither=True)
+    assert dithered[0, 0] == -1
+    assert 0.4 < (dithered[dithered >= 0] == 1).mean() < 0.6  # half black, half white
+
+
+def test_image_to_blocks():
+    image = [[[255, 255, 255], [0, 0, 0]], [[0, 0, 0], [255, 255, 255]]]
+    assert image_to_blocks(image, BLACK_WHITE) == [
+        ["white_wool", "black_wool"],
+        ["black_wool", "white_wool"],
+    ]
+    scaled = image_to_blocks(image, "wool", newsize=(4, 2))
+    assert scaled == [
+        ["white_wool"] * 2 + ["black_wool"] * 2,
+        ["black_wool"] * 2 + ["white_wool"] * 2,
+    ]
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_place_image(fake, mc):
+    image = np.zeros((5, 3, 4), dtype=np.uint8)
+    image[..., 3] = 255
+    image[0] = (255, 255, 255, 255)  # top row white
+    image[4, 2, 3] = 0  # bottom right transparent
+    assert place_image(mc, image, Vec3(10, 0, 0), BLACK_WHITE, tile_rows=2) == 14
+    assert fake.block_count() == 14
+    assert [fake.get_block((x, 4, 0)) for x in range(10, 13)] == ["white_wool"] * 3
+    assert fake.get_block((10, 0, 0)) == "black_wool"
+    assert fake.get_block((12, 0, 0)) == "air"
+    assert fake.calls["setBlocks"] == 4  # grouped by block type in each band of two rows
+
+    fake.calls.clear()
+    assert place_image(mc.nether, image, Vec3(0, 70, 0), BLACK_WHITE, vertical=False) == 14
+    assert fake.get_block((0, 70, 0), "world_nether") == "white_wool"
+    assert fake.get_block((1, 70, 3), "world_nether") == "black_wool"
+    assert fake.calls["setBlocks"] == 2
@@ -3,8 +3,13 @@ from unittest.mock import MagicMock, PropertyMock
 import pytest
 from pytest_mock import MockerFixture
 
-from mcpq import Minecraft, Vec3, World
+from mcpq import BlockPos, Minecraft, Vec3, World
+from mcpq.testing import FakeServer
 from mcpq.tools import Turtle
+from mcpq.tools.mcturtle import _cuboids
+
+# Note: set timeout for these tests, in case of deadlock we want to fail the test
+TIMEOUT = 10
 
 # see https://docs.python.org/3/library/unittest.mock.html#unittest.mock.PropertyMock
 
@@ -81,3 +86,66 @@ def test_init_create_new_instance_of_mc_get_pos_and_world_if_not_provided(
     assert len(mc.mock_calls) == 2  # one mc.getPlayer() and one mc.setBlock call
     assert mc.getPlayer.called
     assert mc.setBlock.called or mc.setBlockIn.called
+
+
+def blocks(fake) -> set[tuple[int, int, int, tuple[str, str]]]:
+    columns = fake._world(None).columns
+    return {(x, y, z, block) for (x, z), column in columns.items() for y, block in column.items()}
+
+
+def draw(turtle: Turtle) -> None:
+    turtle.speed(0).pensize(3)
+    for _ in range(8):
+        turtle.fd(12).rt(135)
+    turtle.penup().fd(4).pendown().up(90).fd(6).hidehead().fd(2)
+
+
+def test_cuboids():
+    box = {(x, y, z) for x in range(3) for y in range(2) for z in range(4)}
+    assert list(_cuboids(box)) == [((0, 0, 0), (2, 1, 3))]
+    assert list(_cuboids(box | {(5, 5, 5)})) == [((0, 0, 0), (2, 1, 3)), ((5, 5, 5), (5, 5, 5))]
+    shape = box | {(3, 0, 0), (3, 0, 1)}
+    found = list(_cuboids(shape))
+    covered = [
+        (x, y, z)
+        for low, high in found
+        for x in range(low[0], high[0] + 1)
+        for y in range(low[1], high[1] + 1)
+        for z in range(low[2], high[2] + 1)
+    ]
+    assert sorted(covered) == sorted(shape)  # no overlaps and nothing missing
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_compile_mode_draws_the_same_with_few_requests(fake, mc):
+    draw(Turtle(mc, Vec3(0, 0, 0)))
+    expected, requests = blocks(fake), sum(fake.calls.values())
+    with FakeServer() as other:
+        mc2 = Minecraft("localhost", other.port)
+        t = Turtle(mc2, BlockPos(0, 0, 0)).start_compile_mode()
+        draw(t)
+        assert other.block_count() == 1  # only the initial head
+        t.stop_compile_mode()
+        assert blocks(other) == expected
+        assert other.calls["setBlocks"] + other.calls["setBlockCube"] < 20 < requests
+        assert other.calls["setBlockCube"] > 0
+        other.calls.clear()
+        t.fd(2)  # back to drawing every step
+        assert other.calls["setBlocks"] == 2  # one per step, the head is hidden
+        mc2._cleanup()
+
+
+@pytest.mark.timeout(TIMEOUT)
+def test_animated_mode_bounds_frames(fake, mc):
+    draw(Turtle(mc, Vec3(0, 0, 0)))
+    expected = blocks(fake)
+    with FakeServer() as other:
+        mc2 = Minecraft("localhost", other.port)
+        t = Turtle(mc2, Vec3(0, 0, 0)).start_animated_mode(fps=1000, max_blocks=50)
+        draw(t)
+        t.stop_animated_mode()
+        assert blocks(other) == expected
+        assert 0 < other.calls["setBlocks"] < 80  # drawing every step takes hundreds
+        with pytest.raises(ValueError):
+            t.start_animated_mode(fps=0)
+        mc2._cleanup()